@@ -0,0 +1,741 @@
+#!/usr/bin/env python3
+"""
+NetBox Async API Client for NetBox MCP Server
+
+Asyncio-native counterpart of the dynamic NetBoxClient. Exposes the same
+``client.<app>.<endpoint>.filter/get/all/count/create/update/delete`` surface
+as AppWrapper/EndpointWrapper, but every call is a coroutine running over a
+single pooled, keep-alive HTTP/2 connection (httpx). Independent reads can
+therefore be fired concurrently instead of back to back.
+
+**Architecture Components:**
+- AsyncNetBoxClient: Dynamic entrypoint owning the pooled HTTP transport
+- AsyncAppWrapper: Navigator between NetBox apps (dcim, ipam, tenancy)
+- AsyncEndpointWrapper: Executor sharing the CacheManager and safety rules
+  of the synchronous client
+
+**Usage Examples:**
+    async with AsyncNetBoxClient(config) as client:
+        device, interfaces, cables = await asyncio.gather(
+            client.dcim.devices.get(name="rtr-01"),
+            client.dcim.interfaces.filter(device="rtr-01"),
+            client.dcim.cables.filter(device="rtr-01"),
+        )
+
+Results are serialized exactly like EndpointWrapper results and are stored in
+the same cache keys, so a client built with ``cache=sync_client.cache`` shares
+its warm cache with the synchronous tools.
+
+Synchronous tools fan out through gather_reads(), which runs a set of reads on
+a client created for, and closed with, its own event loop:
+
+    interfaces, cables = gather_reads(
+        client,
+        lambda c: c.dcim.interfaces.filter(device_id=1),
+        lambda c: c.dcim.cables.filter(device_id=1),
+    )
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+import pynetbox
+
+from .cache_frozen import freeze
+from .client import PROJECTION_PARAMS, CacheManager, ConnectionStatus, EndpointWrapper, NetBoxClient
+from .config import NetBoxConfig
+from .paged_fetch import plan_pages
+from .exceptions import (
+    NetBoxError,
+    NetBoxConnectionError,
+    NetBoxAuthError,
+    NetBoxValidationError,
+    NetBoxNotFoundError,
+    NetBoxPermissionError,
+    NetBoxConfirmationError
+)
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    httpx = None
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 support in httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# NetBox API applications reachable through the async client
+NETBOX_APPS = (
+    "circuits", "core", "dcim", "extras", "ipam", "tenancy",
+    "users", "virtualization", "vpn", "wireless"
+)
+
+
+class AsyncEndpointWrapper:
+    """
+    Async executor for a single NetBox endpoint.
+
+    Mirrors EndpointWrapper: cache lookup → API call → cache storage for reads
+    (with negative caching, single-flight and stale-while-revalidate),
+    confirm=True / dry-run enforcement and type-based cache invalidation for
+    writes. Listings and windows are fetched like EndpointWrapper._fetch_listing():
+    the first page, then all remaining pages concurrently, reassembled in order.
+    """
+
+    def __init__(self, endpoint, client: 'AsyncNetBoxClient', app_name: str):
+        """
+        Initialize AsyncEndpointWrapper.
+
+        Args:
+            endpoint: pynetbox Endpoint used for URL and record model lookup only
+            client: AsyncNetBoxClient owning the HTTP transport and cache
+            app_name: NetBox app name (e.g., 'dcim', 'ipam')
+        """
+        self._endpoint = endpoint
+        self._client = client
+        self._app_name = app_name
+        self._obj_type = f"{app_name}.{endpoint.name}"
+        self._url = f"{endpoint.url}/"
+
+        self.cache = client.cache
+
+    def _serialize(self, data: Dict[str, Any]) -> dict:
+        """Serialize a raw API object into the same shape as EndpointWrapper results."""
+        record = self._endpoint.return_obj(data, self._endpoint.api, self._endpoint)
+        return freeze(record.serialize())
+
+    @staticmethod
+    def _build_params(args: tuple, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Translate pynetbox-style filter arguments into query parameters."""
+        params = dict(kwargs)
+        if args:
+            params["q"] = args[0]
+        return {k: ("null" if v is None else v) for k, v in params.items()}
+
+    async def _fetch_page(
+        self, params: Dict[str, Any], limit: int, offset: int
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        Fetch one page of a listing.
+
+        Returns:
+            The page's raw objects and the total count NetBox reported
+        """
+        page = await self._client._request("GET", self._url, params={**params, "limit": limit, "offset": offset})
+        return page.get("results", []), page.get("count")
+
+    async def _fetch_listing(
+        self,
+        params: Dict[str, Any],
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        page_size: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch a listing, or a window of one, with concurrent page requests.
+
+        Same plan as paged_fetch.fetch_listing(): the first page returns the
+        total count and the page size NetBox applies, the remaining
+        ``(limit, offset)`` pages are requested concurrently (bounded by
+        ``max_concurrency``) and reassembled in API order. Listings without a
+        count are walked page by page.
+
+        Args:
+            params: Filter query parameters
+            limit: Maximum number of objects to return (None or 0 for all)
+            offset: Number of objects to skip
+            page_size: Objects per page request (defaults to fetch.page_size)
+
+        Returns:
+            Raw objects in API order
+        """
+        offset = offset or 0
+        page_size = page_size or self._client.config.fetch.page_size
+        first_size = min(page_size, limit) if limit else page_size
+        first, total = await self._fetch_page(params, first_size, offset)
+        results = list(first)
+        if not first:
+            return results
+
+        if total is None:
+            page, request_size = first, first_size
+            while len(page) == request_size and not (limit and len(results) >= limit):
+                request_size = min(first_size, limit - len(results)) if limit else first_size
+                page, _ = await self._fetch_page(params, request_size, offset + len(results))
+                results.extend(page)
+            return results
+
+        stop = min(total, offset + limit) if limit else total
+        if len(first) < first_size:
+            # NetBox capped the page size; plan with the size it applies
+            page_size = len(first)
+
+        pages = await asyncio.gather(*[
+            self._fetch_page(params, page_limit, page_offset)
+            for page_limit, page_offset in plan_pages(offset + len(first), stop, page_size)
+        ])
+        for page, _ in pages:
+            results.extend(page)
+        return results
+
+    async def filter(
+        self,
+        *args,
+        no_cache=False,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        page_size: Optional[int] = None,
+        fields: Optional[Union[str, List[str]]] = None,
+        brief: bool = False,
+        exclude: Optional[Union[str, List[str]]] = None,
+        **kwargs
+    ) -> list:
+        """
+        Async filter() with caching and optional cache bypass.
+
+        Same semantics and cache keys as EndpointWrapper.filter(): ``limit`` and
+        ``offset`` select a window, and projections are cached under their own keys.
+
+        Args:
+            *args: Optional free-text search term (sent as ``q``)
+            no_cache: If True, bypass cache and force fresh API call
+            limit: Maximum number of objects to return (None or 0 for all)
+            offset: Number of objects to skip (server-side)
+            page_size: Records per API request (defaults to fetch.page_size)
+            fields: Only return these fields (NetBox 4.0+)
+            brief: Return NetBox's brief representation
+            exclude: Fields to leave out, e.g. "config_context"
+            **kwargs: NetBox filter parameters
+
+        Returns:
+            List of serialized objects from cache or API
+        """
+        kwargs.update(EndpointWrapper._projection(fields, brief, exclude))
+
+        # Same keys as EndpointWrapper.filter(): search term, projection and window are part of the key
+        key_kwargs = {"q": args[0], **kwargs} if args else dict(kwargs)
+        cache_key = self.cache.generate_cache_key(self._obj_type, **key_kwargs)
+        paginated = bool(limit or offset)
+        window_key = self.cache.generate_cache_key(
+            self._obj_type, **key_kwargs, limit=limit or None, offset=offset or None
+        )
+
+        async def fetch() -> list:
+            raw_results = await self._fetch_listing(self._build_params(args, kwargs), limit, offset, page_size)
+            return [self._serialize(item) for item in raw_results]
+
+        if not no_cache:
+            if self.cache.is_negative(window_key, self._obj_type):
+                return []
+            cached_result = self.cache.get(window_key, self._obj_type, refresh=self._client._refresher(fetch))
+            if cached_result is not None:
+                return cached_result
+
+            # A cached complete result set, or that of a broader filter, can answer locally
+            full_result = self.cache.get(cache_key, self._obj_type) if paginated else None
+            if full_result is None and not args and PROJECTION_PARAMS.isdisjoint(kwargs):
+                full_result = self.cache.subsume(self._obj_type, kwargs)
+            if full_result is not None:
+                start = offset or 0
+                return full_result[start:start + limit] if limit else full_result[start:]
+
+        async def fetch_and_store() -> list:
+            serialized_result = await fetch()
+            if not serialized_result:
+                # Misses (typically misspelled names) are remembered with a short TTL
+                self.cache.set_negative(window_key, self._obj_type, key_kwargs)
+                return serialized_result
+            self.cache.set(window_key, serialized_result, self._obj_type)
+            logger.debug("Cached %s objects for %s (async)", len(serialized_result), self._obj_type)
+            return serialized_result
+
+        if no_cache:
+            # A bypass must not share a read that started before it was asked for
+            return await fetch_and_store()
+        # Concurrent identical misses share one upstream request
+        return await self._client._single_flight(window_key, fetch_and_store)
+
+    async def get(self, *args, **kwargs) -> Optional[dict]:
+        """
+        Async get() for single object retrieval by ID or unique filter.
+
+        Args:
+            *args: Optional object ID
+            **kwargs: Filter parameters that must match exactly one object
+
+        Returns:
+            Serialized object dictionary or None if not found
+
+        Raises:
+            ValueError: If the filter matches more than one object
+        """
+        key_params = {"id": args[0], **kwargs} if args else kwargs
+        cache_key = self.cache.generate_cache_key(f"{self._obj_type}:get", **key_params)
+
+        async def fetch() -> Optional[dict]:
+            if args:
+                try:
+                    raw_result = await self._client._request("GET", f"{self._url}{args[0]}/")
+                except NetBoxNotFoundError:
+                    return None
+            else:
+                raw_results = await self._fetch_listing(self._build_params((), kwargs))
+                if not raw_results:
+                    return None
+                if len(raw_results) > 1:
+                    raise ValueError(
+                        "get() returned more than one result. "
+                        "Check that the kwarg(s) passed are valid for this "
+                        "endpoint or use filter() or all() instead."
+                    )
+                raw_result = raw_results[0]
+            return self._serialize(raw_result)
+
+        if self.cache.is_negative(cache_key, self._obj_type):
+            return None
+        cached_result = self.cache.get(cache_key, self._obj_type, refresh=self._client._refresher(fetch))
+        if cached_result is not None:
+            return cached_result
+
+        async def fetch_and_store() -> Optional[dict]:
+            serialized_result = await fetch()
+            if serialized_result is None:
+                self.cache.set_negative(cache_key, self._obj_type, key_params)
+                return None
+            self.cache.set(cache_key, serialized_result, self._obj_type)
+            return serialized_result
+
+        return await self._client._single_flight(cache_key, fetch_and_store)
+
+    async def all(self, *args, **kwargs) -> list:
+        """
+        Async all() with caching for complete object listing.
+
+        Returns:
+            List of serialized objects from cache or API
+        """
+        cache_key = self.cache.generate_cache_key(f"{self._obj_type}:all", **kwargs)
+
+        async def fetch() -> list:
+            # Like pynetbox all(limit): a positional limit is the page size
+            raw_results = await self._fetch_listing(dict(kwargs), page_size=args[0] if args else None)
+            return [self._serialize(item) for item in raw_results]
+
+        cached_result = self.cache.get(cache_key, self._obj_type, refresh=self._client._refresher(fetch))
+        if cached_result is not None:
+            return cached_result
+
+        async def fetch_and_store() -> list:
+            serialized_result = await fetch()
+            self.cache.set(cache_key, serialized_result, self._obj_type)
+            return serialized_result
+
+        return await self._client._single_flight(cache_key, fetch_and_store)
+
+    async def count(self, *args, **kwargs) -> int:
+        """
+        Async count() with a single ``limit=1`` request, cached like EndpointWrapper.count().
+
+        Returns:
+            Number of matching objects
+        """
+        key_kwargs = {"q": args[0], **kwargs} if args else kwargs
+        cache_key = self.cache.generate_cache_key(f"{self._obj_type}:count", **key_kwargs)
+
+        async def fetch() -> int:
+            params = {**self._build_params(args, kwargs), "limit": 1, "brief": 1}
+            page = await self._client._request("GET", self._url, params=params)
+            return page["count"]
+
+        cached_result = self.cache.get(cache_key, self._obj_type, refresh=self._client._refresher(fetch))
+        if cached_result is not None:
+            return cached_result
+
+        async def fetch_and_store() -> int:
+            result = await fetch()
+            self.cache.set(cache_key, result, self._obj_type)
+            return result
+
+        return await self._client._single_flight(cache_key, fetch_and_store)
+
+    def _check_write(self, operation: str, confirm: bool) -> bool:
+        """
+        Enforce confirm=True and report whether the write should be simulated.
+
+        Returns:
+            True if the global dry-run mode is active
+        """
+        if not confirm:
+            raise NetBoxConfirmationError(
+                f"{operation} operation on {self._obj_type} requires confirm=True"
+            )
+        return self._client.config.safety.dry_run_mode
+
+    async def create(self, confirm: bool = False, **payload) -> dict:
+        """
+        Async create() with confirm=True enforcement, dry-run and write-through caching.
+
+        Returns:
+            Serialized created object dictionary
+        """
+        if self._check_write("create", confirm):
+            logger.info(f"[DRY-RUN] Would CREATE {self._obj_type} with payload: {payload}")
+            return {"id": "dry-run-generated-id", **payload}
+
+        try:
+            logger.info(f"Creating {self._obj_type} with data: {payload}")
+            result = await self._client._request("POST", self._url, json=payload)
+        except NetBoxError as e:
+            raise NetBoxError(f"Failed to create {self._obj_type}: {e}", e.details)
+
+        serialized_result = self._serialize(result)
+        self.cache.write_through(self._obj_type, serialized_result)
+        logger.info(f"✅ Successfully created {self._obj_type} with ID: {result.get('id')}")
+        return serialized_result
+
+    async def update(self, obj_id: int, confirm: bool = False, **payload) -> dict:
+        """
+        Async update() sent as a single PATCH of the given fields.
+
+        Returns:
+            Serialized updated object dictionary
+        """
+        if self._check_write("update", confirm):
+            logger.info(f"[DRY-RUN] Would UPDATE {self._obj_type} ID {obj_id} with payload: {payload}")
+            return {"id": obj_id, **payload}
+
+        previous = self.cache.get_entity(self._obj_type, obj_id)
+        try:
+            logger.info(f"Updating {self._obj_type} ID {obj_id} with data: {payload}")
+            result = await self._client._request("PATCH", f"{self._url}{obj_id}/", json=payload)
+        except NetBoxError as e:
+            raise NetBoxError(f"Failed to update {self._obj_type} ID {obj_id}: {e}", e.details)
+
+        serialized_result = self._serialize(result)
+        if previous is None:
+            # Old version unknown: queries filtering on a written field may have lost the object
+            self.cache.invalidate_queries(self._obj_type, list(payload))
+        self.cache.write_through(self._obj_type, serialized_result, previous)
+        logger.info(f"✅ Successfully updated {self._obj_type} ID {obj_id}")
+        return serialized_result
+
+    async def delete(self, obj_id: int, confirm: bool = False) -> bool:
+        """
+        Async delete() sent as a single DELETE request.
+
+        Returns:
+            True if deletion successful
+        """
+        if self._check_write("delete", confirm):
+            logger.info(f"[DRY-RUN] Would DELETE {self._obj_type} ID {obj_id}")
+            return True
+
+        previous = self.cache.get_entity(self._obj_type, obj_id)
+        try:
+            logger.info(f"Deleting {self._obj_type} ID {obj_id}")
+            await self._client._request("DELETE", f"{self._url}{obj_id}/")
+        except NetBoxError as e:
+            raise NetBoxError(f"Failed to delete {self._obj_type} ID {obj_id}: {e}", e.details)
+
+        self.cache.invalidate_for_object(self._obj_type, obj_id)
+        if previous is None:
+            self.cache.invalidate_queries(self._obj_type)
+        else:
+            self.cache.invalidate_matching(self._obj_type, [previous])
+        logger.info(f"✅ Successfully deleted {self._obj_type} ID {obj_id}")
+        return True
+
+
+class AsyncAppWrapper:
+    """
+    Async navigator from a NetBox app to its wrapped endpoints.
+    """
+
+    def __init__(self, app, client: 'AsyncNetBoxClient'):
+        """
+        Initialize AsyncAppWrapper.
+
+        Args:
+            app: pynetbox.core.app.App instance (used for endpoint metadata)
+            client: AsyncNetBoxClient instance
+        """
+        self._app = app
+        self._client = client
+        self._app_name = app.name
+
+    def __getattr__(self, name: str) -> AsyncEndpointWrapper:
+        """
+        Navigate from app to endpoint.
+
+        Raises:
+            AttributeError: For private attribute lookups
+        """
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return AsyncEndpointWrapper(getattr(self._app, name), self._client, app_name=self._app_name)
+
+
+class AsyncNetBoxClient:
+    """
+    Asyncio-native NetBox API client over a pooled keep-alive HTTP/2 connection.
+
+    Provides:
+    - The dynamic ``client.<app>.<endpoint>`` surface of NetBoxClient as coroutines
+    - One shared httpx connection pool (HTTP/2 multiplexing when ``h2`` is installed)
+    - A concurrency limit so large fan-outs cannot overload NetBox
+    - Shared CacheManager and identical safety controls for write operations
+
+    A client belongs to the event loop it is used on: its connection pool and
+    concurrency semaphore cannot be shared between loops. Long-lived callers
+    get one per loop from dependencies.get_async_netbox_client().
+    """
+
+    def __init__(
+        self,
+        config: NetBoxConfig,
+        cache: Optional[CacheManager] = None,
+        max_connections: int = 20,
+        max_concurrency: int = 10,
+        transport: Optional[Any] = None,
+        revalidate: bool = True
+    ):
+        """
+        Initialize the async client.
+
+        Args:
+            config: NetBox configuration object
+            cache: Optional CacheManager to share with a synchronous NetBoxClient
+            max_connections: Size of the HTTP connection pool
+            max_concurrency: Maximum number of in-flight requests
+            transport: Optional httpx transport (used by tests)
+            revalidate: Refresh stale hits in the background on this client's
+                event loop; clients closed right after use re-read them instead
+
+        Raises:
+            NetBoxConnectionError: If httpx is not installed
+        """
+        if not HTTPX_AVAILABLE:
+            raise NetBoxConnectionError(
+                "Async client requires httpx. Install with: pip install 'netbox-mcp[async]'"
+            )
+
+        self.config = config
+        self.cache = cache if cache is not None else CacheManager(config)
+        self.max_concurrency = max_concurrency
+        self.revalidate = revalidate
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._connection_status: Optional[ConnectionStatus] = None
+
+        # Single-flight registry: cache key → upstream read in progress on this event loop
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        # pynetbox API object provides endpoint URLs and record models only; it never issues requests
+        self._api = pynetbox.api(url=config.url, token=config.token)
+
+        headers = {
+            "Authorization": f"Token {config.token}",
+            "Accept": "application/json",
+            **config.custom_headers
+        }
+        self._http = httpx.AsyncClient(
+            headers=headers,
+            verify=config.verify_ssl,
+            timeout=config.timeout,
+            http2=HTTP2_AVAILABLE and transport is None,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            ),
+            transport=transport
+        )
+
+        logger.info(
+            f"Async NetBox client initialized for {config.url} "
+            f"(http2={HTTP2_AVAILABLE and transport is None}, max_concurrency={max_concurrency})"
+        )
+
+    async def __aenter__(self) -> 'AsyncNetBoxClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections."""
+        await self._http.aclose()
+
+    async def _single_flight(self, cache_key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await ``loader`` once for all concurrent callers of the same key.
+
+        Async counterpart of CacheManager.single_flight(): callers arriving
+        while a read is in progress await it and share its result or error.
+
+        Args:
+            cache_key: Cache key identifying the read
+            loader: Performs the read (and caches its result)
+
+        Returns:
+            The loader's result
+        """
+        flight = self._inflight.get(cache_key)
+        if flight is not None:
+            with self.cache.lock:
+                self.cache.stats["coalesced_calls"] += 1
+            logger.debug("Coalesced with in-flight request: %s", cache_key)
+            return await asyncio.shield(flight)
+
+        flight = self._inflight[cache_key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await loader()
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except BaseException as e:
+            flight.set_exception(e)
+            flight.exception()  # Retrieved: the leader re-raises it
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(cache_key, None)
+
+    def _refresher(self, fetch: Callable[[], Awaitable[Any]]) -> Optional[Callable[[], Any]]:
+        """
+        Wrap an async fetch for CacheManager's background refresh threads.
+
+        Stale-while-revalidate and refresh-ahead run refreshes on a thread
+        pool; the returned callable runs ``fetch`` on this event loop and
+        waits for its result. Without ``revalidate`` there is none, so stale
+        entries are treated as misses.
+        """
+        if not self.revalidate:
+            return None
+        loop = asyncio.get_running_loop()
+
+        def refresh() -> Any:
+            return asyncio.run_coroutine_threadsafe(fetch(), loop).result(timeout=self.config.timeout)
+
+        return refresh
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None
+    ) -> Any:
+        """
+        Issue a single HTTP request and translate failures into NetBox exceptions.
+
+        Returns:
+            Decoded JSON body (True for successful DELETE requests)
+        """
+        async with self._semaphore:
+            try:
+                response = await self._http.request(method, url, params=params, json=json)
+            except httpx.TimeoutException as e:
+                raise NetBoxConnectionError(f"Request timed out after {self.config.timeout}s: {e}", {"url": url})
+            except httpx.TransportError as e:
+                raise NetBoxConnectionError(f"Connection failed: {e}", {"url": url})
+
+        status = response.status_code
+        if status < 400:
+            if method == "DELETE" or status == 204:
+                return True
+            return response.json()
+
+        details = {"status_code": status, "url": url, "response": response.text[:500]}
+        if status == 400:
+            raise NetBoxValidationError(f"Validation error: {response.text}", details)
+        if status == 401:
+            raise NetBoxAuthError("Authentication failed - invalid API token", details)
+        if status == 403:
+            raise NetBoxPermissionError("Permission denied - insufficient API token permissions", details)
+        if status == 404:
+            raise NetBoxNotFoundError(f"Not found: {url}", details)
+        raise NetBoxError(f"HTTP error {status}: {response.text[:200]}", details)
+
+    async def health_check(self) -> ConnectionStatus:
+        """
+        Perform health check against the NetBox status endpoint.
+
+        Returns:
+            ConnectionStatus: Current connection status
+        """
+        start_time = time.time()
+        try:
+            status_data = await self._request("GET", f"{self._api.base_url}/status/")
+        except NetBoxError as e:
+            self._connection_status = ConnectionStatus(connected=False, error=str(e))
+            raise
+
+        self._connection_status = ConnectionStatus(
+            connected=True,
+            version=status_data.get('netbox-version'),
+            python_version=status_data.get('python-version'),
+            django_version=status_data.get('django-version'),
+            plugins=status_data.get('plugins', {}),
+            response_time_ms=(time.time() - start_time) * 1000,
+            cache_stats=self.cache.get_stats()
+        )
+        return self._connection_status
+
+    def __getattr__(self, name: str) -> AsyncAppWrapper:
+        """
+        Dynamic proxy to NetBox API applications.
+
+        Raises:
+            AttributeError: If the application doesn't exist in the NetBox API
+        """
+        if name in NETBOX_APPS:
+            return AsyncAppWrapper(getattr(self._api, name), self)
+        raise AttributeError(
+            f"NetBox API has no application named '{name}'. "
+            f"Available applications include: {', '.join(NETBOX_APPS)}"
+        )
+
+
+def gather_reads(client: NetBoxClient, *reads: Callable[[Any], Any]) -> List[Any]:
+    """
+    Run independent reads concurrently from synchronous code such as tools.
+
+    Each read is a function of a client, e.g.
+    ``lambda c: c.dcim.interfaces.count(device_id=1)``, so the same read works
+    on AsyncNetBoxClient and NetBoxClient. The reads run on an async client
+    that shares ``client``'s configuration and cache, created for this call's
+    event loop and closed with it. Without httpx they run one after another
+    on ``client``.
+
+    Args:
+        client: Synchronous client whose configuration and cache the reads use
+        *reads: Functions of a client that perform one read each
+
+    Returns:
+        The results of the reads, in order
+    """
+    if not HTTPX_AVAILABLE:
+        return [read(client) for read in reads]
+
+    async def run() -> List[Any]:
+        async with AsyncNetBoxClient(client.config, cache=client.cache, revalidate=False) as async_client:
+            return list(await asyncio.gather(*(read(async_client) for read in reads)))
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(run())
+
+    # Called on an event loop's thread (FastMCP runs synchronous tools there): use a loop of our own
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="netbox-gather") as pool:
+        return pool.submit(asyncio.run, run()).result()
@@ -0,0 +1,475 @@
+#!/usr/bin/env python3
+"""
+Persistent cache backends for NetBox MCP Server
+
+The in-memory TTL caches in CacheManager are the first tier for every lookup.
+Backends in this module sit behind them as a second tier that outlives the
+process, so a restarted server (or a second process on the same host) starts
+with the manufacturers, device types and sites it already fetched.
+
+**Backends:**
+- DiskCacheStore: SQLite database in WAL mode, one row per cache key with its
+  own expiry time. Multiple processes can read it concurrently; processes
+  opened with ``read_only=True`` never write to it.
+- RedisCacheStore: Shared Redis tier for API replicas and RQ workers. Also
+  carries invalidation messages over pub/sub so every process drops its
+  in-memory copies when another process writes to NetBox.
+
+All backends expose the same interface (get_entry, set, delete_keys,
+delete_type_prefix, delete_matching, delete_for_objects, clear) so
+CacheManager can treat them as one interchangeable second tier.
+"""
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+try:
+    from redis import Redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCacheStore:
+    """
+    SQLite-backed persistent cache store.
+
+    Values are stored as JSON together with their object type, absolute
+    expiry time and the IDs of the NetBox objects they contain, so both
+    type-level and object-level invalidation work without loading values.
+
+    Args:
+        path: Directory holding the cache database
+        read_only: Open the database read-only (shared reader processes)
+        filename: Database file name inside ``path``
+    """
+
+    # A file on one host has no other processes to notify
+    broadcasts_invalidations = False
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS cache_entries (
+            cache_key   TEXT PRIMARY KEY,
+            object_type TEXT NOT NULL,
+            value       TEXT NOT NULL,
+            expires_at  REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_cache_entries_type ON cache_entries (object_type);
+        CREATE TABLE IF NOT EXISTS cache_objects (
+            cache_key   TEXT NOT NULL,
+            object_type TEXT NOT NULL,
+            object_id   INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_cache_objects_object ON cache_objects (object_type, object_id);
+        CREATE INDEX IF NOT EXISTS idx_cache_objects_key ON cache_objects (cache_key);
+    """
+
+    def __init__(self, path: str, read_only: bool = False, filename: str = "cache.sqlite3"):
+        self.read_only = read_only
+        self.db_path = os.path.join(path, filename)
+        self.lock = threading.Lock()
+
+        if read_only:
+            # Shared readers attach to a database another process maintains
+            self._conn = sqlite3.connect(
+                f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False, timeout=5.0
+            )
+        else:
+            os.makedirs(path, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=5.0)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(self.SCHEMA)
+            self.purge_expired()
+
+        logger.info(f"Disk cache opened: {self.db_path} (read_only={read_only})")
+
+    def get(self, cache_key: str) -> Optional[Any]:
+        """
+        Return the stored value for a key, or None if absent or expired.
+        """
+        entry = self.get_entry(cache_key)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, cache_key: str) -> Optional[Tuple[Any, float]]:
+        """
+        Return ``(value, remaining_ttl)`` for a key, or None if absent or expired.
+        """
+        with self.lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache_entries WHERE cache_key = ?", (cache_key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+        remaining = row[1] - time.time()
+        if remaining <= 0:
+            return None
+        return json.loads(row[0]), remaining
+
+    def set(self, cache_key: str, value: Any, object_type: str, ttl: float, object_ids: Iterable[int] = ()) -> None:
+        """
+        Store a value with its own expiry time.
+
+        Args:
+            cache_key: Cache key
+            value: JSON-serializable value
+            object_type: NetBox object type the key belongs to
+            ttl: Time to live in seconds
+            object_ids: IDs of the NetBox objects contained in the value
+        """
+        if self.read_only or ttl <= 0:
+            return
+
+        payload = json.dumps(value, separators=(",", ":"), default=str)
+        with self.lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (cache_key, object_type, value, expires_at) VALUES (?, ?, ?, ?)",
+                (cache_key, object_type, payload, time.time() + ttl)
+            )
+            self._conn.execute("DELETE FROM cache_objects WHERE cache_key = ?", (cache_key,))
+            self._conn.executemany(
+                "INSERT INTO cache_objects (cache_key, object_type, object_id) VALUES (?, ?, ?)",
+                [(cache_key, object_type, obj_id) for obj_id in object_ids]
+            )
+
+    def delete_keys(self, cache_keys: Iterable[str]) -> int:
+        """Delete specific keys. Returns the number of entries removed."""
+        if self.read_only:
+            return 0
+
+        keys = [(key,) for key in cache_keys]
+        with self.lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany("DELETE FROM cache_entries WHERE cache_key = ?", keys)
+            removed = self._conn.total_changes - before
+            self._conn.executemany("DELETE FROM cache_objects WHERE cache_key = ?", keys)
+        return removed
+
+    def delete_type_prefix(self, type_prefix: str) -> int:
+        """Delete every entry whose object type starts with ``type_prefix``."""
+        if self.read_only:
+            return 0
+
+        like = type_prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        with self.lock, self._conn:
+            removed = self._conn.execute(
+                "DELETE FROM cache_entries WHERE object_type LIKE ? ESCAPE '\\'", (like,)
+            ).rowcount
+            self._conn.execute("DELETE FROM cache_objects WHERE object_type LIKE ? ESCAPE '\\'", (like,))
+        return removed
+
+    def delete_matching(self, fragment: str, object_type: Optional[str] = None) -> int:
+        """Delete entries whose key contains ``fragment`` (optionally within one type)."""
+        if self.read_only:
+            return 0
+
+        like = "%" + fragment.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        query = "SELECT cache_key FROM cache_entries WHERE cache_key LIKE ? ESCAPE '\\'"
+        params: tuple = (like,)
+        if object_type is not None:
+            query += " AND object_type = ?"
+            params += (object_type,)
+
+        with self.lock:
+            keys = [row[0] for row in self._conn.execute(query, params)]
+        return self.delete_keys(keys)
+
+    def delete_for_object(self, object_type: str, object_id: int) -> int:
+        """Delete every entry that contains the given object."""
+        return self.delete_for_objects(object_type, [object_id])
+
+    def delete_for_objects(self, object_type: str, object_ids: Iterable[int]) -> int:
+        """Delete every entry that contains any of the given objects."""
+        if self.read_only:
+            return 0
+
+        keys = set()
+        with self.lock:
+            for object_id in object_ids:
+                keys.update(
+                    row[0] for row in self._conn.execute(
+                        "SELECT cache_key FROM cache_objects WHERE object_type = ? AND object_id = ?",
+                        (object_type, object_id)
+                    )
+                )
+        return self.delete_keys(keys)
+
+    def purge_expired(self) -> int:
+        """Remove expired entries. Returns the number of entries removed."""
+        if self.read_only:
+            return 0
+
+        with self.lock, self._conn:
+            removed = self._conn.execute(
+                "DELETE FROM cache_entries WHERE expires_at <= ?", (time.time(),)
+            ).rowcount
+            self._conn.execute(
+                "DELETE FROM cache_objects WHERE cache_key NOT IN (SELECT cache_key FROM cache_entries)"
+            )
+        return removed
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        if self.read_only:
+            return
+
+        with self.lock, self._conn:
+            self._conn.execute("DELETE FROM cache_entries")
+            self._conn.execute("DELETE FROM cache_objects")
+
+    def __len__(self) -> int:
+        with self.lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM cache_entries WHERE expires_at > ?", (time.time(),)
+            ).fetchone()[0]
+
+    def size_bytes(self) -> int:
+        """Size of the database file on disk."""
+        try:
+            return os.path.getsize(self.db_path)
+        except OSError:
+            return 0
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self.lock:
+            self._conn.close()
+
+
+class RedisCacheStore:
+    """
+    Redis-backed shared cache store.
+
+    Each cache key is stored as a JSON string with a native Redis TTL. Sets
+    per object type and per (object type, id) index the keys so invalidation
+    never scans the keyspace for type or object lookups, and a sorted set of
+    keys scored by expiry time counts the live entries.
+
+    Invalidation messages are published on ``<prefix>invalidations``; each
+    process subscribes with a handler that drops its in-memory copies and
+    ignores the messages it published itself.
+
+    Args:
+        redis_url: Redis connection URL (defaults to $REDIS_URL)
+        prefix: Namespace for all keys and the invalidation channel
+        read_only: Never write entries or publish invalidations
+        connection: Existing Redis client to use instead of ``redis_url``
+    """
+
+    broadcasts_invalidations = True
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        prefix: str = "netbox_mcp:cache:",
+        read_only: bool = False,
+        connection: Optional[Any] = None
+    ):
+        if connection is None:
+            if not REDIS_AVAILABLE:
+                raise ImportError("redis is required for the Redis cache backend. Install with: pip install redis")
+            redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+            connection = Redis.from_url(redis_url)
+
+        self.redis_conn = connection
+        self.prefix = prefix
+        self.read_only = read_only
+        self.channel = f"{prefix}invalidations"
+        self.entries_key = f"{prefix}entries"
+        self.instance_id = uuid.uuid4().hex
+
+        # Fail fast so CacheManager can fall back to memory only
+        self.redis_conn.ping()
+        logger.info(f"Redis cache attached: prefix={prefix} (read_only={read_only})")
+
+    def _entry_key(self, cache_key: str) -> str:
+        return f"{self.prefix}entry:{cache_key}"
+
+    def _type_key(self, object_type: str) -> str:
+        return f"{self.prefix}type:{object_type}"
+
+    def _object_key(self, object_type: str, object_id: int) -> str:
+        return f"{self.prefix}obj:{object_type}:{object_id}"
+
+    @staticmethod
+    def _decode(value: Any) -> str:
+        return value.decode() if isinstance(value, bytes) else value
+
+    def _members(self, index_key: str) -> list:
+        return [self._decode(member) for member in self.redis_conn.smembers(index_key)]
+
+    @staticmethod
+    def _escape_glob(value: str) -> str:
+        return re.sub(r"([*?\[\]\\])", r"\\\1", value)
+
+    def get(self, cache_key: str) -> Optional[Any]:
+        """
+        Return the stored value for a key, or None if absent or expired.
+        """
+        entry = self.get_entry(cache_key)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, cache_key: str) -> Optional[Tuple[Any, float]]:
+        """
+        Return ``(value, remaining_ttl)`` for a key, or None if absent or expired.
+        """
+        pipe = self.redis_conn.pipeline(transaction=False)
+        pipe.get(self._entry_key(cache_key))
+        pipe.pttl(self._entry_key(cache_key))
+        payload, pttl = pipe.execute()
+
+        if payload is None or pttl is None or pttl <= 0:
+            return None
+        return json.loads(payload), pttl / 1000.0
+
+    def set(self, cache_key: str, value: Any, object_type: str, ttl: float, object_ids: Iterable[int] = ()) -> None:
+        """
+        Store a value with its own expiry time.
+
+        Args:
+            cache_key: Cache key
+            value: JSON-serializable value
+            object_type: NetBox object type the key belongs to
+            ttl: Time to live in seconds
+            object_ids: IDs of the NetBox objects contained in the value
+        """
+        ttl_ms = int(ttl * 1000)
+        if self.read_only or ttl_ms <= 0:
+            return
+
+        payload = json.dumps(value, separators=(",", ":"), default=str)
+        pipe = self.redis_conn.pipeline(transaction=False)
+        pipe.set(self._entry_key(cache_key), payload, px=ttl_ms)
+        now_ms = time.time() * 1000
+        # The entry count set forgets keys Redis has expired meanwhile
+        pipe.zremrangebyscore(self.entries_key, "-inf", now_ms)
+        pipe.zadd(self.entries_key, {cache_key: now_ms + ttl_ms})
+        # Index sets share the per-type TTL, so the latest write always outlives older members
+        index_keys = [self._type_key(object_type)] + [self._object_key(object_type, i) for i in object_ids]
+        for index_key in index_keys:
+            pipe.sadd(index_key, cache_key)
+            pipe.pexpire(index_key, ttl_ms)
+        pipe.execute()
+
+    def delete_keys(self, cache_keys: Iterable[str]) -> int:
+        """Delete specific keys. Returns the number of entries removed."""
+        if self.read_only:
+            return 0
+
+        cache_keys = list(cache_keys)
+        if not cache_keys:
+            return 0
+        pipe = self.redis_conn.pipeline(transaction=False)
+        pipe.delete(*[self._entry_key(key) for key in cache_keys])
+        pipe.zrem(self.entries_key, *cache_keys)
+        return pipe.execute()[0]
+
+    def delete_type_prefix(self, type_prefix: str) -> int:
+        """Delete every entry whose object type starts with ``type_prefix``."""
+        if self.read_only:
+            return 0
+
+        removed = 0
+        type_glob = f"{self._type_key(self._escape_glob(type_prefix))}*"
+        for type_key in map(self._decode, list(self.redis_conn.scan_iter(match=type_glob))):
+            removed += self.delete_keys(self._members(type_key))
+            object_type = type_key[len(self._type_key("")):]
+            object_glob = f"{self._object_key(self._escape_glob(object_type), '')}*"
+            stale_indexes = [type_key] + list(self.redis_conn.scan_iter(match=object_glob))
+            self.redis_conn.delete(*stale_indexes)
+        return removed
+
+    def delete_matching(self, fragment: str, object_type: Optional[str] = None) -> int:
+        """Delete entries whose key contains ``fragment`` (optionally within one type)."""
+        if self.read_only:
+            return 0
+
+        if object_type is not None:
+            members = self._members(self._type_key(object_type))
+            return self.delete_keys([key for key in members if fragment in key])
+
+        entry_glob = f"{self._entry_key('')}*{self._escape_glob(fragment)}*"
+        entry_prefix = len(self._entry_key(""))
+        matched = [self._decode(key)[entry_prefix:] for key in self.redis_conn.scan_iter(match=entry_glob)]
+        return self.delete_keys(matched)
+
+    def delete_for_object(self, object_type: str, object_id: int) -> int:
+        """Delete every entry that contains the given object."""
+        return self.delete_for_objects(object_type, [object_id])
+
+    def delete_for_objects(self, object_type: str, object_ids: Iterable[int]) -> int:
+        """Delete every entry that contains any of the given objects."""
+        if self.read_only:
+            return 0
+
+        object_keys = [self._object_key(object_type, object_id) for object_id in object_ids]
+        if not object_keys:
+            return 0
+        pipe = self.redis_conn.pipeline(transaction=False)
+        for object_key in object_keys:
+            pipe.smembers(object_key)
+        keys = {self._decode(member) for members in pipe.execute() for member in members}
+        removed = self.delete_keys(keys)
+        self.redis_conn.delete(*object_keys)
+        return removed
+
+    def purge_expired(self) -> int:
+        """Redis expires entries natively."""
+        return 0
+
+    def clear(self) -> None:
+        """Remove every entry in this store's namespace."""
+        if self.read_only:
+            return
+
+        keys = list(self.redis_conn.scan_iter(match=f"{self._escape_glob(self.prefix)}*"))
+        if keys:
+            self.redis_conn.delete(*keys)
+
+    def publish(self, message: Dict[str, Any]) -> None:
+        """Broadcast an invalidation message to the other processes."""
+        if self.read_only:
+            return
+        self.redis_conn.publish(self.channel, json.dumps({**message, "origin": self.instance_id}))
+
+    def subscribe(self, handler: Callable[[Dict[str, Any]], None]):
+        """
+        Deliver invalidation messages from other processes to ``handler``.
+
+        Returns:
+            Background listener thread (call ``.stop()`` to unsubscribe)
+        """
+        def on_message(raw):
+            try:
+                message = json.loads(raw["data"])
+            except (TypeError, ValueError):
+                logger.warning(f"Ignoring malformed cache invalidation message: {raw.get('data')!r}")
+                return
+            if message.get("origin") != self.instance_id:
+                handler(message)
+
+        pubsub = self.redis_conn.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{self.channel: on_message})
+        return pubsub.run_in_thread(sleep_time=0.1, daemon=True)
+
+    def __len__(self) -> int:
+        # Keys that have not expired yet; never scans the keyspace
+        return self.redis_conn.zcount(self.entries_key, time.time() * 1000, "+inf")
+
+    def size_bytes(self) -> Optional[int]:
+        """Redis does not report per-namespace memory cheaply."""
+        return None
+
+    def close(self) -> None:
+        """Close the Redis connection pool."""
+        self.redis_conn.close()
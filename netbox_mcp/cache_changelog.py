@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Changelog-driven cache invalidation for NetBox MCP Server
+
+NetBox records every create, update and delete in its changelog
+(``/api/core/object-changes/``, ``/api/extras/object-changes/`` before
+NetBox 4.1), whichever client made the change. ChangelogPoller tails it with
+an ID cursor and applies each change to the client cache:
+
+- create: queries of the type that the new object could appear in are
+  dropped, along with "not found" answers it now satisfies
+- update: a cached copy of the object is refreshed in place, and only the
+  queries filtering on a changed field are dropped
+- delete: the object and the entries containing it are dropped
+
+Objects of endpoints that hold nothing in the cache are skipped without any
+request. TTL expiry stays in place as the backstop for anything the poller
+misses (e.g. while NetBox is unreachable).
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import CacheManager, NetBoxClient
+
+logger = logging.getLogger(__name__)
+
+
+# Changelog endpoints, newest NetBox first
+CHANGELOG_PATHS = ("core/object-changes/", "extras/object-changes/")
+
+
+def model_matches_endpoint(model: str, endpoint_name: str) -> bool:
+    """
+    Whether a changelog model name belongs to an API endpoint.
+
+    Model names are singular and unseparated ("devicetype", "ipaddress"),
+    endpoint names plural and hyphenated ("device-types", "ip-addresses").
+    """
+    name = endpoint_name.replace("-", "").replace("_", "")
+    singulars = {name}
+    if name.endswith("ies"):
+        singulars.add(name[:-3] + "y")
+    if name.endswith("es"):
+        singulars.add(name[:-2])
+    if name.endswith("s"):
+        singulars.add(name[:-1])
+    return model.lower() in singulars
+
+
+def cached_endpoint_for_model(cache: 'CacheManager', app: Optional[str], model: str) -> Optional[str]:
+    """
+    Find the cached endpoint a model's objects are served from.
+
+    Args:
+        cache: Client cache
+        app: App label ("dcim"), or None to match the model in any app
+        model: Model name ("devicetype")
+
+    Returns:
+        Endpoint name ("dcim.device-types"), or None if nothing of the model is cached
+    """
+    for endpoint in sorted(cache.cached_endpoints()):
+        endpoint_app, _, endpoint_name = endpoint.partition(".")
+        if (app is None or endpoint_app == app) and model_matches_endpoint(model, endpoint_name):
+            return endpoint
+    return None
+
+
+def changed_fields(prechange: Optional[Dict[str, Any]], postchange: Optional[Dict[str, Any]]) -> Optional[List[str]]:
+    """Fields that differ between two object snapshots, or None if either is missing."""
+    if prechange is None or postchange is None:
+        return None
+    return [field for field in set(prechange) | set(postchange) if prechange.get(field) != postchange.get(field)]
+
+
+class ChangelogPoller:
+    """
+    Background tail of the NetBox changelog that keeps the client cache current.
+
+    The first poll only records the newest change ID; later polls fetch the
+    changes after the cursor in ID order, page by page. A backlog larger than
+    ``max_backlog`` (e.g. after a long outage) clears the cache instead of
+    being replayed.
+
+    Args:
+        client: NetBoxClient whose cache is kept current
+        interval: Seconds between polls
+        page_size: Changes fetched per request
+        max_backlog: Changes per poll above which the cache is cleared instead
+    """
+
+    def __init__(
+        self,
+        client: 'NetBoxClient',
+        interval: Optional[float] = None,
+        page_size: Optional[int] = None,
+        max_backlog: Optional[int] = None
+    ):
+        cache_config = client.config.cache
+        self.client = client
+        self.cache = client.cache
+        self.interval = interval if interval is not None else cache_config.changelog_poll_interval_seconds
+        self.page_size = page_size or cache_config.changelog_page_size
+        self.max_backlog = max_backlog or cache_config.changelog_max_backlog
+
+        self.lock = threading.Lock()
+        self.cursor: Optional[int] = None
+        self.path: Optional[str] = None
+        self.state = "idle"
+        self.last_poll_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.counters = {
+            "polls": 0,
+            "changes_seen": 0,
+            "changes_applied": 0,
+            "objects_refreshed": 0,
+            "entries_invalidated": 0,
+            "resyncs": 0,
+            "errors": 0,
+        }
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> threading.Thread:
+        """Poll in a daemon thread until stop() is called."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="netbox-changelog", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop polling and wait for the thread to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        with self.lock:
+            self.state = "running"
+        logger.info(f"Changelog poller started: every {self.interval}s")
+        while True:
+            self.poll_once()
+            if self._stop.wait(self.interval):
+                break
+        with self.lock:
+            self.state = "stopped"
+
+    def poll_once(self) -> int:
+        """
+        Fetch the changes after the cursor and apply them to the cache.
+
+        Returns:
+            Number of changes read
+        """
+        try:
+            if self.cursor is None:
+                latest = self._fetch(ordering="-id", limit=1)
+                self._advance(latest[0]["id"] if latest else 0, polls=1)
+                logger.info(f"Changelog cursor initialized at change {self.cursor}")
+                return 0
+
+            changes: List[Dict[str, Any]] = []
+            after = self.cursor
+            while True:
+                page = self._fetch(id__gt=after, ordering="id", limit=self.page_size)
+                changes.extend(page)
+                if len(page) < self.page_size or len(changes) > self.max_backlog:
+                    break
+                after = page[-1]["id"]
+
+            if len(changes) > self.max_backlog:
+                latest = self._fetch(ordering="-id", limit=1)
+                logger.warning(f"Changelog backlog exceeds {self.max_backlog} changes; clearing the cache")
+                self.cache.clear()
+                with self.lock:
+                    self.counters["resyncs"] += 1
+                self._advance(latest[0]["id"] if latest else changes[-1]["id"], polls=1)
+                return len(changes)
+
+            for change in changes:
+                self.apply_change(change)
+            self._advance(changes[-1]["id"] if changes else self.cursor, polls=1, changes_seen=len(changes))
+            return len(changes)
+
+        except Exception as e:
+            logger.warning(f"Changelog poll failed: {e}")
+            with self.lock:
+                self.counters["errors"] += 1
+                self.last_error = str(e)
+                self.last_poll_at = time.time()
+            return 0
+
+    def _advance(self, change_id: int, **counters) -> None:
+        with self.lock:
+            self.cursor = change_id
+            self.last_poll_at = time.time()
+            for name, increment in counters.items():
+                self.counters[name] += increment
+
+    def _fetch(self, **params) -> List[Dict[str, Any]]:
+        """One page of the changelog as plain dicts."""
+        api = self.client.api
+        headers = {"Authorization": f"Token {self.client.config.token}", "Accept": "application/json"}
+        for path in ([self.path] if self.path else CHANGELOG_PATHS):
+            response = api.http_session.get(
+                f"{api.base_url}/{path}", params=params, headers=headers, timeout=self.client.config.timeout
+            )
+            if response.status_code == 404 and self.path is None:
+                continue
+            response.raise_for_status()
+            self.path = path
+            return response.json()["results"]
+        raise RuntimeError("NetBox exposes no changelog endpoint")
+
+    def apply_change(self, change: Dict[str, Any]) -> bool:
+        """
+        Apply one changelog entry to the cache.
+
+        Args:
+            change: Object change as returned by the changelog API
+
+        Returns:
+            True if the change touched a cached endpoint
+        """
+        content_type = change.get("changed_object_type")
+        if isinstance(content_type, dict):
+            content_type = f"{content_type.get('app_label')}.{content_type.get('model')}"
+        app, _, model = (content_type or "").partition(".")
+        endpoint = cached_endpoint_for_model(self.cache, app, model)
+        if endpoint is None:
+            return False
+
+        action = change.get("action")
+        action = action.get("value") if isinstance(action, dict) else action
+        object_id = change.get("changed_object_id")
+        prechange = change.get("prechange_data") or None
+        postchange = change.get("postchange_data") or None
+
+        invalidated = 0
+        refreshed = 0
+        if action == "delete":
+            invalidated += self.cache.invalidate_for_object(endpoint, object_id)
+            invalidated += self.cache.invalidate_pattern(f"{endpoint}:count")
+        elif action == "create":
+            invalidated += self.cache.invalidate_queries(endpoint)
+            if postchange:
+                self.cache.invalidate_negative(endpoint, postchange)
+        else:
+            invalidated += self.cache.invalidate_queries(endpoint, changed_fields(prechange, postchange))
+            if postchange:
+                self.cache.invalidate_negative(endpoint, postchange)
+            if self.cache.has_object(endpoint, object_id):
+                if self._refresh(endpoint, object_id):
+                    refreshed += 1
+                else:
+                    invalidated += self.cache.invalidate_for_object(endpoint, object_id)
+
+        logger.debug("Changelog %s of %s %s: %s entries invalidated, %s refreshed",
+                     action, endpoint, object_id, invalidated, refreshed)
+        with self.lock:
+            self.counters["changes_applied"] += 1
+            self.counters["objects_refreshed"] += refreshed
+            self.counters["entries_invalidated"] += invalidated
+        return True
+
+    def _refresh(self, endpoint: str, object_id: int) -> bool:
+        """Replace the cached copy of an object with its current version."""
+        app, _, endpoint_name = endpoint.partition(".")
+        try:
+            record = getattr(getattr(self.client.api, app), endpoint_name.replace("-", "_")).get(object_id)
+        except Exception as e:
+            logger.debug("Changelog refresh of %s %s failed: %s", endpoint, object_id, e)
+            return False
+        if record is None:
+            return False
+        return self.cache.update_entity(endpoint, record.serialize())
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Poller progress for the system status endpoint.
+
+        Returns:
+            State, cursor, last poll time and counters
+        """
+        with self.lock:
+            return {
+                "state": self.state,
+                "interval_seconds": self.interval,
+                "endpoint": self.path,
+                "cursor": self.cursor,
+                "last_poll_at": datetime.fromtimestamp(self.last_poll_at).isoformat() if self.last_poll_at else None,
+                "last_error": self.last_error,
+                **self.counters,
+            }
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Immutable cached values for NetBox MCP Server
+
+Cache hits hand out the stored objects themselves rather than copies, so a
+tool that added a computed field to a cached device would change it for
+every later caller. Values are therefore frozen once when they are stored:
+
+- dicts become FrozenDict and lists become FrozenList, recursively
+- both are real dict/list subclasses, so ``isinstance`` checks, ``json``,
+  ``.get()``, ``{**record}`` and iteration keep working unchanged
+- every mutating method raises TypeError
+- ``.copy()`` / ``copy.copy()`` return a plain, mutable shallow copy and
+  ``copy.deepcopy()`` / ``thaw()`` a fully mutable one, so a caller that
+  needs to change a record pays for exactly one copy of that record
+
+Hits stay zero-copy: a cached record is returned as is, however often it is
+read.
+"""
+
+from typing import Any
+
+
+class FrozenDict(dict):
+    """Read-only dict holding a cached NetBox object."""
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("cached NetBox objects are read-only; modify a .copy() instead")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def copy(self) -> dict:
+        """Mutable shallow copy (nested values stay read-only)."""
+        return dict(self)
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo) -> dict:
+        return thaw(self)
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+    def __repr__(self) -> str:
+        return f"FrozenDict({dict.__repr__(self)})"
+
+
+class FrozenList(list):
+    """Read-only list inside a cached NetBox object (tags, termination lists)."""
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("cached NetBox objects are read-only; modify a .copy() instead")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def copy(self) -> list:
+        """Mutable shallow copy (nested values stay read-only)."""
+        return list(self)
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo) -> list:
+        return thaw(self)
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+    def __repr__(self) -> str:
+        return f"FrozenList({list.__repr__(self)})"
+
+
+def freeze(value: Any) -> Any:
+    """
+    Return a read-only version of a serialized value.
+
+    Already frozen values are returned unchanged, so freezing a record that
+    came out of the cache costs nothing.
+    """
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return FrozenList([freeze(item) for item in value])
+    return value
+
+
+def freeze_result(value: Any) -> Any:
+    """
+    Freeze a query result for handing out.
+
+    The records of a result list are frozen; the list itself stays a plain
+    list owned by the caller, who may sort or extend it.
+    """
+    if isinstance(value, list):
+        return [freeze(item) for item in value]
+    return freeze(value)
+
+
+def thaw(value: Any) -> Any:
+    """Return a fully mutable deep copy of a (possibly frozen) value."""
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    return value
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Per-endpoint cache policies for NetBox MCP Server
+
+CacheManager keeps one in-memory cache per NetBox endpoint. The policy for
+an endpoint (TTL, stale-while-revalidate window, negative TTL, item and size
+budget) is resolved the first time the endpoint is used, from:
+
+1. ``cache.endpoints`` in netbox-mcp.yaml, keyed by endpoint
+   ("dcim.device-types" or "dcim.device_types")
+2. the per-type defaults in ``cache.ttl``, ``cache.stale_while_revalidate``
+   and ``cache.negative_ttl`` for the endpoints those settings describe
+3. the ``default`` values of those settings
+
+Endpoints are always named the way pynetbox names them ("app.endpoint-name"),
+so every spelling a tool might use resolves to the same policy.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .config import CacheConfig
+
+
+# Endpoint → field name in CacheTTLConfig / CacheSWRConfig / CacheNegativeTTLConfig
+DEFAULT_POLICY_FIELDS: Dict[str, str] = {
+    "dcim.manufacturers": "manufacturers",
+    "dcim.device-types": "device_types",
+    "dcim.device-roles": "device_roles",
+    "dcim.sites": "sites",
+    "dcim.devices": "devices",
+    "dcim.interfaces": "device_interfaces",
+    "ipam.ip-addresses": "ip_addresses",
+    "ipam.vlans": "vlans",
+}
+
+
+def normalize_endpoint(object_type: str) -> str:
+    """
+    Normalize an object type to the pynetbox endpoint spelling.
+
+    pynetbox endpoint names use hyphens ("ipam.ip-addresses"), while tools
+    and configuration often spell them with underscores ("ipam.ip_addresses").
+    """
+    return object_type.replace("_", "-")
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Resolved cache settings for one NetBox endpoint."""
+
+    endpoint: str
+    ttl: int
+    stale_while_revalidate: int
+    negative_ttl: int
+    max_items: int
+    size_limit_bytes: int
+    source: str                             # 'config', 'builtin' or 'default'
+
+
+class CachePolicyRegistry:
+    """
+    Resolves and remembers the cache policy of every endpoint in use.
+
+    Args:
+        cache_config: Cache section of the server configuration
+    """
+
+    def __init__(self, cache_config: 'CacheConfig'):
+        self.cache_config = cache_config
+        self._lock = threading.Lock()
+        self._policies: Dict[str, CachePolicy] = {}
+        self._overrides = {
+            normalize_endpoint(endpoint): override
+            for endpoint, override in (cache_config.endpoints or {}).items()
+        }
+
+    def policy_for(self, object_type: str) -> CachePolicy:
+        """
+        Get the policy of an endpoint, resolving it on first use.
+
+        Args:
+            object_type: NetBox object type in any spelling (e.g., "dcim.device_types")
+
+        Returns:
+            The endpoint's cache policy
+        """
+        endpoint = normalize_endpoint(object_type)
+        policy = self._policies.get(endpoint)
+        if policy is None:
+            with self._lock:
+                policy = self._policies.get(endpoint)
+                if policy is None:
+                    policy = self._policies[endpoint] = self._resolve(endpoint)
+        return policy
+
+    def policies(self) -> Dict[str, CachePolicy]:
+        """Every policy resolved so far, keyed by endpoint."""
+        with self._lock:
+            return dict(self._policies)
+
+    def _resolve(self, endpoint: str) -> CachePolicy:
+        """Build a policy from the endpoint override, the built-in defaults and the global defaults."""
+        config = self.cache_config
+        field_name = DEFAULT_POLICY_FIELDS.get(endpoint)
+        override = self._overrides.get(endpoint)
+
+        def builtin(settings) -> int:
+            return getattr(settings, field_name, settings.default) if field_name else settings.default
+
+        def pick(value: Optional[float], fallback: float) -> float:
+            return fallback if value is None else value
+
+        size_limit_mb = pick(override.size_limit_mb if override else None, config.size_limit_mb)
+        return CachePolicy(
+            endpoint=endpoint,
+            ttl=pick(override.ttl if override else None, builtin(config.ttl)),
+            stale_while_revalidate=pick(
+                override.stale_while_revalidate if override else None, builtin(config.stale_while_revalidate)
+            ),
+            negative_ttl=pick(override.negative_ttl if override else None, builtin(config.negative_ttl)),
+            max_items=pick(override.max_items if override else None, max(config.max_items // 4, 1)),
+            size_limit_bytes=int(min(size_limit_mb, config.size_limit_mb) * 1024 * 1024),
+            source="config" if override else ("builtin" if field_name else "default"),
+        )
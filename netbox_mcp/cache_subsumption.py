@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Query subsumption for the NetBox MCP cache
+
+A filter() call such as ``devices.filter(site="dc1", status="active")`` can be
+answered without NetBox when the complete result of a broader filter (here
+``devices.filter(site="dc1")``) is already cached: the remaining predicates
+are evaluated locally against the cached records.
+
+Only predicates whose NetBox semantics can be reproduced exactly from a
+serialized record are evaluated:
+
+- ``field=value`` on string, boolean and choice fields (``name``,
+  ``status``, ``mark_connected``) and on ``id``
+- ``field_id=N`` on related objects (``site_id=3``); Record.serialize()
+  flattens related objects to their ID
+- ``field=value`` on related objects that are still nested, compared with
+  their ``slug`` or choice ``value`` (``site=dc1``)
+- list values and ``field__in`` (any of the values)
+
+Anything else is left to NetBox: free-text search, other lookups, custom
+fields, integer fields other than ``id`` (a flattened related object looks
+the same as a number), floats and list fields such as tags.
+"""
+
+from itertools import combinations
+from typing import Any, Callable, Dict, Iterator, Optional
+
+# Parameters that never describe a record predicate
+UNEVALUABLE_PARAMS = {"q", "brief", "fields", "exclude", "omit", "ordering", "expand", "limit", "offset"}
+
+# Above this many parameters the candidate supersets are not enumerated
+MAX_SUBSUMPTION_PARAMS = 6
+
+
+class Unevaluable(Exception):
+    """A predicate cannot be evaluated against a cached record."""
+
+
+def superset_candidates(params: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the parameter subsets whose results contain the result of ``params``.
+
+    Larger subsets come first, so the smallest cached superset is preferred;
+    the empty subset (the complete listing) comes last.
+    """
+    if len(params) > MAX_SUBSUMPTION_PARAMS:
+        return
+    items = sorted(params.items())
+    for size in range(len(items) - 1, -1, -1):
+        for subset in combinations(items, size):
+            yield dict(subset)
+
+
+def compile_filter(params: Dict[str, Any]) -> Optional[Callable[[Dict[str, Any]], bool]]:
+    """
+    Build a local predicate equivalent to NetBox filter parameters.
+
+    Args:
+        params: Filter parameters to evaluate locally
+
+    Returns:
+        Predicate over serialized records, or None if a parameter cannot be
+        evaluated locally. The predicate raises Unevaluable when a record
+        lacks the data needed to decide.
+    """
+    checks = []
+    for name, value in params.items():
+        check = _compile_predicate(name, value)
+        if check is None:
+            return None
+        checks.append(check)
+    return lambda record: all(check(record) for check in checks)
+
+
+def _token(value: Any) -> str:
+    """Render a filter or field value the way it appears in a query string."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _compile_predicate(name: str, value: Any) -> Optional[Callable[[Dict[str, Any]], bool]]:
+    """Compile one ``name=value`` filter parameter, or return None if unsupported."""
+    if name in UNEVALUABLE_PARAMS or name.startswith("cf_"):
+        return None
+
+    field_name, _, lookup = name.partition("__")
+    if lookup not in ("", "in"):
+        return None
+
+    if isinstance(value, (list, tuple, set)):
+        values = value
+    elif lookup == "in":
+        values = str(value).split(",")
+    else:
+        values = [value]
+    wanted = {_token(item) for item in values}
+    if not wanted or "null" in wanted:
+        return None
+
+    def check(record: Dict[str, Any]) -> bool:
+        if field_name in record:
+            actual, by_id = record[field_name], False
+        elif field_name.endswith("_id") and field_name[:-3] in record:
+            actual, by_id = record[field_name[:-3]], True
+        else:
+            raise Unevaluable(name)
+        return not wanted.isdisjoint(_field_tokens(actual, by_id, name))
+
+    return check
+
+
+def _field_tokens(actual: Any, by_id: bool, name: str) -> set:
+    """Values a record field matches in NetBox filters."""
+    if actual is None:
+        return set()
+    if isinstance(actual, dict):
+        if by_id:
+            if "id" not in actual:
+                raise Unevaluable(name)
+            return {_token(actual["id"])}
+        tokens = {_token(actual[key]) for key in ("slug", "value") if key in actual}
+        if not tokens:
+            raise Unevaluable(name)
+        return tokens
+    if isinstance(actual, (bool, str)):
+        if by_id:
+            raise Unevaluable(name)
+        return {_token(actual)}
+    if isinstance(actual, int) and (by_id or name in ("id", "id__in")):
+        return {_token(actual)}
+    raise Unevaluable(name)
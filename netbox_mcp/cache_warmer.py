@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Cache Warm-up for NetBox MCP Server
+
+Prefetches the low-churn reference data that tools resolve by name
+(manufacturers, device types, roles, sites, ...) right after startup, so the
+first tool calls after a deploy are answered from cache instead of paying
+several extra NetBox round trips each.
+
+Warm-up runs in a background thread with a bounded worker pool and stops
+early when its time or size budget is exhausted. Progress is exposed via
+CacheWarmer.status() for the system status endpoint.
+"""
+
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import NetBoxClient
+
+logger = logging.getLogger(__name__)
+
+
+# (app, endpoint, lookup fields tools filter on)
+REFERENCE_SETS: List[Tuple[str, str, Tuple[str, ...]]] = [
+    ("dcim", "manufacturers", ("name", "slug")),
+    ("dcim", "device_types", ("model", "slug")),
+    ("dcim", "device_roles", ("name", "slug")),
+    ("dcim", "sites", ("name", "slug")),
+    ("dcim", "platforms", ("name", "slug")),
+    ("tenancy", "tenants", ("name", "slug")),
+    ("ipam", "vrfs", ("name", "rd")),
+    ("extras", "tags", ("name", "slug")),
+    ("virtualization", "cluster_types", ("name", "slug")),
+]
+
+
+class CacheWarmer:
+    """
+    Parallel, budgeted prefetch of reference data into the client cache.
+
+    Each reference set is streamed page by page; a set is only written to
+    the cache once it has been fetched completely, so a budget cut-off never
+    leaves a partial listing that would answer lookups incorrectly.
+
+    Args:
+        client: NetBoxClient whose cache is warmed
+        reference_sets: (app, endpoint, lookup fields) tuples to prefetch
+        time_budget: Seconds after which remaining work is abandoned
+        size_budget_mb: Serialized megabytes after which remaining work is abandoned
+        max_workers: Reference sets fetched concurrently
+    """
+
+    def __init__(
+        self,
+        client: 'NetBoxClient',
+        reference_sets: Optional[List[Tuple[str, str, Tuple[str, ...]]]] = None,
+        time_budget: Optional[float] = None,
+        size_budget_mb: Optional[float] = None,
+        max_workers: Optional[int] = None
+    ):
+        cache_config = client.config.cache
+        self.client = client
+        self.reference_sets = reference_sets if reference_sets is not None else REFERENCE_SETS
+        self.time_budget = time_budget if time_budget is not None else cache_config.warm_time_budget_seconds
+        self.size_budget_bytes = int(
+            (size_budget_mb if size_budget_mb is not None else cache_config.warm_size_budget_mb) * 1024 * 1024
+        )
+        self.max_workers = max_workers or cache_config.warm_max_workers
+
+        self.lock = threading.Lock()
+        self.state = "idle"
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.bytes_fetched = 0
+        self.sets: Dict[str, Dict[str, Any]] = {
+            f"{app}.{endpoint}": {"state": "pending", "objects": 0, "bytes": 0}
+            for app, endpoint, _ in self.reference_sets
+        }
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> threading.Thread:
+        """Run warm() in a daemon thread and return immediately."""
+        self._thread = threading.Thread(target=self.warm, name="netbox-cache-warmup", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until a background warm-up finishes. Returns True if it did."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+            return not self._thread.is_alive()
+        return self.state in ("completed", "failed")
+
+    def warm(self) -> Dict[str, Any]:
+        """
+        Prefetch every reference set in parallel within the budgets.
+
+        Returns:
+            Final status (see status())
+        """
+        with self.lock:
+            self.state = "running"
+            self.started_at = time.time()
+        logger.info(f"Cache warm-up started: {len(self.reference_sets)} reference sets, "
+                    f"budget {self.time_budget}s / {self.size_budget_bytes // (1024 * 1024)}MB")
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="netbox-warm") as pool:
+                list(pool.map(lambda reference_set: self._warm_set(*reference_set), self.reference_sets))
+            final_state = "completed"
+        except Exception as e:
+            logger.warning(f"Cache warm-up failed: {e}")
+            final_state = "failed"
+
+        with self.lock:
+            self.state = final_state
+            self.finished_at = time.time()
+
+        status = self.status()
+        logger.info(f"Cache warm-up {final_state}: {status['completed_sets']}/{status['total_sets']} sets, "
+                    f"{status['objects']} objects, {status['bytes']} bytes in {status['elapsed_seconds']}s")
+        return status
+
+    def _budget_exhausted(self) -> Optional[str]:
+        """Return the reason warm-up must stop, if any."""
+        if time.time() - self.started_at > self.time_budget:
+            return "time budget exhausted"
+        if self.bytes_fetched > self.size_budget_bytes:
+            return "size budget exhausted"
+        return None
+
+    def _update_set(self, name: str, **changes) -> None:
+        with self.lock:
+            self.sets[name].update(changes)
+
+    def _warm_set(self, app: str, endpoint: str, lookup_fields: Tuple[str, ...]) -> None:
+        """Fetch one reference set completely and prime the cache with it."""
+        name = f"{app}.{endpoint}"
+        reason = self._budget_exhausted()
+        if reason:
+            self._update_set(name, state="skipped", reason=reason)
+            return
+
+        self._update_set(name, state="running")
+        try:
+            wrapper = getattr(getattr(self.client, app), endpoint)
+            records = []
+            set_bytes = 0
+
+            for record in wrapper.iter_filter(page_size=self.client.config.max_results):
+                records.append(record)
+                record_bytes = len(json.dumps(record, separators=(",", ":"), default=str))
+                set_bytes += record_bytes
+                with self.lock:
+                    self.bytes_fetched += record_bytes
+
+                reason = self._budget_exhausted()
+                if reason:
+                    self._update_set(name, state="skipped", reason=reason, objects=len(records), bytes=set_bytes)
+                    return
+
+            entries = wrapper.prime(records, lookup_fields)
+            self._update_set(name, state="done", objects=len(records), bytes=set_bytes, cache_entries=entries)
+
+        except Exception as e:
+            logger.warning(f"Cache warm-up of {name} failed: {e}")
+            self._update_set(name, state="failed", error=str(e))
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Warm-up progress for the system status endpoint.
+
+        Returns:
+            State, elapsed time, budget usage and per-set progress
+        """
+        with self.lock:
+            sets = {name: dict(progress) for name, progress in self.sets.items()}
+            end = self.finished_at or time.time()
+            elapsed = round(end - self.started_at, 2) if self.started_at else 0.0
+            return {
+                "state": self.state,
+                "started_at": datetime.fromtimestamp(self.started_at).isoformat() if self.started_at else None,
+                "elapsed_seconds": elapsed,
+                "time_budget_seconds": self.time_budget,
+                "bytes": self.bytes_fetched,
+                "size_budget_bytes": self.size_budget_bytes,
+                "total_sets": len(sets),
+                "completed_sets": sum(1 for progress in sets.values() if progress["state"] == "done"),
+                "objects": sum(progress["objects"] for progress in sets.values()),
+                "sets": sets,
+            }
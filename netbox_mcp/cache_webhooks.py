@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Webhook-driven cache invalidation for NetBox MCP Server
+
+NetBox event rules can push a webhook for every create, update and delete.
+WebhookReceiver authenticates those requests (the webhook secret's
+HMAC-SHA512 signature in ``X-Hook-Signature``), queues the events and
+applies them to the client cache after a short quiet period, so a bulk
+import touching thousands of objects costs one query invalidation per
+endpoint instead of one per object:
+
+- created: the endpoint's queries and matching "not found" answers are dropped
+- updated: a cached copy of the object is replaced with the webhook's data
+  (no NetBox request), and only the queries filtering on a changed field
+  are dropped
+- deleted: the object and the entries containing it are dropped
+
+Only the latest event per object in a burst is applied. Events for models
+with nothing in the cache are counted as ignored.
+"""
+
+import hashlib
+import hmac
+import json
+import logging
+import re
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
+
+from .cache_changelog import cached_endpoint_for_model, changed_fields
+from .exceptions import NetBoxAuthError, NetBoxValidationError
+
+if TYPE_CHECKING:
+    from .client import NetBoxClient
+
+logger = logging.getLogger(__name__)
+
+
+SIGNATURE_HEADER = "X-Hook-Signature"
+
+# Webhook event names (NetBox 4.x event rules and legacy webhooks) → changelog actions
+EVENT_ACTIONS = {
+    "created": "create", "object_created": "create",
+    "updated": "update", "object_updated": "update",
+    "deleted": "delete", "object_deleted": "delete",
+}
+
+# ".../api/dcim/device-types/5/" → ("dcim", "device-types")
+_OBJECT_URL = re.compile(r"/api/([a-z0-9_-]+)/([a-z0-9_-]+)/\d+/?$")
+
+
+class WebhookReceiver:
+    """
+    Authenticated, debounced application of NetBox webhooks to the client cache.
+
+    Args:
+        client: NetBoxClient whose cache is kept current
+        secret: Webhook secret configured in NetBox
+        debounce: Seconds without new events before a burst is applied
+        max_delay: Seconds after which a continuing burst is applied anyway
+    """
+
+    def __init__(
+        self,
+        client: 'NetBoxClient',
+        secret: Optional[str] = None,
+        debounce: Optional[float] = None,
+        max_delay: Optional[float] = None
+    ):
+        cache_config = client.config.cache
+        self.client = client
+        self.cache = client.cache
+        self.secret = secret if secret is not None else cache_config.webhook_secret
+        self.debounce = debounce if debounce is not None else cache_config.webhook_debounce_seconds
+        self.max_delay = max_delay if max_delay is not None else cache_config.webhook_max_delay_seconds
+        if not self.secret:
+            raise NetBoxValidationError("A webhook secret is required to accept NetBox webhooks")
+
+        self.lock = threading.Lock()
+        self.counters = {
+            "received": 0,
+            "rejected": 0,
+            "coalesced": 0,
+            "applied": 0,
+            "ignored": 0,
+            "flushes": 0,
+            "entries_invalidated": 0,
+        }
+        # (endpoint or model, object ID) → latest pending event
+        self._pending: Dict[Tuple[str, Any], Dict[str, Any]] = {}
+        self._first_pending_at: Optional[float] = None
+        self._last_event_at: Optional[float] = None
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> threading.Thread:
+        """Apply pending events in a daemon thread until stop() is called."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="netbox-webhooks", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Apply what is pending and stop the thread."""
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            delay = self._flush_delay()
+            if delay is None:
+                self._wakeup.wait()
+                self._wakeup.clear()
+            elif delay > 0:
+                # New events push the deadline back; it is recomputed after the wait
+                self._stop.wait(delay)
+            else:
+                self.flush()
+
+    def _flush_delay(self) -> Optional[float]:
+        """Seconds until the pending burst is due, or None if nothing is pending."""
+        with self.lock:
+            if not self._pending:
+                return None
+            now = time.time()
+            return max(min(self._last_event_at + self.debounce, self._first_pending_at + self.max_delay) - now, 0)
+
+    def verify(self, body: bytes, signature: Optional[str]) -> None:
+        """
+        Check a webhook's HMAC-SHA512 signature.
+
+        Raises:
+            NetBoxAuthError: If the signature is missing or does not match
+        """
+        expected = hmac.new(self.secret.encode(), body, hashlib.sha512).hexdigest()
+        if not signature or not hmac.compare_digest(expected, signature.strip().lower()):
+            with self.lock:
+                self.counters["rejected"] += 1
+            raise NetBoxAuthError("Invalid webhook signature")
+
+    def receive(self, body: bytes, signature: Optional[str]) -> Dict[str, Any]:
+        """
+        Authenticate a webhook request and queue its event.
+
+        Args:
+            body: Raw request body
+            signature: Value of the X-Hook-Signature header
+
+        Returns:
+            Acknowledgement with the queued event's action and object
+
+        Raises:
+            NetBoxAuthError: If the signature does not match the secret
+            NetBoxValidationError: If the body is not a NetBox object event
+        """
+        self.verify(body, signature)
+        try:
+            payload = json.loads(body)
+        except ValueError as e:
+            raise NetBoxValidationError(f"Webhook body is not JSON: {e}")
+
+        event = self._parse(payload)
+        now = time.time()
+        with self.lock:
+            self.counters["received"] += 1
+            if event is None:
+                self.counters["ignored"] += 1
+                return {"status": "ignored"}
+            key = (event["endpoint"] or event["model"], event["object_id"])
+            previous = self._pending.get(key)
+            if previous is not None:
+                self.counters["coalesced"] += 1
+                event = self._merge(previous, event)
+            self._pending[key] = event
+            self._first_pending_at = self._first_pending_at or now
+            self._last_event_at = now
+        self._wakeup.set()
+        return {"status": "queued", "action": event["action"], "object_id": event["object_id"]}
+
+    @staticmethod
+    def _parse(payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Extract the object event from a webhook payload, or None if it is not one."""
+        if not isinstance(payload, dict):
+            raise NetBoxValidationError("Webhook body must be a JSON object")
+        action = EVENT_ACTIONS.get(str(payload.get("event", "")).lower())
+        data = payload.get("data")
+        if action is None or not isinstance(data, dict) or "id" not in data:
+            return None
+
+        match = _OBJECT_URL.search(str(data.get("url") or ""))
+        snapshots = payload.get("snapshots") or {}
+        return {
+            "action": action,
+            "endpoint": f"{match.group(1)}.{match.group(2)}" if match else None,
+            "model": str(payload.get("model", "")),
+            "object_id": data["id"],
+            "data": data,
+            "changed_fields": changed_fields(snapshots.get("prechange"), snapshots.get("postchange")),
+        }
+
+    @staticmethod
+    def _merge(previous: Dict[str, Any], event: Dict[str, Any]) -> Dict[str, Any]:
+        """Combine two events for the same object into the one that must be applied."""
+        if event["action"] == "delete":
+            return event
+        if previous["action"] == "create":
+            return {**event, "action": "create", "changed_fields": None}
+        if previous["changed_fields"] is None or event["changed_fields"] is None:
+            return {**event, "changed_fields": None}
+        return {**event, "changed_fields": sorted(set(previous["changed_fields"]) | set(event["changed_fields"]))}
+
+    def flush(self) -> int:
+        """
+        Apply every pending event to the cache now.
+
+        Returns:
+            Number of events applied
+        """
+        with self.lock:
+            pending, self._pending = self._pending, {}
+            self._first_pending_at = self._last_event_at = None
+        if not pending:
+            return 0
+
+        applied = ignored = invalidated = 0
+        # Endpoint → changed fields across the burst (None: any field / membership changed)
+        query_changes: Dict[str, Optional[set]] = {}
+        for event in pending.values():
+            endpoint = self._cached_endpoint(event)
+            if endpoint is None:
+                ignored += 1
+                continue
+            applied += 1
+            action, object_id = event["action"], event["object_id"]
+
+            if action == "delete":
+                invalidated += self.cache.invalidate_for_object(endpoint, object_id)
+                if query_changes.get(endpoint, set()) is not None:
+                    query_changes.setdefault(endpoint, set()).add("count")
+                continue
+
+            fields = None if action == "create" else event["changed_fields"]
+            if fields is None or (endpoint in query_changes and query_changes[endpoint] is None):
+                query_changes[endpoint] = None
+            else:
+                query_changes.setdefault(endpoint, set()).update(fields)
+
+            self.cache.invalidate_negative(endpoint, event["data"])
+            if action == "update":
+                serialized = self._serialize(endpoint, event["data"])
+                if serialized is not None:
+                    self.cache.update_entity(endpoint, serialized)
+                else:
+                    invalidated += self.cache.invalidate_for_object(endpoint, object_id)
+
+        for endpoint, fields in query_changes.items():
+            if fields is not None and "count" in fields:
+                fields.discard("count")
+                invalidated += self.cache.invalidate_pattern(f"{endpoint}:count")
+            if fields is None or fields:
+                invalidated += self.cache.invalidate_queries(endpoint, None if fields is None else sorted(fields))
+
+        logger.debug("Webhook burst applied: %s events, %s ignored, %s entries invalidated",
+                     applied, ignored, invalidated)
+        with self.lock:
+            self.counters["flushes"] += 1
+            self.counters["applied"] += applied
+            self.counters["ignored"] += ignored
+            self.counters["entries_invalidated"] += invalidated
+        return applied
+
+    def _cached_endpoint(self, event: Dict[str, Any]) -> Optional[str]:
+        """The cached endpoint an event's object belongs to, if any."""
+        endpoint = event["endpoint"]
+        if endpoint is not None:
+            return endpoint if endpoint in self.cache.cached_endpoints() else None
+        return cached_endpoint_for_model(self.cache, None, event["model"])
+
+    def _serialize(self, endpoint: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Convert webhook data (the API representation) to the cached Record.serialize() form."""
+        app, _, endpoint_name = endpoint.partition(".")
+        try:
+            pynetbox_endpoint = getattr(getattr(self.client.api, app), endpoint_name.replace("-", "_"))
+            return pynetbox_endpoint.return_obj(data, self.client.api, pynetbox_endpoint).serialize()
+        except Exception as e:
+            logger.debug("Webhook data for %s %s not usable in place: %s", endpoint, data.get("id"), e)
+            return None
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Receiver counters for the system status endpoint.
+
+        Returns:
+            Debounce settings, pending events and counters
+        """
+        with self.lock:
+            return {
+                "debounce_seconds": self.debounce,
+                "max_delay_seconds": self.max_delay,
+                "pending": len(self._pending),
+                **self.counters,
+            }
@@ -31,23 +31,43 @@ dynamically routing all requests to the appropriate NetBox API endpoints.
     client.dcim.devices.update(device_id, status="offline", confirm=True)
 """
 
+import json
 import logging
+from collections import deque
+from contextlib import contextmanager
+import sqlite3
 import threading
 import time
-from typing import Dict, List, Optional, Any, Union, TYPE_CHECKING
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Any, Union, TYPE_CHECKING
 from dataclasses import dataclass
 
 import pynetbox
+from pynetbox.core.endpoint import Endpoint
+from pynetbox.core.query import Request
 import requests
 from requests.adapters import HTTPAdapter
 from requests import Session
 from cachetools import TTLCache
 
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
 if TYPE_CHECKING:
-    from pynetbox.core.endpoint import Endpoint
     from pynetbox.core.api import Api
 
 from .config import NetBoxConfig
+from .cache_backends import DiskCacheStore, RedisCacheStore
+from .cache_frozen import freeze, freeze_result
+from .cache_policy import CachePolicyRegistry, normalize_endpoint
+from .cache_subsumption import Unevaluable, compile_filter, superset_candidates
+from .paged_fetch import fetch_listing
+from .raw_records import RawEndpoint
+from .write_batcher import WriteBatcher
 from .exceptions import (
     NetBoxError,
     NetBoxConnectionError,
@@ -61,6 +81,9 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Query parameters selecting a partial representation of the objects
+PROJECTION_PARAMS = frozenset({"brief", "exclude", "fields"})
+
 
 @dataclass
 class ConnectionStatus:
@@ -75,12 +98,166 @@ class ConnectionStatus:
     error: Optional[str] = None
 
 
+class _IndexedTTLCache(TTLCache):
+    """
+    Byte-sized TTLCache that reports keys it drops on its own.
+    
+    ``ttl`` is the freshness lifetime; entries are physically kept for
+    ``ttl + swr`` so they can be served stale while being revalidated.
+    ``maxsize`` is a byte budget (measured with ``getsizeof``) and
+    ``max_entries`` bounds the number of items on top of it. Expired and
+    LRU-evicted keys are passed to ``on_remove`` so that CacheManager can keep
+    its reverse indexes in sync without scanning; evictions are also reported
+    to ``on_evict`` for the stats.
+    
+    ``snapshot`` mirrors the stored values in a plain dict that is only
+    written under the owner's lock, so readers can look values up without
+    the lock (TTLCache lookups reorder its LRU links and are not safe to run
+    concurrently with writers).
+    """
+    
+    def __init__(
+        self, maxsize: int, ttl: float, on_remove=None, on_evict=None,
+        max_entries: Optional[int] = None, swr: float = 0, **kwargs
+    ):
+        # Entries are kept for the stale-while-revalidate window past their TTL
+        super().__init__(maxsize=maxsize, ttl=ttl + swr, **kwargs)
+        self._on_remove = on_remove
+        self._on_evict = on_evict
+        self.max_entries = max_entries
+        self.fresh_ttl = ttl
+        self.swr = swr
+        self.snapshot: Dict[Any, Any] = {}
+        self.hits = 0
+        self.misses = 0
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.snapshot[key] = value
+        if self.max_entries is not None:
+            while len(self) > self.max_entries:
+                self.popitem()
+    
+    def __delitem__(self, key):
+        self.snapshot.pop(key, None)
+        super().__delitem__(key)
+    
+    def expire(self, time=None):
+        expired = super().expire(time)
+        for key, _ in expired:
+            self.snapshot.pop(key, None)
+            if self._on_remove is not None:
+                self._on_remove(key)
+        return expired
+    
+    def clear(self):
+        super().clear()
+        self.snapshot.clear()
+    
+    def popitem(self):
+        key, value = super().popitem()
+        if self._on_remove is not None:
+            self._on_remove(key)
+        if self._on_evict is not None:
+            self._on_evict(key)
+        return key, value
+
+
+class _Compressed:
+    """Compressed JSON encoding of a cached value."""
+    
+    __slots__ = ("data", "codec", "raw_size")
+    
+    def __init__(self, data: bytes, codec: str, raw_size: int):
+        self.data = data
+        self.codec = codec
+        self.raw_size = raw_size
+
+
+class _EntityRef:
+    """
+    Query cache entry that references normalized entities by ID.
+    
+    The serialized objects themselves live once in the entity store; query
+    entries only keep the ordered ID list (or a single ID for get() lookups).
+    """
+    
+    __slots__ = ("object_type", "ids", "single")
+    
+    def __init__(self, object_type: str, ids: tuple, single: bool = False):
+        self.object_type = object_type
+        self.ids = ids
+        self.single = single
+
+
+class _Flight:
+    """An upstream read in progress that concurrent identical reads wait on."""
+    
+    __slots__ = ("done", "result", "error")
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class _DeferredInvalidations:
+    """Distinct invalidations recorded inside a deferred_invalidation() block."""
+    
+    __slots__ = ("patterns", "objects", "queries", "matching")
+    
+    def __init__(self):
+        self.patterns: Dict[str, None] = {}                  # insertion-ordered set
+        self.objects: Dict[tuple, None] = {}                 # (object type, id)
+        self.queries: Dict[str, Optional[set]] = {}          # object type → fields (None: all)
+        self.matching: Dict[str, Dict[Any, list]] = {}       # object type → id → written versions
+    
+    def record(self, op: str, object_type: str, arg: Any = None) -> None:
+        """Add one invalidation, merging it with what is already recorded."""
+        if op == "pattern":
+            self.patterns[object_type] = None
+        elif op == "object":
+            self.objects[(object_type, arg)] = None
+        elif op == "queries":
+            if arg is None or self.queries.get(object_type, set()) is None:
+                self.queries[object_type] = None
+            else:
+                self.queries.setdefault(object_type, set()).update(arg)
+        elif op == "matching":
+            by_id = self.matching.setdefault(object_type, {})
+            for version in arg:
+                versions = by_id.setdefault(version.get("id"), [])
+                if version not in versions:
+                    versions.append(version)
+
+
 class CacheManager:
     """
     Cache manager implementing Gemini's caching strategy.
     
     Provides TTL-based caching with configurable TTLs per object type,
     standardized cache key generation, and comprehensive metrics tracking.
+    
+    Keeps reverse indexes (object type → keys, object → keys whose value
+    contains it) so invalidation touches only the affected entries instead
+    of scanning every key in every cache.
+    
+    Results are stored in two layers: an entity store holding one serialized
+    copy of each object per (object type, id), and query entries holding only
+    ordered ID lists. Overlapping queries therefore share their objects, and
+    a single object can be refreshed or dropped without touching unrelated
+    queries of its type.
+    
+    With ``cache.backend = "disk"`` or ``"redis"`` a second tier (L2) backs
+    the in-memory tier (L1): writes go through to L2, L1 misses are read
+    from L2 and promoted, and invalidations are applied to both tiers. The
+    Redis tier is shared between API replicas and RQ workers and broadcasts
+    invalidations so every process drops its stale L1 copies.
+    
+    Callers that pass a ``refresh`` loader to get() get stale-while-revalidate
+    (expired entries are served for a per-type window while one background
+    refresh runs) and refresh-ahead (hot keys are reloaded shortly before
+    they expire), so hot reference lookups never wait on NetBox.
     """
     
     def __init__(self, config: NetBoxConfig):
@@ -90,41 +267,260 @@ class CacheManager:
         
         # --- GEMINI'S FIX ---
         # Always initialize self.caches as empty dictionary to prevent AttributeError
-        self.caches = {}
-        self.default_cache = None
+        # Per-endpoint query caches are created on first use from the policy registry
+        self.policies = CachePolicyRegistry(config.cache)
+        self.caches: Dict[str, _IndexedTTLCache] = {}           # endpoint → query cache
+        self._caches_by_type: Dict[str, _IndexedTTLCache] = {}  # object type as callers spell it → query cache
         self.stats = {
             "hits": 0,
             "misses": 0,
             "evictions": 0,
-            "invalidations": 0
+            "invalidations": 0,
+            "l2_hits": 0,
+            "remote_invalidations": 0,
+            "stale_hits": 0,
+            "background_refreshes": 0,
+            "refresh_ahead": 0,
+            "refresh_failures": 0,
+            "coalesced_calls": 0,
+            "negative_hits": 0,
+            "subsumption_hits": 0,
+            "deferred_invalidations": 0,
+            "compressed_values": 0,
+            "compression_input_bytes": 0,
+            "compression_output_bytes": 0
         }
+        self.l2: Optional[Union[DiskCacheStore, RedisCacheStore]] = None
+        
+        # Byte budget shared by every in-memory cache (query entries and entities)
+        self.size_limit_bytes = config.cache.size_limit_mb * 1024 * 1024
+        self.compression_codec = None
+        if config.cache.compression:
+            self.compression_codec = "zstd" if ZSTD_AVAILABLE else "zlib"
+            if ZSTD_AVAILABLE:
+                self._zstd_compressor = zstandard.ZstdCompressor()
+                self._zstd_decompressor = zstandard.ZstdDecompressor()
+        self._subscriber = None
         
         # Add thread safety lock
         self.lock = threading.Lock()
         
+        # Reverse indexes for O(affected keys) invalidation
+        self._type_index: Dict[str, set] = {}     # object type → all keys
+        self._list_index: Dict[str, set] = {}     # object type → keys holding result lists
+        self._object_index: Dict[tuple, set] = {} # (object type, id) → keys containing the object
+        self._key_refs: Dict[str, tuple] = {}     # key → (object type, contained ids)
+        self._freshness: Dict[str, tuple] = {}    # key → (stored at, fresh until)
+        self._key_hits: Dict[str, int] = {}       # key → hits since it was stored
+        
+        # Background revalidation (stale-while-revalidate, refresh-ahead)
+        self._refreshing: set = set()
+        self._refresh_pool: Optional[ThreadPoolExecutor] = None
+        self._invalidation_epoch = 0
+        
+        # Hits served without the lock, applied to stats and LRU order on the next locked operation
+        self._read_buffer: deque = deque()
+        self._refresh_ahead_window = (
+            config.cache.refresh_ahead_window if config.cache.refresh_ahead_hits_per_minute > 0 else 0
+        )
+        
+        # Invalidations deferred by deferred_invalidation() blocks, per thread
+        self._deferred = threading.local()
+        
+        # Single-flight registry: cache key → upstream read in progress
+        self._inflight: Dict[str, _Flight] = {}
+        
+        # Negative cache: object type → {cache key → filter params that found nothing}
+        self._negative: Dict[str, TTLCache] = {}
+        
+        # Normalized entity store: object type → {id: serialized object}
+        self._entities: Dict[str, TTLCache] = {}
+        
         if self.enabled:
-            logger.info("Cache is enabled. Initializing per-type TTL caches.")
-            
-            # Create TTL caches for each object type with specific TTLs
-            object_types = [
-                ("dcim.manufacturer", config.cache.ttl.manufacturers),
-                ("dcim.site", config.cache.ttl.sites),
-                ("dcim.device_role", config.cache.ttl.device_roles),
-                ("dcim.device_type", config.cache.ttl.device_types),
-                ("dcim.device", config.cache.ttl.devices)
-            ]
+            logger.info("Cache is enabled. Per-endpoint caches are created on first use.")
             
-            for obj_type, ttl in object_types:
-                cache_size = config.cache.max_items // len(object_types) if object_types else config.cache.max_items
-                self.caches[obj_type] = TTLCache(maxsize=cache_size, ttl=ttl)
+            self._open_l2()
             
-            # Default cache for other object types
-            self.default_cache = TTLCache(maxsize=config.cache.max_items // 4, ttl=config.cache.ttl.default)
-            
-            logger.info(f"Cache initialized: enabled={self.enabled}, max_items={config.cache.max_items}, caches={len(self.caches)}")
+            logger.info(f"Cache initialized: enabled={self.enabled}, size_limit_mb={config.cache.size_limit_mb}, "
+                        f"endpoint overrides={len(config.cache.endpoints)}")
         else:
             logger.info("Cache disabled by configuration")
     
+    def _new_cache(self, ttl: float, max_entries: int, on_remove=None, swr: float = 0) -> _IndexedTTLCache:
+        """Build an in-memory cache sized in bytes against the shared budget."""
+        return _IndexedTTLCache(
+            maxsize=self.size_limit_bytes, ttl=ttl, on_remove=on_remove, on_evict=self._count_eviction,
+            max_entries=max_entries, swr=swr, getsizeof=self._sizeof
+        )
+    
+    def _cache_for(self, object_type: str) -> _IndexedTTLCache:
+        """Get or lazily create the query cache of an endpoint (caller holds the lock)."""
+        cache = self._caches_by_type.get(object_type)
+        if cache is None:
+            policy = self.policies.policy_for(object_type)
+            cache = self.caches.get(policy.endpoint)
+            if cache is None:
+                cache = self._new_cache(
+                    policy.ttl, policy.max_items, on_remove=self._unindex_key, swr=policy.stale_while_revalidate
+                )
+                self.caches[policy.endpoint] = cache
+                logger.debug("Cache created for %s: %s", policy.endpoint, policy)
+            self._caches_by_type[object_type] = cache
+        return cache
+    
+    def _count_eviction(self, key) -> None:
+        """Count an LRU eviction (called with the lock held)."""
+        self.stats["evictions"] += 1
+    
+    @staticmethod
+    def _sizeof(value: Any) -> int:
+        """Approximate memory cost of a stored value as its serialized size in bytes."""
+        if isinstance(value, _Compressed):
+            return len(value.data)
+        if isinstance(value, _EntityRef):
+            return 64 + 8 * len(value.ids)
+        return len(json.dumps(value, separators=(",", ":"), default=str))
+    
+    def _pack(self, value: Any) -> Any:
+        """Freeze a value, compressing it if compression is enabled and it exceeds the threshold."""
+        value = freeze(value)
+        if self.compression_codec is None:
+            return value
+        
+        raw = json.dumps(value, separators=(",", ":"), default=str).encode()
+        if len(raw) < self.config.cache.compression_threshold_bytes:
+            return value
+        
+        if self.compression_codec == "zstd":
+            data = self._zstd_compressor.compress(raw)
+        else:
+            data = zlib.compress(raw, 6)
+        if len(data) >= len(raw):
+            return value
+        
+        self.stats["compressed_values"] += 1
+        self.stats["compression_input_bytes"] += len(raw)
+        self.stats["compression_output_bytes"] += len(data)
+        return _Compressed(data, self.compression_codec, len(raw))
+    
+    def _unpack(self, value: Any) -> Any:
+        """Decode a value stored by _pack(); stored lists are handed out as fresh lists."""
+        if not isinstance(value, _Compressed):
+            return list(value) if isinstance(value, list) else value
+        if value.codec == "zstd":
+            raw = self._zstd_decompressor.decompress(value.data)
+        else:
+            raw = zlib.decompress(value.data)
+        return freeze_result(json.loads(raw))
+    
+    def _all_caches(self) -> List[TTLCache]:
+        """Every in-memory cache that draws from the byte budget."""
+        return list(self.caches.values()) + list(self._entities.values())
+    
+    def _enforce_budget(self, object_type: Optional[str] = None) -> None:
+        """
+        Evict until all in-memory caches fit in size_limit_mb (caller holds the lock).
+        
+        Victims are the least recently used entries of the cache holding the
+        most bytes, so one type with large listings cannot crowd out small,
+        long-lived types such as manufacturers. With ``object_type`` the
+        endpoint's own size budget (query cache plus entity store) is enforced
+        as well.
+        """
+        self._evict_until(self._all_caches(), self.size_limit_bytes)
+        
+        if object_type is not None:
+            policy = self.policies.policy_for(object_type)
+            if policy.size_limit_bytes < self.size_limit_bytes:
+                endpoint_caches = [
+                    cache for cache in (self._caches_by_type.get(object_type), self._entities.get(object_type))
+                    if cache is not None
+                ]
+                self._evict_until(endpoint_caches, policy.size_limit_bytes)
+    
+    @staticmethod
+    def _evict_until(caches: List[TTLCache], limit: int) -> None:
+        """Pop LRU entries from the largest of ``caches`` until they hold at most ``limit`` bytes."""
+        total = sum(cache.currsize for cache in caches)
+        while total > limit:
+            victim = max(caches, key=lambda cache: cache.currsize)
+            if not victim:
+                break
+            before = victim.currsize
+            victim.popitem()
+            total -= before - victim.currsize
+    
+    def _open_l2(self) -> None:
+        """Attach the configured second-tier store, falling back to memory only."""
+        cache_config = self.config.cache
+        
+        if cache_config.backend == "disk":
+            try:
+                self.l2 = DiskCacheStore(cache_config.path, read_only=cache_config.read_only)
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"Disk cache unavailable at {cache_config.path}, using memory only: {e}")
+        
+        elif cache_config.backend == "redis":
+            try:
+                self.l2 = RedisCacheStore(
+                    cache_config.redis_url, prefix=cache_config.redis_prefix, read_only=cache_config.read_only
+                )
+                self._subscriber = self.l2.subscribe(self._on_remote_invalidation)
+            except Exception as e:
+                self.l2 = None
+                logger.warning(f"Redis cache unavailable, using memory only: {e}")
+    
+    def close(self) -> None:
+        """Stop background refreshes and remote invalidations and release the L2 store."""
+        if self._refresh_pool is not None:
+            self._refresh_pool.shutdown(wait=False, cancel_futures=True)
+            self._refresh_pool = None
+        if self._subscriber is not None:
+            self._subscriber.stop()
+            self._subscriber = None
+        if self.l2 is not None:
+            self.l2.close()
+            self.l2 = None
+    
+    def _broadcast(self, message: Dict[str, Any]) -> None:
+        """Tell other processes sharing the L2 tier to drop their L1 copies."""
+        if self.l2 is not None and self.l2.broadcasts_invalidations:
+            try:
+                self.l2.publish(message)
+            except Exception as e:
+                logger.warning(f"Cache invalidation broadcast failed: {e}")
+    
+    def _on_remote_invalidation(self, message: Dict[str, Any]) -> None:
+        """Apply an invalidation published by another process to the L1 tier only."""
+        op = message.get("op")
+        try:
+            if op == "pattern":
+                self._invalidate_pattern_local(message["pattern"])
+            elif op == "object":
+                self._invalidate_object_local(message["object_type"], [message["object_id"]])
+            elif op == "objects":
+                self._invalidate_object_local(message["object_type"], message["object_ids"])
+            elif op == "queries":
+                self._invalidate_queries_local(message["object_type"], message["fields"])
+            elif op == "matching":
+                self._invalidate_matching_local(message["object_type"], message["versions"])
+            elif op == "entity":
+                self._update_entity_local(message["object_type"], message["object"])
+            elif op == "negative":
+                self._invalidate_negative_local(message["object_type"], message["object"])
+            elif op == "clear":
+                self._clear_local()
+            else:
+                logger.warning(f"Ignoring unknown cache invalidation message: {message}")
+                return
+        except Exception as e:
+            # Runs on the listener thread; never let one bad message stop it
+            logger.warning(f"Remote cache invalidation failed for {message}: {e}")
+            return
+        
+        with self.lock:
+            self.stats["remote_invalidations"] += 1
+    
     def generate_cache_key(self, object_type: str, **kwargs) -> str:
         """
         Generate standardized cache key following Gemini's schema.
@@ -149,81 +545,594 @@ class CacheManager:
         return f"{object_type}:{param_str}" if param_str else object_type
     
     def get_ttl_for_object_type(self, object_type: str) -> int:
-        """Get TTL for specific object type from configuration."""
-        type_mapping = {
-            "dcim.manufacturer": self.config.cache.ttl.manufacturers,
-            "dcim.site": self.config.cache.ttl.sites,
-            "dcim.devicerole": self.config.cache.ttl.device_roles,
-            "dcim.devicetype": self.config.cache.ttl.device_types,
-            "dcim.device": self.config.cache.ttl.devices,
-            "ipam.ipaddress": self.config.cache.ttl.ip_addresses,
-            "dcim.interface": self.config.cache.ttl.device_interfaces,
-            "ipam.vlan": self.config.cache.ttl.vlans,
-            "status": self.config.cache.ttl.status,
-            "health": self.config.cache.ttl.health
-        }
+        """Get TTL for specific object type from its endpoint policy."""
+        return self.policies.policy_for(object_type).ttl
+    
+    @staticmethod
+    def _normalize_object_type(object_type: str) -> str:
+        """Normalize an object type to the endpoint spelling used in cache keys."""
+        return normalize_endpoint(object_type)
+    
+    @staticmethod
+    def _contained_ids(value: Any) -> tuple:
+        """Extract the IDs of the NetBox objects held in a cached value."""
+        if isinstance(value, list):
+            return tuple(item["id"] for item in value if isinstance(item, dict) and "id" in item)
+        if isinstance(value, dict) and "id" in value:
+            return (value["id"],)
+        return ()
+    
+    def _index_key(self, cache_key: str, value: Any, object_type: str) -> None:
+        """Register a stored key in the reverse indexes (caller holds the lock)."""
+        ids = self._contained_ids(value)
+        self._key_refs[cache_key] = (object_type, ids)
+        self._type_index.setdefault(object_type, set()).add(cache_key)
+        if isinstance(value, list):
+            self._list_index.setdefault(object_type, set()).add(cache_key)
+        for obj_id in ids:
+            self._object_index.setdefault((object_type, obj_id), set()).add(cache_key)
+    
+    def _unindex_key(self, cache_key: str) -> None:
+        """Remove a key from the reverse indexes (caller holds the lock)."""
+        self._freshness.pop(cache_key, None)
+        self._key_hits.pop(cache_key, None)
+        refs = self._key_refs.pop(cache_key, None)
+        if refs is None:
+            return
+        object_type, ids = refs
+        self._type_index.get(object_type, set()).discard(cache_key)
+        self._list_index.get(object_type, set()).discard(cache_key)
+        for obj_id in ids:
+            keys = self._object_index.get((object_type, obj_id))
+            if keys is not None:
+                keys.discard(cache_key)
+                if not keys:
+                    del self._object_index[(object_type, obj_id)]
+    
+    def _remove_keys(self, keys) -> int:
+        """Delete indexed keys from their caches (caller holds the lock)."""
+        removed = 0
+        for key in list(keys):
+            refs = self._key_refs.get(key)
+            if refs is None:
+                continue
+            cache = self._caches_by_type.get(refs[0])
+            self._unindex_key(key)
+            if cache is not None and key in cache:
+                cache.pop(key)
+                self.stats["invalidations"] += 1
+                removed += 1
+        return removed
+    
+    def _entity_cache(self, object_type: str) -> TTLCache:
+        """Get or lazily create the entity store for an object type (caller holds the lock)."""
+        entity_cache = self._entities.get(object_type)
+        if entity_cache is None:
+            query_cache = self._cache_for(object_type)
+            entity_cache = self._new_cache(query_cache.fresh_ttl, self.config.cache.max_entities, swr=query_cache.swr)
+            self._entities[object_type] = entity_cache
+        return entity_cache
+    
+    def _normalize_value(self, value: Any, object_type: str) -> Any:
+        """
+        Move serialized objects into the entity store and return the query entry.
+        
+        Values that are not NetBox objects (counts, empty results, records
+        without an ID) are stored unchanged.
+        """
+        if isinstance(value, dict) and "id" in value:
+            self._entity_cache(object_type)[value["id"]] = self._pack(value)
+            return _EntityRef(object_type, (value["id"],), single=True)
+        
+        if value and isinstance(value, list) and all(isinstance(item, dict) and "id" in item for item in value):
+            entity_cache = self._entity_cache(object_type)
+            for item in value:
+                entity_cache[item["id"]] = self._pack(item)
+            return _EntityRef(object_type, tuple(item["id"] for item in value))
+        
+        return self._pack(value)
+    
+    def _resolve(self, entry: Any, published: bool = False) -> Optional[Any]:
+        """
+        Materialize a query entry from the entity store.
+        
+        Returns None if any referenced entity has been evicted or invalidated,
+        in which case the query entry can no longer be answered from cache.
+        With ``published`` the entities are read from the lock-free snapshots.
+        """
+        if not isinstance(entry, _EntityRef):
+            return self._unpack(entry)
+        
+        entity_cache = self._entities.get(entry.object_type)
+        if entity_cache is None:
+            return None
+        
+        lookup = entity_cache.snapshot.get if published else entity_cache.get
+        objects = []
+        for obj_id in entry.ids:
+            obj = lookup(obj_id)
+            if obj is None:
+                return None
+            objects.append(self._unpack(obj))
+        
+        return objects[0] if entry.single else objects
+    
+    def update_entity(self, object_type: str, obj: Dict[str, Any]) -> bool:
+        """
+        Refresh a cached object in place.
+        
+        Every query entry referencing the object immediately sees the new
+        version. Objects that are not cached are ignored.
+        
+        Args:
+            object_type: NetBox object type (e.g., "dcim.devices")
+            obj: Fresh serialized object (must contain "id")
+            
+        Returns:
+            True if a cached copy was replaced
+        """
+        if not self.enabled or not isinstance(obj, dict) or "id" not in obj:
+            return False
+        
+        replaced = self._update_entity_local(object_type, obj)
         
-        return type_mapping.get(object_type, self.config.cache.ttl.default)
+        # L2 entries embed the old version; drop them so no process reads it back
+        if self.l2 is not None:
+            for indexed_type in {object_type, self._normalize_object_type(object_type)}:
+                self.l2.delete_for_object(indexed_type, obj["id"])
+        self._broadcast({"op": "entity", "object_type": object_type, "object": obj})
+        return replaced
     
-    def get(self, cache_key: str, object_type: str) -> Optional[Any]:
-        """Get item from cache with metrics tracking."""
+    def _update_entity_local(self, object_type: str, obj: Dict[str, Any]) -> bool:
+        """Replace the L1 copy of an object if it is cached."""
+        replaced = False
+        with self.lock:
+            for indexed_type in {object_type, self._normalize_object_type(object_type)}:
+                entity_cache = self._entities.get(indexed_type)
+                if entity_cache is not None and obj["id"] in entity_cache:
+                    entity_cache[obj["id"]] = self._pack(obj)
+                    replaced = True
+                # Projected results hold their own partial copy of the object
+                self._remove_keys([
+                    key for key in self._object_index.get((indexed_type, obj["id"]), ())
+                    if self._is_projected(key, indexed_type)
+                ])
+            if replaced:
+                self._enforce_budget(object_type)
+        return replaced
+    
+    def _store(
+        self, cache: _IndexedTTLCache, cache_key: str, value: Any, object_type: str, fresh_for: Optional[float] = None
+    ) -> None:
+        """Store in the in-memory TTL cache and refresh the reverse indexes (caller holds the lock)."""
+        self._unindex_key(cache_key)
+        # Index first: storing can expire or evict entries, including this one
+        self._index_key(cache_key, value, object_type)
+        now = time.time()
+        self._freshness[cache_key] = (now, now + (cache.fresh_ttl if fresh_for is None else fresh_for))
+        negatives = self._negative.get(self._normalize_object_type(object_type))
+        if negatives:
+            negatives.pop(cache_key, None)
+        try:
+            if self._is_projected(cache_key, object_type):
+                # Partial objects must not replace the full copies in the entity store
+                cache[cache_key] = self._pack(value)
+            else:
+                cache[cache_key] = self._normalize_value(value, object_type)
+        except ValueError:
+            # Larger than the whole byte budget: serve it uncached
+            self._unindex_key(cache_key)
+            cache.pop(cache_key, None)
+            logger.debug("Cache SET SKIPPED: %s exceeds size_limit_mb", cache_key)
+            return
+        self._enforce_budget(object_type)
+    
+    def get(
+        self, cache_key: str, object_type: str, refresh: Optional[Callable[[], Any]] = None
+    ) -> Optional[Any]:
+        """
+        Get item from cache with metrics tracking.
+        
+        Args:
+            cache_key: Cache key
+            object_type: NetBox object type the key belongs to
+            refresh: Loader returning a fresh value for the key. Enables
+                stale-while-revalidate and refresh-ahead; without it expired
+                entries are misses.
+            
+        Returns:
+            Cached value or None on a miss
+        """
         if not self.enabled:
             return None
         
         try:
+            # Lock-free fast path: fresh entries are read from the published snapshots
+            cache = self._caches_by_type.get(object_type)
+            if cache is not None:
+                entry = cache.snapshot.get(cache_key)
+                freshness = self._freshness.get(cache_key)
+                if entry is not None and freshness is not None:
+                    stored_at, fresh_until = freshness
+                    if refresh is not None:
+                        # Hits inside the refresh-ahead window take the locked path
+                        fresh_until -= (fresh_until - stored_at) * self._refresh_ahead_window
+                    if time.time() < fresh_until:
+                        value = self._resolve(entry, published=True)
+                        if value is not None:
+                            self._record_read(cache, cache_key)
+                            logger.debug("Cache HIT: %s", cache_key)
+                            return value
+            
             # Thread-safe cache access
             with self.lock:
-                # Get appropriate cache for object type
-                cache = self.caches.get(object_type, self.default_cache)
+                self._drain_reads()
                 if cache is None:
-                    self.stats["misses"] += 1
-                    return None
+                    cache = self._cache_for(object_type)
                 
-                # Check if item exists and is not expired
-                if cache_key in cache:
+                now = time.time()
+                stored_at, fresh_until = self._freshness.get(cache_key, (now, now))
+                stale = now >= fresh_until
+                if cache_key in cache and (now >= fresh_until + cache.swr or (stale and refresh is None)):
+                    # Past the stale window, or nobody can revalidate it
+                    self._unindex_key(cache_key)
+                    cache.pop(cache_key)
+                
+                # Check if item exists, is not expired and all its entities are still cached
+                value = self._resolve(cache[cache_key]) if cache_key in cache else None
+                if value is not None:
                     self.stats["hits"] += 1
-                    logger.debug(f"Cache HIT: {cache_key}")
-                    return cache[cache_key]
-                else:
+                    cache.hits += 1
+                    hits = self._key_hits[cache_key] = self._key_hits.get(cache_key, 0) + 1
+                    if stale:
+                        self.stats["stale_hits"] += 1
+                        logger.debug("Cache STALE HIT: %s", cache_key)
+                        self._schedule_refresh(cache_key, object_type, refresh)
+                    elif refresh is not None and self._wants_refresh_ahead(now, stored_at, fresh_until, hits):
+                        self.stats["refresh_ahead"] += 1
+                        self._schedule_refresh(cache_key, object_type, refresh)
+                    else:
+                        logger.debug("Cache HIT: %s", cache_key)
+                    return value
+                if cache_key in cache:
+                    # Stale reference to an evicted/invalidated entity
+                    self._unindex_key(cache_key)
+                    cache.pop(cache_key)
+                if self.l2 is None:
                     self.stats["misses"] += 1
-                    logger.debug(f"Cache MISS: {cache_key}")
+                    cache.misses += 1
+                    logger.debug("Cache MISS: %s", cache_key)
                     return None
+            
+            # L1 miss: fall back to the second tier outside the lock
+            entry = self.l2.get_entry(cache_key)
+            with self.lock:
+                if entry is None:
+                    self.stats["misses"] += 1
+                    cache.misses += 1
+                    logger.debug("Cache MISS: %s", cache_key)
+                    return None
+                
+                value, remaining_ttl = entry
+                value = freeze_result(value)
+                self.stats["hits"] += 1
+                self.stats["l2_hits"] += 1
+                cache.hits += 1
+                # Promote to L1, going stale with the L2 entry rather than a fresh memory TTL
+                self._store(cache, cache_key, value, object_type, fresh_for=min(remaining_ttl, cache.fresh_ttl))
+                logger.debug("Cache L2 HIT: %s", cache_key)
+                return value
                 
         except Exception as e:
             logger.warning(f"Cache get error for key {cache_key}: {e}")
             return None
     
+    def peek(self, cache_key: str, object_type: str) -> Optional[Any]:
+        """
+        Read a fresh in-memory entry without counting it or touching LRU order.
+        
+        Args:
+            cache_key: Cache key
+            object_type: NetBox object type the key belongs to
+            
+        Returns:
+            Cached value, or None if it is missing, stale or only in the L2 tier
+        """
+        cache = self._caches_by_type.get(object_type)
+        if cache is None:
+            return None
+        entry = cache.snapshot.get(cache_key)
+        freshness = self._freshness.get(cache_key)
+        if entry is None or freshness is None or time.time() >= freshness[1]:
+            return None
+        return self._resolve(entry, published=True)
+    
+    def subsume(self, object_type: str, params: Dict[str, Any]) -> Optional[list]:
+        """
+        Answer a filter from the cached complete result of a broader filter.
+        
+        Every cached filter whose parameters are a subset of ``params`` is a
+        superset of the requested result; the narrowest one whose remaining
+        predicates can be evaluated locally is filtered in memory. A cached
+        "not found" for a broader filter answers with an empty list.
+        
+        Args:
+            object_type: NetBox object type (e.g., "dcim.devices")
+            params: Filter parameters of the request (without limit/offset)
+            
+        Returns:
+            Matching records in API order, or None if no cached superset applies
+        """
+        params = {name: value for name, value in params.items() if value is not None}
+        if not self.enabled or not params:
+            return None
+        
+        negatives = self._negative.get(self._normalize_object_type(object_type))
+        for subset in superset_candidates(params):
+            predicate = compile_filter({name: value for name, value in params.items() if name not in subset})
+            if predicate is None:
+                continue
+            
+            superset_key = self.generate_cache_key(object_type, **subset)
+            superset = self.peek(superset_key, object_type)
+            if superset is None:
+                if negatives is not None and superset_key in negatives:
+                    result = []
+                else:
+                    continue
+            elif not isinstance(superset, list):
+                continue
+            else:
+                try:
+                    result = [record for record in superset if predicate(record)]
+                except Unevaluable as e:
+                    logger.debug("Cache SUBSUMPTION skipped %s: cannot evaluate %s locally", superset_key, e)
+                    continue
+            
+            with self.lock:
+                self.stats["subsumption_hits"] += 1
+            logger.debug("Cache SUBSUMPTION HIT: %s answered from %s", params, superset_key)
+            return result
+        
+        return None
+    
+    def _record_read(self, cache: _IndexedTTLCache, cache_key: str) -> None:
+        """Queue a lock-free hit; drain the queue if it is long and the lock is free."""
+        self._read_buffer.append((cache, cache_key))
+        if len(self._read_buffer) >= 1024 and self.lock.acquire(blocking=False):
+            try:
+                self._drain_reads()
+            finally:
+                self.lock.release()
+    
+    def _drain_reads(self) -> None:
+        """Apply queued lock-free hits to the stats and LRU order (caller holds the lock)."""
+        buffer = self._read_buffer
+        while buffer:
+            try:
+                cache, cache_key = buffer.popleft()
+            except IndexError:
+                break
+            self.stats["hits"] += 1
+            cache.hits += 1
+            if cache_key not in self._key_refs:
+                continue
+            self._key_hits[cache_key] = self._key_hits.get(cache_key, 0) + 1
+            # Lookup moves the key to the most recently used end
+            cache.get(cache_key)
+    
+    def _negative_ttl(self, object_type: str) -> int:
+        """Get the "not found" TTL for an object type from configuration."""
+        return self.policies.policy_for(object_type).negative_ttl
+    
+    def is_negative(self, cache_key: str, object_type: str) -> bool:
+        """
+        Whether a lookup is known to find nothing.
+        
+        Args:
+            cache_key: Cache key of the filter() or get() lookup
+            object_type: NetBox object type the key belongs to
+            
+        Returns:
+            True if the lookup recently returned no objects
+        """
+        if not self.enabled:
+            return False
+        
+        with self.lock:
+            negatives = self._negative.get(self._normalize_object_type(object_type))
+            if negatives is None or cache_key not in negatives:
+                return False
+            self.stats["negative_hits"] += 1
+        
+        logger.debug("Cache NEGATIVE HIT: %s", cache_key)
+        return True
+    
+    def set_negative(self, cache_key: str, object_type: str, params: Dict[str, Any]) -> None:
+        """
+        Remember that a lookup found nothing, for the type's negative TTL.
+        
+        Negative entries live in memory only; they are short-lived and are
+        dropped by invalidate_negative() as soon as a matching object is
+        created or updated through the client.
+        
+        Args:
+            cache_key: Cache key of the filter() or get() lookup
+            object_type: NetBox object type the key belongs to
+            params: Filter parameters of the lookup, used to match new objects
+        """
+        if not self.enabled:
+            return
+        
+        ttl = self._negative_ttl(object_type)
+        if ttl <= 0:
+            return
+        
+        with self.lock:
+            normalized = self._normalize_object_type(object_type)
+            negatives = self._negative.get(normalized)
+            if negatives is None:
+                negatives = self._negative[normalized] = TTLCache(maxsize=self.config.cache.max_items, ttl=ttl)
+            negatives[cache_key] = dict(params)
+    
+    def invalidate_negative(self, object_type: str, obj: Dict[str, Any]) -> int:
+        """
+        Forget "not found" answers that an object now satisfies.
+        
+        Args:
+            object_type: NetBox object type of the created or updated object
+            obj: Serialized object as returned by NetBox
+            
+        Returns:
+            Number of negative entries dropped
+        """
+        if not self.enabled:
+            return 0
+        
+        dropped = self._invalidate_negative_local(object_type, obj)
+        self._broadcast({"op": "negative", "object_type": object_type, "object": obj})
+        return dropped
+    
+    def _invalidate_negative_local(self, object_type: str, obj: Dict[str, Any]) -> int:
+        """Apply a negative-entry invalidation to the L1 tier."""
+        with self.lock:
+            negatives = self._negative.get(self._normalize_object_type(object_type))
+            if not negatives:
+                return 0
+            matched = [key for key, params in list(negatives.items()) if self._could_match(params, obj)]
+            for key in matched:
+                negatives.pop(key, None)
+        
+        if matched:
+            logger.debug("Cache dropped %s negative entries for new %s", len(matched), object_type)
+        return len(matched)
+    
+    @staticmethod
+    def _could_match(params: Dict[str, Any], obj: Dict[str, Any]) -> bool:
+        """
+        Whether an object might satisfy filter parameters.
+        
+        Only scalar fields the object actually carries can rule a match out;
+        lookups on nested or unknown fields ("site_id", "q", "name__ic") are
+        assumed to match, so a negative entry is never kept by mistake. A
+        number compared with a non-numeric value is a related object flattened
+        to its ID (site=3 vs. site="dc1") and cannot rule a match out either.
+        """
+        for name, expected in params.items():
+            actual = obj.get(name)
+            if actual is None or isinstance(actual, (dict, list)):
+                continue
+            if isinstance(actual, int) and not isinstance(actual, bool) and not str(expected).lstrip("-").isdigit():
+                continue
+            if str(actual).lower() != str(expected).lower():
+                return False
+        return True
+    
+    def single_flight(self, cache_key: str, loader: Callable[[], Any]) -> Any:
+        """
+        Run ``loader`` once for all concurrent callers of the same key.
+        
+        The first caller for a key performs the upstream read; callers that
+        arrive while it is in progress wait for it and share its result (or
+        its exception) instead of issuing their own request. The loader is
+        expected to store its result in the cache, so callers arriving after
+        it finishes are answered from cache.
+        
+        Args:
+            cache_key: Cache key identifying the read
+            loader: Performs the read (and caches its result)
+            
+        Returns:
+            The loader's result
+        """
+        with self.lock:
+            flight = self._inflight.get(cache_key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[cache_key] = _Flight()
+            else:
+                self.stats["coalesced_calls"] += 1
+        
+        if not leader:
+            logger.debug("Coalesced with in-flight request: %s", cache_key)
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        
+        try:
+            flight.result = loader()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self.lock:
+                self._inflight.pop(cache_key, None)
+            flight.done.set()
+    
+    def _wants_refresh_ahead(self, now: float, stored_at: float, fresh_until: float, hits: int) -> bool:
+        """Whether a fresh hit on a hot key should trigger an early refresh."""
+        threshold = self.config.cache.refresh_ahead_hits_per_minute
+        ttl = fresh_until - stored_at
+        if threshold <= 0 or ttl <= 0 or fresh_until - now > ttl * self.config.cache.refresh_ahead_window:
+            return False
+        return hits / max(now - stored_at, 1.0) * 60 >= threshold
+    
+    def _schedule_refresh(self, cache_key: str, object_type: str, refresh: Optional[Callable[[], Any]]) -> None:
+        """Reload a key once in the background (caller holds the lock)."""
+        if refresh is None or cache_key in self._refreshing:
+            return
+        
+        self._refreshing.add(cache_key)
+        if self._refresh_pool is None:
+            self._refresh_pool = ThreadPoolExecutor(
+                max_workers=self.config.cache.refresh_workers, thread_name_prefix="netbox-cache-refresh"
+            )
+        epoch = self._invalidation_epoch
+        self._refresh_pool.submit(self._run_refresh, cache_key, object_type, refresh, epoch)
+    
+    def _run_refresh(self, cache_key: str, object_type: str, refresh: Callable[[], Any], epoch: int) -> None:
+        """Fetch a fresh value and store it unless an invalidation raced the fetch."""
+        try:
+            value = refresh()
+            with self.lock:
+                current = epoch == self._invalidation_epoch
+                self.stats["background_refreshes"] += 1
+            
+            if not current:
+                logger.debug("Cache REFRESH DISCARDED (invalidated meanwhile): %s", cache_key)
+            elif value is None:
+                # The object is gone; let the next caller fetch
+                with self.lock:
+                    self._remove_keys([cache_key])
+            else:
+                self.set(cache_key, value, object_type)
+        except Exception as e:
+            with self.lock:
+                self.stats["refresh_failures"] += 1
+            logger.warning(f"Background cache refresh failed for {cache_key}: {e}")
+        finally:
+            with self.lock:
+                self._refreshing.discard(cache_key)
+    
     def set(self, cache_key: str, value: Any, object_type: str) -> None:
         """Set item in cache with object-specific TTL."""
         if not self.enabled:
-            logger.debug(f"Cache SET SKIPPED: cache disabled")
+            logger.debug("Cache SET SKIPPED: cache disabled")
             return
         
         try:
             # Thread-safe cache access
             with self.lock:
-                # Get appropriate cache for object type
-                cache = self.caches.get(object_type) if self.caches else None
-                
-                if cache is None:
-                    # Try default cache as fallback
-                    cache = self.default_cache
-                
-                if cache is None:
-                    logger.warning(f"Cache SET FAILED: no cache found for object_type {object_type}")
-                    logger.debug(f"Available cache types: {list(self.caches.keys()) if self.caches else 'No caches dict'}")
-                    return
-                
-                logger.debug(f"Cache SET ATTEMPT: {cache_key} in {object_type} cache (size before: {len(cache)})")
-                
-                # Store in appropriate TTL cache
-                cache[cache_key] = value
-                
-                logger.debug(f"Cache SET SUCCESS: {cache_key} in {object_type} cache (size after: {len(cache)})")
-                
-                # Get TTL for logging
-                ttl = self.get_ttl_for_object_type(object_type)
-                logger.info(f"Cache SET: {cache_key} (TTL: {ttl}s)")
+                self._drain_reads()
+                cache = self._cache_for(object_type)
+                self._store(cache, cache_key, value, object_type)
+            logger.debug("Cache SET: %s", cache_key)
+            
+            # Write through to the second tier with the same per-type TTL
+            if self.l2 is not None:
+                self.l2.set(cache_key, value, object_type, ttl=cache.fresh_ttl, object_ids=self._contained_ids(value))
             
         except Exception as e:
             logger.error(f"Cache set error for key {cache_key}: {e}", exc_info=True)
@@ -232,130 +1141,548 @@ class CacheManager:
         """
         Invalidate cache entries matching pattern.
         
+        Type patterns ("dcim.device", "ipam.ip_addresses") are resolved through
+        the type index and match every object type they prefix. Patterns with a
+        key suffix ("dcim.devices:site=dc1") only scan the keys of that type.
+        Patterns without an app prefix fall back to a scan of all keys.
+        
         Args:
             pattern: Pattern to match (e.g., "dcim.device" to invalidate all devices)
             
         Returns:
             Number of entries invalidated
         """
-        if not self.enabled:
+        if not self.enabled or self._defer("pattern", pattern):
             return 0
         
         try:
-            total_invalidated = 0
-            
-            # Thread-safe cache access
-            with self.lock:
-                # Check all cache instances
-                all_caches = list(self.caches.values())
-                if self.default_cache:
-                    all_caches.append(self.default_cache)
-                
-                for cache in all_caches:
-                    keys_to_remove = [key for key in cache.keys() if pattern in key]
-                    
-                    for key in keys_to_remove:
-                        del cache[key]
-                        self.stats["invalidations"] += 1
-                        total_invalidated += 1
+            total_invalidated = self._invalidate_pattern_local(pattern)
+            
+            if self.l2 is not None:
+                type_part, separator, suffix = pattern.partition(":")
+                type_part = self._normalize_object_type(type_part)
+                normalized = f"{type_part}{separator}{suffix}"
+                if "." not in type_part:
+                    self.l2.delete_matching(pattern)
+                    self.l2.delete_matching(normalized)
+                elif separator:
+                    self.l2.delete_matching(normalized, object_type=type_part)
+                else:
+                    self.l2.delete_type_prefix(type_part)
+            self._broadcast({"op": "pattern", "pattern": pattern})
             
-            logger.debug(f"Cache invalidated {total_invalidated} entries matching pattern: {pattern}")
+            logger.debug("Cache invalidated %s entries matching pattern: %s", total_invalidated, pattern)
             return total_invalidated
             
         except Exception as e:
             logger.warning(f"Cache invalidation error for pattern {pattern}: {e}")
             return 0
     
+    def _invalidate_pattern_local(self, pattern: str) -> int:
+        """Apply a pattern invalidation to the L1 tier."""
+        type_part, separator, suffix = pattern.partition(":")
+        type_part = self._normalize_object_type(type_part)
+        normalized = f"{type_part}{separator}{suffix}"
+        
+        # Thread-safe cache access
+        with self.lock:
+            self._invalidation_epoch += 1
+            if "." not in type_part:
+                keys_to_remove = [key for key in self._key_refs if pattern in key or normalized in key]
+            elif separator:
+                keys_to_remove = [key for key in self._type_index.get(type_part, ()) if normalized in key]
+            else:
+                matched_types = [
+                    object_type for object_type in set(self._type_index) | set(self._entities)
+                    if self._normalize_object_type(object_type).startswith(type_part)
+                ]
+                keys_to_remove = [key for object_type in matched_types for key in self._type_index.get(object_type, ())]
+                for object_type in matched_types:
+                    self._entities.pop(object_type, None)
+            
+            for negative_type, negatives in self._negative.items():
+                if "." in type_part and not separator:
+                    if negative_type.startswith(type_part):
+                        negatives.clear()
+                else:
+                    for key in [key for key in list(negatives) if pattern in key or normalized in key]:
+                        negatives.pop(key, None)
+            
+            return self._remove_keys(keys_to_remove)
+    
     def invalidate_for_object(self, object_type: str, object_id: int) -> int:
         """
-        Invalidate all cache entries containing a specific object ID.
+        Invalidate a single cached object and the entries containing it.
         
-        This method invalidates all cached queries that might contain the specified object,
-        ensuring data consistency after write operations that affect the object.
+        The object is dropped from the entity store together with the query
+        entries that reference it. Other queries of the same type keep their
+        cached results; use update_entity() to refresh an object in place
+        when its new version is already known.
         
         Args:
-            object_type: NetBox object type (e.g., "dcim.interface", "dcim.device")
+            object_type: NetBox object type (e.g., "dcim.interfaces", "dcim.devices")
             object_id: ID of the object that was modified
             
         Returns:
             Number of cache entries invalidated
         """
-        if not self.enabled:
+        return self.invalidate_for_objects(object_type, [object_id])
+    
+    def invalidate_for_objects(self, object_type: str, object_ids: Iterable[int]) -> int:
+        """
+        Invalidate several cached objects of one type at once.
+        
+        Same effect as invalidate_for_object() per ID, with one lock
+        acquisition, one L2 delete and one broadcast for all of them.
+        
+        Args:
+            object_type: NetBox object type (e.g., "dcim.interfaces", "dcim.devices")
+            object_ids: IDs of the objects that were modified or deleted
+            
+        Returns:
+            Number of cache entries invalidated
+        """
+        object_ids = list(dict.fromkeys(object_ids))
+        if not self.enabled or not object_ids:
+            return 0
+        if getattr(self._deferred, "scope", None) is not None:
+            for object_id in object_ids:
+                self._defer("object", object_type, object_id)
+            return 0
+        
+        try:
+            total_invalidated = self._invalidate_object_local(object_type, object_ids)
+            
+            if self.l2 is not None:
+                for indexed_type in {object_type, self._normalize_object_type(object_type)}:
+                    self.l2.delete_for_objects(indexed_type, object_ids)
+            if len(object_ids) == 1:
+                self._broadcast({"op": "object", "object_type": object_type, "object_id": object_ids[0]})
+            else:
+                self._broadcast({"op": "objects", "object_type": object_type, "object_ids": object_ids})
+            
+            logger.debug("Cache invalidated %s entries for %s %s IDs", total_invalidated, object_type, len(object_ids))
+            return total_invalidated
+            
+        except Exception as e:
+            logger.warning(f"Cache invalidation error for {object_type} IDs {object_ids}: {e}")
+            return 0
+    
+    def _invalidate_object_local(self, object_type: str, object_ids: Iterable[int]) -> int:
+        """Apply an invalidation of objects of one type to the L1 tier."""
+        # Thread-safe cache access
+        with self.lock:
+            self._invalidation_epoch += 1
+            affected = set()
+            for indexed_type in {object_type, self._normalize_object_type(object_type)}:
+                entity_cache = self._entities.get(indexed_type)
+                for object_id in object_ids:
+                    affected |= self._object_index.get((indexed_type, object_id), set())
+                    if entity_cache is not None:
+                        entity_cache.pop(object_id, None)
+            
+            return self._remove_keys(affected)
+    
+    @staticmethod
+    def _filtered_fields(params) -> set:
+        """Field names filter parameters constrain ("site_id__in" → "site")."""
+        fields = set()
+        for name in params:
+            field_name = name.partition("__")[0]
+            fields.add(field_name[:-3] if field_name.endswith("_id") else field_name)
+        return fields
+    
+    def _key_params(self, cache_key: str, object_type: str) -> List[str]:
+        """Parameter names encoded in a cache key ("dcim.devices:count:site=dc1" → ["site"])."""
+        segments = cache_key[len(object_type) + 1:].split(":") if cache_key != object_type else []
+        return [segment.partition("=")[0] for segment in segments if "=" in segment]
+    
+    def _is_projected(self, cache_key: str, object_type: str) -> bool:
+        """Whether a cache key holds partial objects (fields=, brief=, exclude=)."""
+        return not PROJECTION_PARAMS.isdisjoint(self._key_params(cache_key, object_type))
+    
+    def invalidate_queries(self, object_type: str, fields: Optional[List[str]] = None) -> int:
+        """
+        Invalidate the cached queries of a type whose matches may have changed.
+        
+        Lookups by ID keep their entries: which object they return cannot
+        change. Every other query (filters, listings, counts, lookups by
+        name) is dropped, or with ``fields`` only those filtering on one of
+        the fields or using free-text search.
+        
+        Args:
+            object_type: NetBox object type (e.g., "dcim.devices")
+            fields: Fields whose values changed (None when unknown, e.g. for a created object)
+        
+        Returns:
+            Number of cache entries invalidated
+        """
+        if not self.enabled or self._defer("queries", object_type, fields):
+            return 0
+        
+        try:
+            total_invalidated = self._invalidate_queries_local(object_type, fields)
+            
+            if self.l2 is not None:
+                # The L2 tier has no parameter index; match on the key text
+                normalized = self._normalize_object_type(object_type)
+                for indexed_type in {object_type, normalized}:
+                    if fields is None:
+                        self.l2.delete_matching(f"{normalized}", object_type=indexed_type)
+                    else:
+                        for fragment in {":q="} | {f":{field}" for field in self._filtered_fields(fields)}:
+                            self.l2.delete_matching(fragment, object_type=indexed_type)
+            self._broadcast({"op": "queries", "object_type": object_type, "fields": fields})
+            
+            logger.debug("Cache invalidated %s queries of %s (fields: %s)", total_invalidated, object_type, fields)
+            return total_invalidated
+        
+        except Exception as e:
+            logger.warning(f"Cache query invalidation error for {object_type}: {e}")
+            return 0
+    
+    def _invalidate_queries_local(self, object_type: str, fields: Optional[List[str]] = None) -> int:
+        """Apply a query invalidation to the L1 tier."""
+        changed = None if fields is None else self._filtered_fields(fields)
+        with self.lock:
+            self._invalidation_epoch += 1
+            affected = []
+            for indexed_type in {object_type, self._normalize_object_type(object_type)}:
+                for key in self._type_index.get(indexed_type, ()):
+                    params = self._key_params(key, indexed_type)
+                    if params == ["id"] and ":get:" in key:
+                        continue
+                    if changed is None or "q" in params or not changed.isdisjoint(self._filtered_fields(params)):
+                        affected.append(key)
+            
+            return self._remove_keys(affected)
+    
+    def _key_filters(self, cache_key: str, object_type: str) -> Dict[str, str]:
+        """
+        Scalar filters encoded in a cache key ("dcim.devices:count:site=dc1" → {"site": "dc1"}).
+        
+        List values ("status=['active', 'planned']") are left out; a filter
+        that is not compared can never rule a match out.
+        """
+        segments = cache_key[len(object_type) + 1:].split(":") if cache_key != object_type else []
+        filters = {}
+        for segment in segments:
+            name, separator, value = segment.partition("=")
+            if separator and not value.startswith(("[", "(")):
+                filters[name] = value
+        return filters
+    
+    def invalidate_matching(self, object_type: str, versions: List[Dict[str, Any]]) -> int:
+        """
+        Invalidate the cached queries of a type that an object may appear in.
+        
+        A query is dropped if any of the given versions of the object could
+        satisfy its filters: the new version may join its result, the old one
+        may leave it. Queries whose filters rule every version out keep their
+        entries, as do lookups by ID.
+        
+        Args:
+            object_type: NetBox object type (e.g., "dcim.devices")
+            versions: Serialized versions of the written object (old and/or new)
+        
+        Returns:
+            Number of cache entries invalidated
+        """
+        if not self.enabled or self._defer("matching", object_type, versions):
+            return 0
+        
+        try:
+            total_invalidated = self._invalidate_matching_local(object_type, versions)
+        
+            if self.l2 is not None:
+                # The L2 tier has no parameter index; drop the type's queries
+                normalized = self._normalize_object_type(object_type)
+                for indexed_type in {object_type, normalized}:
+                    self.l2.delete_matching(normalized, object_type=indexed_type)
+            self._broadcast({"op": "matching", "object_type": object_type, "versions": versions})
+        
+            logger.debug("Cache invalidated %s queries of %s matching a written object", total_invalidated, object_type)
+            return total_invalidated
+        
+        except Exception as e:
+            logger.warning(f"Cache query invalidation error for {object_type}: {e}")
+            return 0
+    
+    def _invalidate_matching_local(self, object_type: str, versions: List[Dict[str, Any]]) -> int:
+        """Apply a matching-query invalidation to the L1 tier."""
+        with self.lock:
+            self._invalidation_epoch += 1
+            affected = []
+            for indexed_type in {object_type, self._normalize_object_type(object_type)}:
+                for key in self._type_index.get(indexed_type, ()):
+                    filters = self._key_filters(key, indexed_type)
+                    if list(filters) == ["id"] and ":get:" in key:
+                        continue
+                    if any(self._could_match(filters, version) for version in versions):
+                        affected.append(key)
+        
+            return self._remove_keys(affected)
+    
+    def get_entity(self, object_type: str, object_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get the cached copy of an object from the entity store.
+        
+        Args:
+            object_type: NetBox object type (e.g., "dcim.devices")
+            object_id: Object ID
+        
+        Returns:
+            Serialized object, or None if it is not cached
+        """
+        if not self.enabled:
+            return None
+        
+        with self.lock:
+            for indexed_type in {object_type, self._normalize_object_type(object_type)}:
+                entity_cache = self._entities.get(indexed_type)
+                obj = entity_cache.get(object_id) if entity_cache is not None else None
+                if obj is not None:
+                    return self._unpack(obj)
+        return None
+    
+    def write_through(
+        self, object_type: str, obj: Dict[str, Any], previous: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """
+        Cache an object returned by a create or update.
+        
+        Only the queries the object could appear in (in its new version or
+        in ``previous``) are dropped. The object itself replaces any cached
+        copy and is stored under its get-by-ID key, so reading it back right
+        after the write needs no request.
+        
+        Args:
+            object_type: NetBox object type (e.g., "dcim.devices")
+            obj: Serialized object as returned by NetBox (must contain "id")
+            previous: Cached version before an update, if known
+            
+        Returns:
+            Number of cache entries invalidated
+        """
+        return self.write_through_many(object_type, [obj], [] if previous is None else [previous])
+    
+    def write_through_many(
+        self, object_type: str, objects: List[Dict[str, Any]], previous: Optional[List[Dict[str, Any]]] = None
+    ) -> int:
+        """
+        Cache the objects returned by a bulk create or update.
+        
+        Like write_through(), with a single query invalidation for the batch.
+        
+        Args:
+            object_type: NetBox object type (e.g., "dcim.devices")
+            objects: Serialized objects as returned by NetBox
+            previous: Cached versions before an update, where known
+            
+        Returns:
+            Number of cache entries invalidated
+        """
+        objects = [obj for obj in objects if isinstance(obj, dict) and "id" in obj]
+        if not self.enabled or not objects:
             return 0
         
+        invalidated = self.invalidate_matching(object_type, objects + list(previous or []))
+        for obj in objects:
+            self.invalidate_negative(object_type, obj)
+            self.update_entity(object_type, obj)
+            self.set(self.generate_cache_key(f"{object_type}:get", id=obj["id"]), obj, object_type)
+        return invalidated
+    
+    @contextmanager
+    def deferred_invalidation(self) -> Iterator[None]:
+        """
+        Collect this thread's invalidations and apply them once when the block exits.
+        
+        Bulk writes invalidate the same types and objects over and over. Inside
+        the block each distinct pattern, object and query invalidation is
+        recorded once and applied on exit; a type-wide pattern absorbs the
+        narrower invalidations of the types it covers. "Not found" entries are
+        still dropped immediately, so objects created in the block are found
+        by later lookups, but other reads in the block may return entries the
+        block has already made stale. Nested blocks apply with the outermost.
+        
+        Example:
+            with client.cache.deferred_invalidation():
+                for cable in cables:
+                    client.dcim.cables.create(confirm=True, **cable)
+        """
+        if getattr(self._deferred, "scope", None) is not None:
+            yield
+            return
+        
+        scope = self._deferred.scope = _DeferredInvalidations()
         try:
-            total_invalidated = 0
-            
-            # Thread-safe cache access
-            with self.lock:
-                # Check all cache instances
-                all_caches = list(self.caches.values())
-                if self.default_cache:
-                    all_caches.append(self.default_cache)
-                
-                # Invalidate all cache entries that might contain this object
-                # This includes both direct lookups and filtered queries
-                patterns_to_check = [
-                    f"{object_type}:id={object_id}",  # Direct ID lookup
-                    f"{object_type}:",                # Any query for this object type
-                ]
-                
-                for cache in all_caches:
-                    keys_to_remove = []
-                    
-                    for key in cache.keys():
-                        # Check if this cache entry might contain the modified object
-                        for pattern in patterns_to_check:
-                            if pattern in key:
-                                keys_to_remove.append(key)
-                                break
-                    
-                    # Remove identified keys
-                    for key in keys_to_remove:
-                        del cache[key]
-                        self.stats["invalidations"] += 1
-                        total_invalidated += 1
-            
-            logger.debug(f"Cache invalidated {total_invalidated} entries for {object_type} ID {object_id}")
-            return total_invalidated
-            
-        except Exception as e:
-            logger.warning(f"Cache invalidation error for {object_type} ID {object_id}: {e}")
-            return 0
+            yield
+        finally:
+            self._deferred.scope = None
+            self._apply_deferred(scope)
+    
+    def _defer(self, op: str, object_type: str, arg: Any = None) -> bool:
+        """Record an invalidation if a deferred_invalidation() block is active in this thread."""
+        scope = getattr(self._deferred, "scope", None)
+        if scope is None:
+            return False
+        scope.record(op, object_type, arg)
+        with self.lock:
+            self.stats["deferred_invalidations"] += 1
+        return True
+    
+    def _apply_deferred(self, scope: _DeferredInvalidations) -> int:
+        """Apply the invalidations recorded by a deferred_invalidation() block."""
+        type_prefixes = [
+            self._normalize_object_type(pattern) for pattern in scope.patterns
+            if ":" not in pattern and "." in pattern
+        ]
+        
+        def covered(object_type: str) -> bool:
+            normalized = self._normalize_object_type(object_type)
+            return any(normalized.startswith(prefix) for prefix in type_prefixes)
+        
+        total_invalidated = 0
+        for pattern in scope.patterns:
+            if ":" not in pattern or not covered(pattern.partition(":")[0]):
+                total_invalidated += self.invalidate_pattern(pattern)
+        objects_by_type: Dict[str, list] = {}
+        for object_type, object_id in scope.objects:
+            if not covered(object_type):
+                objects_by_type.setdefault(object_type, []).append(object_id)
+        for object_type, object_ids in objects_by_type.items():
+            total_invalidated += self.invalidate_for_objects(object_type, object_ids)
+        for object_type, fields in scope.queries.items():
+            if not covered(object_type):
+                total_invalidated += self.invalidate_queries(object_type, None if fields is None else sorted(fields))
+        for object_type, by_id in scope.matching.items():
+            if not covered(object_type) and not (object_type in scope.queries and scope.queries[object_type] is None):
+                versions = [version for versions in by_id.values() for version in versions]
+                total_invalidated += self.invalidate_matching(object_type, versions)
+        
+        logger.debug("Cache applied deferred invalidations: %s patterns, %s objects, %s entries invalidated",
+                     len(scope.patterns), len(scope.objects), total_invalidated)
+        return total_invalidated
+    
+    def cached_endpoints(self) -> set:
+        """Endpoints that currently hold query entries, objects or "not found" answers."""
+        with self.lock:
+            return {
+                self._normalize_object_type(object_type)
+                for object_type in set(self._type_index) | set(self._entities) | set(self._negative)
+            }
+    
+    def has_object(self, object_type: str, object_id: int) -> bool:
+        """Whether an object is held in the entity store."""
+        with self.lock:
+            return any(
+                object_id in self._entities.get(indexed_type, ())
+                for indexed_type in {object_type, self._normalize_object_type(object_type)}
+            )
     
     def clear(self) -> None:
         """Clear entire cache."""
         if self.enabled:
+            self._clear_local()
             with self.lock:
-                for cache in self.caches.values():
-                    cache.clear()
-                if self.default_cache:
-                    self.default_cache.clear()
                 # Reset stats
-                self.stats.update({"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0})
+                self.stats.update({key: 0 for key in self.stats})
+                for cache in self.caches.values():
+                    cache.hits = cache.misses = 0
+            if self.l2 is not None:
+                self.l2.clear()
+            self._broadcast({"op": "clear"})
             logger.info("Cache cleared")
     
+    def _clear_local(self) -> None:
+        """Drop every L1 entry."""
+        with self.lock:
+            for cache in self.caches.values():
+                cache.clear()
+            self._type_index.clear()
+            self._list_index.clear()
+            self._object_index.clear()
+            self._key_refs.clear()
+            self._freshness.clear()
+            self._key_hits.clear()
+            self._entities.clear()
+            self._negative.clear()
+            self._read_buffer.clear()
+            self._invalidation_epoch += 1
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         if not self.enabled:
             return {"enabled": False}
         
         with self.lock:
+            self._drain_reads()
             total_requests = self.stats["hits"] + self.stats["misses"]
             hit_ratio = (self.stats["hits"] / total_requests * 100) if total_requests > 0 else 0
             
             # Calculate total cache size across all caches
             total_size = sum(len(cache) for cache in self.caches.values())
-            if self.default_cache:
-                total_size += len(self.default_cache)
             
-            return {
+            # Per-endpoint policy and effectiveness
+            policies = self.policies.policies()
+            endpoints = {}
+            for endpoint, cache in sorted(self.caches.items()):
+                policy = policies[endpoint]
+                lookups = cache.hits + cache.misses
+                endpoints[endpoint] = {
+                    "ttl": policy.ttl,
+                    "stale_while_revalidate": policy.stale_while_revalidate,
+                    "negative_ttl": policy.negative_ttl,
+                    "policy_source": policy.source,
+                    "entries": len(cache),
+                    "bytes": cache.currsize + sum(
+                        entity_cache.currsize for object_type, entity_cache in self._entities.items()
+                        if self._normalize_object_type(object_type) == endpoint
+                    ),
+                    "hits": cache.hits,
+                    "misses": cache.misses,
+                    "hit_ratio_percent": round(cache.hits / lookups * 100, 2) if lookups else 0,
+                }
+            
+            # Entity sharing: how many object references the query entries hold
+            # versus how many distinct objects are actually stored
+            entity_count = sum(len(entity_cache) for entity_cache in self._entities.values())
+            entity_references = sum(len(refs[1]) for refs in self._key_refs.values())
+            
+            # Real serialized bytes held in memory against the size_limit_mb budget
+            total_bytes = sum(cache.currsize for cache in self._all_caches())
+            compression_ratio = (
+                self.stats["compression_input_bytes"] / self.stats["compression_output_bytes"]
+                if self.stats["compression_output_bytes"] else 1.0
+            )
+            
+            stats = {
                 "enabled": True,
+                "backend": self.config.cache.backend if self.l2 is not None else "memory",
                 "size": total_size,
                 "max_size": self.config.cache.max_items,
+                "bytes": total_bytes,
+                "size_limit_bytes": self.size_limit_bytes,
+                "compression": self.compression_codec,
+                "compression_ratio": round(compression_ratio, 2),
                 "hit_ratio_percent": round(hit_ratio, 2),
+                "entities": entity_count,
+                "entity_references": entity_references,
+                "in_flight": len(self._inflight),
+                "endpoints": endpoints,
+                "negative_entries": sum(len(negatives) for negatives in self._negative.values()),
                 **self.stats.copy()  # Return copy to avoid external modifications
             }
+        
+        if self.l2 is not None:
+            stats["l2_entries"] = len(self.l2)
+            stats["l2_read_only"] = self.l2.read_only
+            size_bytes = self.l2.size_bytes()
+            if size_bytes is not None:
+                stats["l2_size_bytes"] = size_bytes
+        
+        return stats
 
 
 class EndpointWrapper:
@@ -390,13 +1717,23 @@ class EndpointWrapper:
         
         self.cache = self._client.cache
         
-        logger.debug(f"EndpointWrapper initialized for {self._obj_type}")
+        # Raw-JSON reads skip pynetbox Record construction (see raw_records)
+        self._raw = None
+        if client.config.raw_json_reads and isinstance(endpoint, Endpoint) and not endpoint.api.strict_filters:
+            self._raw = RawEndpoint(endpoint)
+        
+        # Listings are fetched page by page with explicit limit/offset (see paged_fetch)
+        self._paged = isinstance(endpoint, Endpoint)
+        
+        logger.debug("EndpointWrapper initialized for %s", self._obj_type)
     
     def _serialize_result(self, result):
         """
         Serialize pynetbox objects for caching using Gemini's recommended strategy.
         
         Uses pynetbox's built-in serialize() method for complete data integrity.
+        Objects are frozen (see cache_frozen) so the copy handed to the caller
+        is the one stored in the cache.
         
         Args:
             result: pynetbox object or list of objects
@@ -405,18 +1742,124 @@ class EndpointWrapper:
             Serialized dictionary or list of dictionaries
         """
         if isinstance(result, list):
-            return [item.serialize() if hasattr(item, 'serialize') else dict(item) for item in result]
+            return [freeze(item.serialize() if hasattr(item, 'serialize') else dict(item)) for item in result]
         if hasattr(result, 'serialize'):
-            return result.serialize()
+            return freeze(result.serialize())
         return result
     
     def _serialize_single_result(self, result) -> dict:
-        """Serialize a single pynetbox object to dictionary."""
+        """Serialize a single pynetbox object to a read-only dictionary."""
         if hasattr(result, 'serialize'):
-            return result.serialize()
-        return dict(result) if result is not None else {}
+            return freeze(result.serialize())
+        return freeze(dict(result)) if result is not None else {}
+    
+    def _serialize_raw(self, objects: list) -> list:
+        """Serialize API JSON objects to the same read-only dictionaries as _serialize_result()."""
+        return [freeze(self._raw.serialize(data)) for data in objects]
+    
+    def iter_filter(
+        self,
+        *args,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        page_size: Optional[int] = None,
+        **kwargs
+    ) -> Iterator[dict]:
+        """
+        Lazily iterate over filter results, fetching one page at a time.
+        
+        Pages are requested with explicit limit/offset parameters, so NetBox
+        only returns the records that are actually consumed. Iteration stops
+        fetching as soon as the consumer stops, ``limit`` records have been
+        yielded, or the result set is exhausted. Results are not cached.
+        
+        Args:
+            *args: Positional arguments for pynetbox filter() (free-text search)
+            limit: Maximum number of records to yield (None or 0 for no limit)
+            offset: Number of records to skip before the first yielded record
+            page_size: Records per API request (defaults to config.default_page_size)
+            **kwargs: Filter parameters for the query
+            
+        Yields:
+            Serialized object dictionaries in API order
+        """
+        page_size = page_size or self._client.config.default_page_size
+        remaining = limit or None
+        current_offset = offset or 0
+        
+        while remaining is None or remaining > 0:
+            request_size = page_size if remaining is None else min(page_size, remaining)
+            logger.debug("Fetching %s page: limit=%s, offset=%s", self._obj_type, request_size, current_offset)
+            
+            page, total = self._fetch_page(args, kwargs, request_size, current_offset)
+            yield from page
+            
+            current_offset += len(page)
+            if remaining is not None:
+                remaining -= len(page)
+            
+            if len(page) < request_size or (total is not None and current_offset >= total):
+                return
+    
+    def _fetch_page(self, args: tuple, kwargs: Dict[str, Any], limit: int, offset: int) -> tuple:
+        """
+        Fetch and serialize one page of a listing.
+        
+        Returns:
+            The page's serialized objects and the total count NetBox reported
+        """
+        if self._raw is not None:
+            page, total = self._raw.page(self._raw.params(args, kwargs), limit, offset)
+            return self._serialize_raw(page), total
+        record_set = self._endpoint.filter(*args, limit=limit, offset=offset, **kwargs)
+        page = self._serialize_result(list(record_set))
+        return page, getattr(record_set.request, 'count', None)
+    
+    def _fetch_listing(
+        self,
+        args: tuple,
+        kwargs: Dict[str, Any],
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        page_size: Optional[int] = None,
+    ) -> list:
+        """
+        Fetch a listing, or a window of one, with concurrent page requests.
+        
+        The first page returns the total count; the remaining pages are
+        fetched by up to ``fetch.max_workers`` threads (or this endpoint's
+        ``fetch.endpoint_workers`` entry) and reassembled in API order.
+        
+        Args:
+            args: Positional filter arguments (free-text search)
+            kwargs: Filter parameters for the query
+            limit: Maximum number of objects to return (None or 0 for all)
+            offset: Number of objects to skip
+            page_size: Objects per page request (defaults to fetch.page_size)
+            
+        Returns:
+            Serialized objects in API order
+        """
+        return fetch_listing(
+            lambda page_limit, page_offset: self._fetch_page(args, kwargs, page_limit, page_offset),
+            offset=offset or 0,
+            limit=limit or None,
+            page_size=page_size or self._client.config.fetch.page_size,
+            max_workers=self._client.fetch_workers(self._obj_type),
+        )
     
-    def filter(self, *args, no_cache=False, **kwargs) -> list:
+    def filter(
+        self,
+        *args,
+        no_cache=False,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        page_size: Optional[int] = None,
+        fields: Optional[Union[str, List[str]]] = None,
+        brief: bool = False,
+        exclude: Optional[Union[str, List[str]]] = None,
+        **kwargs
+    ) -> list:
         """
         Wrapped filter() method with comprehensive caching and optional cache bypass.
         
@@ -426,49 +1869,182 @@ class EndpointWrapper:
         EXPAND SUPPORT: If 'expand' parameter is used, returns raw pynetbox objects
         to preserve expand functionality, bypassing serialization and caching.
         
+        LIMIT PUSH-DOWN: 'limit' and 'offset' are sent to NetBox instead of
+        slicing a full download, so only the requested window is transferred.
+        
+        PAGED FETCH: listings and windows larger than one page are fetched
+        with concurrent page requests (see _fetch_listing).
+        
+        PROJECTION: 'fields', 'brief' and 'exclude' ask NetBox for a partial
+        representation. Projected results are cached under their own keys and
+        never stand in for full objects; "id" is always part of ``fields``.
+        
         Args:
             *args: Positional arguments for pynetbox filter()
             no_cache: If True, bypass cache and force fresh API call (for conflict detection)
+            limit: Maximum number of objects to return (None or 0 for all)
+            offset: Number of objects to skip (server-side)
+            page_size: Records per API request (defaults to fetch.page_size)
+            fields: Only return these fields (NetBox 4.0+)
+            brief: Return NetBox's brief representation
+            exclude: Fields to leave out, e.g. "config_context"
             **kwargs: Keyword arguments for pynetbox filter()
             
         Returns:
             List of serialized objects from cache or API (or raw objects if expand used)
         """
+        kwargs.update(self._projection(fields, brief, exclude))
+        
         # Check if expand parameter is used - if so, bypass caching and serialization
         if 'expand' in kwargs:
-            logger.debug(f"EXPAND parameter detected for {self._obj_type} - bypassing cache and serialization")
+            logger.debug("EXPAND parameter detected for %s - bypassing cache and serialization", self._obj_type)
+            if limit or offset:
+                kwargs.update(limit=limit, offset=offset)
             # Return raw pynetbox objects to preserve expand functionality
             return list(self._endpoint.filter(*args, **kwargs))
         
-        # Generate cache key from filter parameters (excluding no_cache)
-        filter_kwargs = {k: v for k, v in kwargs.items() if k != 'no_cache'}
-        cache_key = self.cache.generate_cache_key(self._obj_type, **filter_kwargs)
+        # Generate cache key from filter parameters (a free-text search term is part of the key)
+        filter_kwargs = dict(kwargs)
+        key_kwargs = {"q": args[0], **filter_kwargs} if args else dict(filter_kwargs)
+        cache_key = self.cache.generate_cache_key(self._obj_type, **key_kwargs)
+        paginated = bool(limit or offset)
+        window_key = self.cache.generate_cache_key(
+            self._obj_type, **key_kwargs, limit=limit or None, offset=offset or None
+        )
+        
+        def fetch() -> list:
+            if self._paged:
+                return self._fetch_listing(args, filter_kwargs, limit, offset, page_size)
+            if paginated or page_size:
+                return list(self.iter_filter(*args, limit=limit, offset=offset, page_size=page_size, **filter_kwargs))
+            # Serialize for caching (Gemini's obj.serialize() strategy)
+            return self._serialize_result(list(self._endpoint.filter(*args, **filter_kwargs)))
         
         # Check cache first (unless bypassing cache)
         if not no_cache:
-            cached_result = self.cache.get(cache_key, self._obj_type)
+            if self.cache.is_negative(window_key, self._obj_type):
+                return []
+            
+            cached_result = self.cache.get(window_key, self._obj_type, refresh=fetch)
             if cached_result is not None:
-                logger.debug(f"CACHE HIT for {self._obj_type} with key: {cache_key}")
+                logger.debug("CACHE HIT for %s with key: %s", self._obj_type, window_key)
                 return cached_result
+            
+            if paginated:
+                # A cached complete result set can answer any window locally
+                full_result = self.cache.get(cache_key, self._obj_type)
+            else:
+                full_result = None
+            if full_result is None and not args and PROJECTION_PARAMS.isdisjoint(filter_kwargs):
+                # ... and so can the cached complete result of a broader filter
+                full_result = self.cache.subsume(self._obj_type, filter_kwargs)
+            if full_result is not None:
+                start = offset or 0
+                return full_result[start:start + limit] if limit else full_result[start:]
         else:
-            logger.debug(f"CACHE BYPASS requested for {self._obj_type} - forcing fresh API call")
+            logger.debug("CACHE BYPASS requested for %s - forcing fresh API call", self._obj_type)
         
         # Cache miss or bypass: fetch from API
         if no_cache:
-            logger.debug(f"CACHE BYPASS for {self._obj_type}. Fetching fresh from API with params: {filter_kwargs}")
+            logger.debug("CACHE BYPASS for %s. Fetching fresh from API with params: %s", self._obj_type, filter_kwargs)
         else:
-            logger.debug(f"CACHE MISS for {self._obj_type}. Fetching from API with params: {filter_kwargs}")
+            logger.debug("CACHE MISS for %s. Fetching from API with params: %s", self._obj_type, filter_kwargs)
+        
+        def fetch_and_store() -> list:
+            serialized_result = fetch()
+            # Store in cache (always store, even for no_cache requests to benefit subsequent calls)
+            if not serialized_result:
+                # Misses (typically misspelled names) are remembered with a short TTL
+                self.cache.set_negative(window_key, self._obj_type, key_kwargs)
+                return serialized_result
+            self.cache.set(window_key, serialized_result, self._obj_type)
+            logger.debug("Cached %s objects for %s", len(serialized_result), self._obj_type)
+            return serialized_result
         
-        live_result = list(self._endpoint.filter(*args, **filter_kwargs))
+        if no_cache:
+            # A bypass must not share a read that started before it was asked for
+            return fetch_and_store()
+        # Concurrent identical misses share one upstream request
+        return self.cache.single_flight(window_key, fetch_and_store)
+    
+    @staticmethod
+    def _projection(
+        fields: Optional[Union[str, List[str]]], brief: bool, exclude: Optional[Union[str, List[str]]]
+    ) -> Dict[str, str]:
+        """Query parameters for a partial representation, in a canonical form for cache keys."""
+        projection = {}
+        if fields:
+            names = fields.split(",") if isinstance(fields, str) else fields
+            # The ID keeps projected records indexed for invalidation
+            projection["fields"] = ",".join(sorted({"id", *(name.strip() for name in names)}))
+        if brief:
+            projection["brief"] = "true"
+        if exclude:
+            names = exclude.split(",") if isinstance(exclude, str) else exclude
+            projection["exclude"] = ",".join(sorted(name.strip() for name in names))
+        return projection
+    
+    def prime(self, records: List[dict], lookup_fields: tuple = ("name", "slug")) -> int:
+        """
+        Seed the cache from a complete, unfiltered result set.
         
-        # Serialize for caching (Gemini's obj.serialize() strategy)
-        serialized_result = self._serialize_result(live_result)
+        Stores the full listing under the key filter() uses without
+        parameters, plus the single-field lookups tools use to resolve
+        objects, so ``filter(name=...)``, ``filter(slug=...)`` and
+        ``get(id)`` are answered without an API call.
         
-        # Store in cache (always store, even for no_cache requests to benefit subsequent calls)
-        self.cache.set(cache_key, serialized_result, self._obj_type)
-        logger.debug(f"Cached {len(serialized_result)} objects for {self._obj_type}")
+        Args:
+            records: Every object of this endpoint, serialized, in API order
+            lookup_fields: Fields to seed exact-match filter() entries for
+            
+        Returns:
+            Number of cache entries written
+        """
+        self.cache.set(self.cache.generate_cache_key(self._obj_type), records, self._obj_type)
+        written = 1
+        
+        for field_name in lookup_fields:
+            groups: Dict[Any, list] = {}
+            for record in records:
+                value = record.get(field_name)
+                if value is not None and value != "":
+                    groups.setdefault(value, []).append(record)
+            for value, matches in groups.items():
+                key = self.cache.generate_cache_key(self._obj_type, **{field_name: value})
+                self.cache.set(key, matches, self._obj_type)
+                written += 1
+        
+        for record in records:
+            key = self.cache.generate_cache_key(f"{self._obj_type}:get", id=record["id"])
+            self.cache.set(key, record, self._obj_type)
+            written += 1
+        
+        return written
+    
+    def count(self, *args, **kwargs) -> int:
+        """
+        Count objects matching the filter with a single ``limit=1`` API request.
         
-        return serialized_result
+        Args:
+            *args: Positional arguments for pynetbox count() (free-text search)
+            **kwargs: Filter parameters for the query
+            
+        Returns:
+            Number of matching objects
+        """
+        key_kwargs = {"q": args[0], **kwargs} if args else kwargs
+        cache_key = self.cache.generate_cache_key(f"{self._obj_type}:count", **key_kwargs)
+        
+        cached_result = self.cache.get(cache_key, self._obj_type, refresh=lambda: self._endpoint.count(*args, **kwargs))
+        if cached_result is not None:
+            return cached_result
+        
+        def fetch_and_store() -> int:
+            result = self._endpoint.count(*args, **kwargs)
+            self.cache.set(cache_key, result, self._obj_type)
+            return result
+        
+        return self.cache.single_flight(cache_key, fetch_and_store)
     
     def get(self, *args, **kwargs) -> Optional[dict]:
         """
@@ -481,31 +2057,40 @@ class EndpointWrapper:
         Returns:
             Serialized object dictionary or None if not found
         """
-        # Generate cache key for get operation
-        cache_key = self.cache.generate_cache_key(f"{self._obj_type}:get", **kwargs)
+        # Generate cache key for get operation (a positional ID is part of the key)
+        key_params = {"id": args[0], **kwargs} if args else kwargs
+        cache_key = self.cache.generate_cache_key(f"{self._obj_type}:get", **key_params)
+        
+        def fetch() -> Optional[dict]:
+            if self._raw is not None and args and not kwargs:
+                data = self._raw.get(args[0])
+                return freeze(self._raw.serialize(data)) if data is not None else None
+            live_result = self._endpoint.get(*args, **kwargs)
+            return self._serialize_single_result(live_result) if live_result is not None else None
         
         # Check cache first
-        cached_result = self.cache.get(cache_key, self._obj_type)
+        if self.cache.is_negative(cache_key, self._obj_type):
+            return None
+        cached_result = self.cache.get(cache_key, self._obj_type, refresh=fetch)
         if cached_result is not None:
-            logger.debug(f"CACHE HIT for {self._obj_type}.get() with key: {cache_key}")
+            logger.debug("CACHE HIT for %s.get() with key: %s", self._obj_type, cache_key)
             return cached_result
         
-        # Cache miss: fetch from API
-        logger.debug(f"CACHE MISS for {self._obj_type}.get(). Fetching from API with params: {kwargs}")
-        live_result = self._endpoint.get(*args, **kwargs)
-        
-        if live_result is None:
-            logger.debug(f"No object found for {self._obj_type}.get() with params: {kwargs}")
-            return None
-        
-        # Serialize for caching
-        serialized_result = self._serialize_single_result(live_result)
-        
-        # Store in cache
-        self.cache.set(cache_key, serialized_result, self._obj_type)
-        logger.debug(f"Cached single object for {self._obj_type}")
+        def fetch_and_store() -> Optional[dict]:
+            logger.debug("CACHE MISS for %s.get(). Fetching from API with params: %s", self._obj_type, kwargs)
+            serialized_result = fetch()
+            if serialized_result is None:
+                logger.debug("No object found for %s.get() with params: %s", self._obj_type, kwargs)
+                self.cache.set_negative(cache_key, self._obj_type, key_params)
+                return None
+            
+            # Store in cache
+            self.cache.set(cache_key, serialized_result, self._obj_type)
+            logger.debug("Cached single object for %s", self._obj_type)
+            return serialized_result
         
-        return serialized_result
+        # Cache miss: fetch from API, sharing the request with concurrent identical lookups
+        return self.cache.single_flight(cache_key, fetch_and_store)
     
     def all(self, *args, **kwargs) -> list:
         """
@@ -521,31 +2106,35 @@ class EndpointWrapper:
         # Generate cache key for all operation
         cache_key = self.cache.generate_cache_key(f"{self._obj_type}:all", **kwargs)
         
+        def fetch() -> list:
+            if self._paged and not args and not kwargs:
+                return self._fetch_listing((), {})
+            # Serialize for caching
+            return self._serialize_result(list(self._endpoint.all(*args, **kwargs)))
+        
         # Check cache first
-        cached_result = self.cache.get(cache_key, self._obj_type)
+        cached_result = self.cache.get(cache_key, self._obj_type, refresh=fetch)
         if cached_result is not None:
-            logger.debug(f"CACHE HIT for {self._obj_type}.all() with key: {cache_key}")
+            logger.debug("CACHE HIT for %s.all() with key: %s", self._obj_type, cache_key)
             return cached_result
         
-        # Cache miss: fetch from API
-        logger.debug(f"CACHE MISS for {self._obj_type}.all(). Fetching from API")
-        live_result = list(self._endpoint.all(*args, **kwargs))
-        
-        # Serialize for caching
-        serialized_result = self._serialize_result(live_result)
-        
-        # Store in cache
-        self.cache.set(cache_key, serialized_result, self._obj_type)
-        logger.debug(f"Cached {len(serialized_result)} objects for {self._obj_type}.all()")
+        def fetch_and_store() -> list:
+            logger.debug("CACHE MISS for %s.all(). Fetching from API", self._obj_type)
+            serialized_result = fetch()
+            self.cache.set(cache_key, serialized_result, self._obj_type)
+            logger.debug("Cached %s objects for %s.all()", len(serialized_result), self._obj_type)
+            return serialized_result
         
-        return serialized_result
+        return self.cache.single_flight(cache_key, fetch_and_store)
     
     def create(self, confirm: bool = False, **payload) -> dict:
         """
         Wrapped create() method with comprehensive safety mechanisms.
         
         Implements Gemini's safety strategy with confirm=True enforcement,
-        dry-run integration, and type-based cache invalidation.
+        dry-run integration, and write-through caching of the created object.
+        On endpoints with write coalescing enabled the create is sent together
+        with concurrent creates as one list POST.
         
         Args:
             confirm: Required safety confirmation (must be True)
@@ -556,9 +2145,55 @@ class EndpointWrapper:
             
         Raises:
             NetBoxConfirmationError: If confirm=True not provided
+            NetBoxConnectionError: If the create does not complete within safety.write_timeout
+            NetBoxError: For API or validation errors
+        """
+        return self.wait_for_create(self.submit_create(confirm=confirm, **payload))
+    
+    def wait_for_create(self, future: Future) -> dict:
+        """
+        Wait up to safety.write_timeout seconds for a submit_create() future.
+        
+        Args:
+            future: Future returned by submit_create()
+            
+        Returns:
+            Serialized created object dictionary
+            
+        Raises:
+            NetBoxConnectionError: If the create does not complete in time
             NetBoxError: For API or validation errors
         """
-        # Import exceptions locally to avoid circular imports
+        timeout = self._client.config.safety.write_timeout
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            raise NetBoxConnectionError(
+                f"Create of {self._obj_type} did not complete within {timeout}s; it may still be applied",
+                {"object_type": self._obj_type, "timeout": timeout}
+            )
+    
+    def submit_create(self, confirm: bool = False, **payload) -> Future:
+        """
+        Start a create and return a Future of the serialized created object.
+        
+        Tools creating many objects submit them all before collecting the
+        results, so on endpoints listed in ``safety.write_batch_endpoints``
+        the creates share list POSTs. Elsewhere the object is created before
+        this returns. Collect results with wait_for_create().
+        
+        Args:
+            confirm: Required safety confirmation (must be True)
+            **payload: Object data for creation
+            
+        Returns:
+            Future resolving to the created object or raising its NetBoxError
+            
+        Raises:
+            NetBoxConfirmationError: If confirm=True not provided
+        """
+        future: Future = Future()
+        
         # Check 1: Per-call confirmation requirement (Gemini's safety pattern)
         if not confirm:
             raise NetBoxConfirmationError(
@@ -569,8 +2204,21 @@ class EndpointWrapper:
         if self._client.config.safety.dry_run_mode:
             logger.info(f"[DRY-RUN] Would CREATE {self._obj_type} with payload: {payload}")
             # Return simulated response for dry-run
-            return {"id": "dry-run-generated-id", **payload}
+            future.set_result({"id": "dry-run-generated-id", **payload})
+            return future
+        
+        batcher = self._client.write_batcher(self)
+        if batcher is not None:
+            return batcher.submit(payload)
         
+        try:
+            future.set_result(self._create_now(payload))
+        except NetBoxError as e:
+            future.set_exception(e)
+        return future
+    
+    def _create_now(self, payload: Dict[str, Any]) -> dict:
+        """Create one object with its own POST (safety checks already done)."""
         try:
             # Execute real operation
             logger.info(f"Creating {self._obj_type} with data: {payload}")
@@ -579,9 +2227,9 @@ class EndpointWrapper:
             # Serialize result for return
             serialized_result = self._serialize_single_result(result)
             
-            # Type-based cache invalidation (Gemini's recommended strategy)
-            self._client.cache.invalidate_pattern(self._obj_type)
-            logger.info(f"Cache invalidated for {self._obj_type} after create operation")
+            # Write-through: cache the new object, drop only the queries it could appear in
+            self._client.cache.write_through(self._obj_type, serialized_result)
+            logger.info(f"Cache updated for {self._obj_type} after create operation")
             
             logger.info(f"✅ Successfully created {self._obj_type} with ID: {result.id}")
             return serialized_result
@@ -595,6 +2243,9 @@ class EndpointWrapper:
         """
         Wrapped update() method with comprehensive safety mechanisms.
         
+        Sent as a single PATCH of the given fields; the object is not
+        fetched first.
+        
         Args:
             obj_id: ID of object to update
             confirm: Required safety confirmation (must be True)
@@ -605,6 +2256,7 @@ class EndpointWrapper:
             
         Raises:
             NetBoxConfirmationError: If confirm=True not provided
+            NetBoxNotFoundError: If no object has this ID
             NetBoxError: For API or validation errors
         """
         # Check 1: Per-call confirmation requirement
@@ -619,39 +2271,37 @@ class EndpointWrapper:
             # Return simulated response for dry-run
             return {"id": obj_id, **payload}
         
+        # The cached version, if any, tells write-through which queries the object leaves
+        previous = self._client.cache.get_entity(self._obj_type, obj_id)
         try:
-            # Get the object to update
-            obj_to_update = self._endpoint.get(obj_id)
-            if not obj_to_update:
-                raise NetBoxError(f"{self._obj_type} with ID {obj_id} not found")
-            
-            # Execute update operation
+            # Single PATCH of the given fields, no GET of the full object first
             logger.info(f"Updating {self._obj_type} ID {obj_id} with data: {payload}")
-            
-            # Update the object
-            for key, value in payload.items():
-                setattr(obj_to_update, key, value)
-            obj_to_update.save()
+            result = self._detail_request(obj_id).patch(payload)
             
             # Serialize result
-            serialized_result = self._serialize_single_result(obj_to_update)
-            
-            # Type-based cache invalidation
-            self._client.cache.invalidate_pattern(self._obj_type)
-            logger.info(f"Cache invalidated for {self._obj_type} after update operation")
-            
-            logger.info(f"✅ Successfully updated {self._obj_type} ID {obj_id}")
-            return serialized_result
+            updated = self._endpoint.return_obj(result, self._endpoint.api, self._endpoint)
+            serialized_result = self._serialize_single_result(updated)
             
         except Exception as e:
-            error_msg = f"Failed to update {self._obj_type} ID {obj_id}: {e}"
-            logger.error(error_msg)
-            raise NetBoxError(error_msg)
+            raise self._write_error("update", obj_id, e)
+        
+        if previous is None:
+            # Old version unknown: queries filtering on a written field may have lost the object
+            self._client.cache.invalidate_queries(self._obj_type, list(payload))
+        
+        # Write-through: refresh the cached object, drop only the queries it joined or left
+        self._client.cache.write_through(self._obj_type, serialized_result, previous)
+        logger.info(f"Cache updated for {self._obj_type} after update operation")
+        
+        logger.info(f"✅ Successfully updated {self._obj_type} ID {obj_id}")
+        return serialized_result
     
     def delete(self, obj_id: int, confirm: bool = False) -> bool:
         """
         Wrapped delete() method with comprehensive safety mechanisms.
         
+        Sent as a single DELETE; the object is not fetched first.
+        
         Args:
             obj_id: ID of object to delete
             confirm: Required safety confirmation (must be True)
@@ -661,6 +2311,7 @@ class EndpointWrapper:
             
         Raises:
             NetBoxConfirmationError: If confirm=True not provided
+            NetBoxNotFoundError: If no object has this ID
             NetBoxError: For API or validation errors
         """
         # Check 1: Per-call confirmation requirement
@@ -674,27 +2325,218 @@ class EndpointWrapper:
             logger.info(f"[DRY-RUN] Would DELETE {self._obj_type} ID {obj_id}")
             return True  # Simulated success for dry-run
         
+        previous = self._client.cache.get_entity(self._obj_type, obj_id)
         try:
-            # Get the object to verify it exists
-            obj_to_delete = self._endpoint.get(obj_id)
-            if not obj_to_delete:
-                raise NetBoxError(f"{self._obj_type} with ID {obj_id} not found")
-            
-            # Execute delete operation
+            # Single DELETE, no GET to check the object exists first
             logger.info(f"Deleting {self._obj_type} ID {obj_id}")
-            obj_to_delete.delete()
+            self._detail_request(obj_id).delete()
             
-            # Type-based cache invalidation
-            self._client.cache.invalidate_pattern(self._obj_type)
-            logger.info(f"Cache invalidated for {self._obj_type} after delete operation")
+        except Exception as e:
+            raise self._write_error("delete", obj_id, e)
+        
+        # Drop the object and the queries it could have appeared in
+        self._client.cache.invalidate_for_object(self._obj_type, obj_id)
+        if previous is None:
+            self._client.cache.invalidate_queries(self._obj_type)
+        else:
+            self._client.cache.invalidate_matching(self._obj_type, [previous])
+        logger.info(f"Cache invalidated for {self._obj_type} after delete operation")
+        
+        logger.info(f"✅ Successfully deleted {self._obj_type} ID {obj_id}")
+        return True
+    
+    def _detail_request(self, obj_id: int) -> Request:
+        """pynetbox request for one object's detail URL (.../<obj_id>/)."""
+        api = self._endpoint.api
+        return Request(key=obj_id, base=self._endpoint.url, token=api.token, http_session=api.http_session)
+    
+    def _write_error(self, operation: str, obj_id: int, error: Exception) -> NetBoxError:
+        """Translate a failed write on one object, mapping HTTP 404 to NetBoxNotFoundError."""
+        if isinstance(error, pynetbox.RequestError) and error.req.status_code == 404:
+            error_msg = f"{self._obj_type} with ID {obj_id} not found"
+            logger.error(f"Failed to {operation} {error_msg}")
+            return NetBoxNotFoundError(error_msg)
+        error_msg = f"Failed to {operation} {self._obj_type} ID {obj_id}: {error}"
+        logger.error(error_msg)
+        return NetBoxError(error_msg)
+    
+    def _check_write(self, operation: str, confirm: bool) -> bool:
+        """
+        Enforce confirm=True and report whether the write should be simulated.
+        
+        Returns:
+            True if the global dry-run mode is active
+        """
+        if not confirm:
+            raise NetBoxConfirmationError(
+                f"{operation} operation on {self._obj_type} requires confirm=True"
+            )
+        return self._client.config.safety.dry_run_mode
+    
+    def _chunks(self, items: list) -> Iterator[tuple]:
+        """Split a bulk request into (start index, chunk) pairs of at most max_batch_size items."""
+        size = max(self._client.config.safety.max_batch_size, 1)
+        for start in range(0, len(items), size):
+            yield start, items[start:start + size]
+    
+    def _bulk_report(self, operation: str, requested: int, dry_run: bool = False) -> Dict[str, Any]:
+        """Empty result of a bulk operation."""
+        return {
+            "object_type": self._obj_type,
+            "operation": operation,
+            "requested": requested,
+            "succeeded": 0,
+            "failed": 0,
+            "results": [],
+            "failed_chunks": [],
+            "dry_run": dry_run,
+        }
+    
+    def _chunk_failed(self, report: Dict[str, Any], start: int, chunk: list, error: Exception) -> None:
+        """Record a chunk NetBox rejected; NetBox applies each list request atomically."""
+        logger.error(f"Failed to {report['operation']} {self._obj_type} items {start}-{start + len(chunk) - 1}: {error}")
+        report["failed"] += len(chunk)
+        report["failed_chunks"].append({
+            "start": start,
+            "count": len(chunk),
+            "error": str(error),
+            "error_type": type(error).__name__,
+        })
+    
+    def bulk_create(self, items: List[Dict[str, Any]], confirm: bool = False) -> Dict[str, Any]:
+        """
+        Create many objects with one list POST per chunk.
+        
+        Items are sent in chunks of ``safety.max_batch_size``. NetBox applies
+        each chunk atomically, so a rejected chunk creates nothing and is
+        reported in ``failed_chunks`` while the other chunks proceed.
+        
+        Args:
+            items: Object data for each object to create
+            confirm: Required safety confirmation (must be True)
             
-            logger.info(f"✅ Successfully deleted {self._obj_type} ID {obj_id}")
-            return True
+        Returns:
+            Bulk report with the created objects in ``results``
             
-        except Exception as e:
-            error_msg = f"Failed to delete {self._obj_type} ID {obj_id}: {e}"
-            logger.error(error_msg)
-            raise NetBoxError(error_msg)
+        Raises:
+            NetBoxConfirmationError: If confirm=True not provided
+        """
+        if self._check_write("bulk_create", confirm):
+            logger.info(f"[DRY-RUN] Would CREATE {len(items)} {self._obj_type}")
+            report = self._bulk_report("create", len(items), dry_run=True)
+            report["results"] = [{"id": "dry-run-generated-id", **item} for item in items]
+            report["succeeded"] = len(items)
+            return report
+        
+        report = self._bulk_report("create", len(items))
+        for start, chunk in self._chunks(items):
+            try:
+                logger.info(f"Creating {len(chunk)} {self._obj_type} (items {start}-{start + len(chunk) - 1})")
+                created = self._endpoint.create(chunk)
+            except Exception as e:
+                self._chunk_failed(report, start, chunk, e)
+                continue
+            
+            serialized = self._serialize_result(created if isinstance(created, list) else [created])
+            self._client.cache.write_through_many(self._obj_type, serialized)
+            report["results"].extend(serialized)
+            report["succeeded"] += len(serialized)
+        
+        logger.info(f"✅ Bulk created {report['succeeded']}/{len(items)} {self._obj_type}")
+        return report
+    
+    def bulk_update(self, items: List[Dict[str, Any]], confirm: bool = False) -> Dict[str, Any]:
+        """
+        Update many objects with one list PATCH per chunk.
+        
+        Args:
+            items: Changed fields of each object, each including its "id"
+            confirm: Required safety confirmation (must be True)
+            
+        Returns:
+            Bulk report with the updated objects in ``results``
+            
+        Raises:
+            NetBoxConfirmationError: If confirm=True not provided
+            NetBoxValidationError: If an item has no "id"
+        """
+        missing = [index for index, item in enumerate(items) if "id" not in item]
+        if missing:
+            raise NetBoxValidationError(f"bulk_update items without an id at positions {missing}")
+        
+        if self._check_write("bulk_update", confirm):
+            logger.info(f"[DRY-RUN] Would UPDATE {len(items)} {self._obj_type}")
+            report = self._bulk_report("update", len(items), dry_run=True)
+            report["results"] = [dict(item) for item in items]
+            report["succeeded"] = len(items)
+            return report
+        
+        cache = self._client.cache
+        report = self._bulk_report("update", len(items))
+        for start, chunk in self._chunks(items):
+            previous = [cache.get_entity(self._obj_type, item["id"]) for item in chunk]
+            try:
+                logger.info(f"Updating {len(chunk)} {self._obj_type} (items {start}-{start + len(chunk) - 1})")
+                updated = self._endpoint.update(chunk)
+            except Exception as e:
+                self._chunk_failed(report, start, chunk, e)
+                continue
+            
+            serialized = self._serialize_result(updated if isinstance(updated, list) else [updated])
+            if any(version is None for version in previous):
+                # Old versions unknown: queries filtering on a written field may have lost objects
+                cache.invalidate_queries(self._obj_type, sorted({field for item in chunk for field in item} - {"id"}))
+            cache.write_through_many(self._obj_type, serialized, [version for version in previous if version])
+            report["results"].extend(serialized)
+            report["succeeded"] += len(serialized)
+        
+        logger.info(f"✅ Bulk updated {report['succeeded']}/{len(items)} {self._obj_type}")
+        return report
+    
+    def bulk_delete(self, ids: List[int], confirm: bool = False) -> Dict[str, Any]:
+        """
+        Delete many objects with one list DELETE per chunk.
+        
+        Args:
+            ids: IDs of the objects to delete
+            confirm: Required safety confirmation (must be True)
+            
+        Returns:
+            Bulk report with the deleted IDs in ``results``
+            
+        Raises:
+            NetBoxConfirmationError: If confirm=True not provided
+        """
+        if self._check_write("bulk_delete", confirm):
+            logger.info(f"[DRY-RUN] Would DELETE {len(ids)} {self._obj_type}: {ids}")
+            report = self._bulk_report("delete", len(ids), dry_run=True)
+            report["results"] = list(ids)
+            report["succeeded"] = len(ids)
+            return report
+        
+        cache = self._client.cache
+        report = self._bulk_report("delete", len(ids))
+        # Invalidations of all chunks are applied once, when the block exits
+        with cache.deferred_invalidation():
+            for start, chunk in self._chunks(list(ids)):
+                previous = [cache.get_entity(self._obj_type, obj_id) for obj_id in chunk]
+                try:
+                    logger.info(f"Deleting {len(chunk)} {self._obj_type} (items {start}-{start + len(chunk) - 1})")
+                    self._endpoint.delete(chunk)
+                except Exception as e:
+                    self._chunk_failed(report, start, chunk, e)
+                    continue
+                
+                cache.invalidate_for_objects(self._obj_type, chunk)
+                if any(version is None for version in previous):
+                    cache.invalidate_queries(self._obj_type)
+                else:
+                    cache.invalidate_matching(self._obj_type, previous)
+                report["results"].extend(chunk)
+                report["succeeded"] += len(chunk)
+        
+        logger.info(f"✅ Bulk deleted {report['succeeded']}/{len(ids)} {self._obj_type}")
+        return report
     
     def __call__(self, *args, **kwargs):
         """Make EndpointWrapper callable to handle method calls through the endpoint."""
@@ -729,7 +2571,7 @@ class AppWrapper:
         self._client = client
         self._app_name = getattr(app, 'name', 'unknown')
         
-        logger.debug(f"AppWrapper initialized for app '{self._app_name}'")
+        logger.debug("AppWrapper initialized for app '%s'", self._app_name)
     
     def __getattr__(self, name: str):
         """
@@ -747,7 +2589,7 @@ class AppWrapper:
         Raises:
             AttributeError: If the endpoint doesn't exist on the app
         """
-        logger.debug(f"AppWrapper.__getattr__('{name}') on app '{self._app_name}'")
+        logger.debug("AppWrapper.__getattr__('%s') on app '%s'", name, self._app_name)
         
         try:
             # Attempt to get the endpoint from the pynetbox app
@@ -759,18 +2601,18 @@ class AppWrapper:
                 hasattr(endpoint, 'name') and hasattr(endpoint, 'api') and
                 str(type(endpoint)) == "<class 'pynetbox.core.endpoint.Endpoint'>"):
                 
-                logger.debug(f"Found valid endpoint '{name}' on app '{self._app_name}'")
-                logger.debug(f"Returning EndpointWrapper for '{self._app_name}.{name}'")
+                logger.debug("Found valid endpoint '%s' on app '%s'", name, self._app_name)
+                logger.debug("Returning EndpointWrapper for '%s.%s'", self._app_name, name)
                 
                 # Return wrapped endpoint with app name for proper object type construction
                 return EndpointWrapper(endpoint, self._client, app_name=self._app_name)
             else:
-                logger.debug(f"Object '{name}' on app '{self._app_name}' is not a valid pynetbox Endpoint")
-                logger.debug(f"Object type: {type(endpoint)}")
+                logger.debug("Object '%s' on app '%s' is not a valid pynetbox Endpoint", name, self._app_name)
+                logger.debug("Object type: %s", type(endpoint))
                 
         except AttributeError:
             # Log the attempt for debugging
-            logger.debug(f"Endpoint '{name}' not found on app '{self._app_name}'")
+            logger.debug("Endpoint '%s' not found on app '%s'", name, self._app_name)
         
         # If we reach here, the endpoint doesn't exist or isn't valid
         raise AttributeError(
@@ -817,6 +2659,21 @@ class NetBoxClient:
         
         # Initialize cache manager following Gemini's strategy
         self.cache = CacheManager(config)
+        self.cache_warmer = None  # Set when warm_on_startup prefetch is started
+        self.changelog_poller = None  # Set when changelog-driven invalidation is enabled
+        self.webhook_receiver = None  # Set when a webhook secret is configured
+        
+        # Write coalescing, one batcher per opted-in endpoint (created on first use)
+        self._write_batch_endpoints = {
+            normalize_endpoint(endpoint) for endpoint in config.safety.write_batch_endpoints
+        }
+        self.write_batchers: Dict[str, WriteBatcher] = {}
+        self._write_batchers_lock = threading.Lock()
+        
+        # Concurrent page requests per listing, with per-endpoint overrides
+        self._fetch_workers = {
+            normalize_endpoint(endpoint): workers for endpoint, workers in config.fetch.endpoint_workers.items()
+        }
         
         logger.info(f"Initializing NetBox client for {config.url}")
         
@@ -962,7 +2819,7 @@ class NetBoxClient:
         Raises:
             AttributeError: If the application doesn't exist in the NetBox API
         """
-        logger.debug(f"NetBoxClient.__getattr__('{name}') -> routing to AppWrapper")
+        logger.debug("NetBoxClient.__getattr__('%s') -> routing to AppWrapper", name)
         
         try:
             # Attempt to get the app from the pynetbox API
@@ -970,16 +2827,16 @@ class NetBoxClient:
             
             # Validate that it's actually a pynetbox App
             if hasattr(app, 'name') and hasattr(app, 'models') and str(type(app)) == "<class 'pynetbox.core.app.App'>":
-                logger.debug(f"Found valid NetBox API app '{name}'")
-                logger.debug(f"Returning AppWrapper for '{name}'")
+                logger.debug("Found valid NetBox API app '%s'", name)
+                logger.debug("Returning AppWrapper for '%s'", name)
                 
                 # Return wrapped app for navigation to endpoints
                 return AppWrapper(app, self)
             else:
-                logger.debug(f"Object '{name}' is not a valid pynetbox App")
+                logger.debug("Object '%s' is not a valid pynetbox App", name)
                 
         except AttributeError:
-            logger.debug(f"NetBox API application '{name}' not found")
+            logger.debug("NetBox API application '%s' not found", name)
         
         # If we reach here, the app doesn't exist or isn't valid
         raise AttributeError(
@@ -1012,6 +2869,33 @@ class NetBoxClient:
             logger.warning(f"🔍 DRY-RUN MODE: Would execute {operation} (no actual changes)")
             # Don't raise error, just log - we'll simulate the operation
     
+    def write_batcher(self, endpoint: 'EndpointWrapper') -> Optional[WriteBatcher]:
+        """
+        Return the write batcher for an endpoint, or None if its creates are not coalesced.
+        
+        Args:
+            endpoint: EndpointWrapper about to create an object
+        """
+        object_type = normalize_endpoint(endpoint._obj_type)
+        if object_type not in self._write_batch_endpoints:
+            return None
+        with self._write_batchers_lock:
+            batcher = self.write_batchers.get(object_type)
+            if batcher is None:
+                safety = self.config.safety
+                batcher = WriteBatcher(endpoint, safety.write_batch_window_ms / 1000, safety.write_batch_max_items)
+                self.write_batchers[object_type] = batcher
+            return batcher
+    
+    def fetch_workers(self, object_type: str) -> int:
+        """
+        Return how many pages of a listing may be fetched concurrently.
+        
+        Args:
+            object_type: Endpoint the listing is read from, e.g. "ipam.ip_addresses"
+        """
+        return self._fetch_workers.get(normalize_endpoint(object_type), self.config.fetch.max_workers)
+    
     def _log_write_operation(self, operation: str, object_type: str, data: Dict[str, Any], 
                            result: Any = None, error: Optional[Exception] = None) -> None:
         """
@@ -2407,37 +4291,39 @@ class NetBoxBulkOrchestrator:
         if not self.normalized_data:
             raise NetBoxValidationError("No normalized data available. Call normalize_bulk_data() first.")
         
-        # Process each object type in strict dependency order
-        for obj_type in self.DEPENDENCY_ORDER:
-            if obj_type in self.normalized_data and self.normalized_data[obj_type]:
-                objects = self.normalized_data[obj_type]
-                logger.info(f"Processing {len(objects)} {obj_type}")
-                
-                for obj_data in objects:
-                    try:
-                        result = self._process_object(obj_type, obj_data, confirm)
-                        self._record_result("pass_1", result)
-                        
-                        # Cache full pynetbox object for optimization
-                        obj_name = obj_data["name"]
-                        if result.get("action") in ["created", "updated", "unchanged"]:
-                            obj_key = f"{obj_type}:{obj_name}"
-                            netbox_obj = result.get(obj_type.rstrip('s'))  # Remove 's' from plural
-                            if netbox_obj:
-                                self.object_cache[obj_type][obj_name] = netbox_obj
-                        
-                    except Exception as e:
-                        error_result = {
-                            "object_type": obj_type,
-                            "name": obj_data.get("name", "unknown"),
-                            "error": str(e)
-                        }
-                        self.results["pass_1"]["errors"].append(error_result)
-                        logger.error(f"Pass 1 {obj_type} error: {e}")
-                        
-                        # Continue processing other objects rather than failing entirely
-                        continue
-        
+        # Apply the ensure_*() cache invalidations once, after the whole pass
+        with self.client.cache.deferred_invalidation():
+            # Process each object type in strict dependency order
+            for obj_type in self.DEPENDENCY_ORDER:
+                if obj_type in self.normalized_data and self.normalized_data[obj_type]:
+                    objects = self.normalized_data[obj_type]
+                    logger.info(f"Processing {len(objects)} {obj_type}")
+                    
+                    for obj_data in objects:
+                        try:
+                            result = self._process_object(obj_type, obj_data, confirm)
+                            self._record_result("pass_1", result)
+                            
+                            # Cache full pynetbox object for optimization
+                            obj_name = obj_data["name"]
+                            if result.get("action") in ["created", "updated", "unchanged"]:
+                                obj_key = f"{obj_type}:{obj_name}"
+                                netbox_obj = result.get(obj_type.rstrip('s'))  # Remove 's' from plural
+                                if netbox_obj:
+                                    self.object_cache[obj_type][obj_name] = netbox_obj
+                            
+                        except Exception as e:
+                            error_result = {
+                                "object_type": obj_type,
+                                "name": obj_data.get("name", "unknown"),
+                                "error": str(e)
+                            }
+                            self.results["pass_1"]["errors"].append(error_result)
+                            logger.error(f"Pass 1 {obj_type} error: {e}")
+                            
+                            # Continue processing other objects rather than failing entirely
+                            continue
+            
         # Generate summary
         total_processed = sum(len(self.results["pass_1"][action]) for action in ["created", "updated", "unchanged"])
         total_errors = len(self.results["pass_1"]["errors"])
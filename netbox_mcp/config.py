@@ -13,7 +13,7 @@ Safety-focused configuration with write operation controls and enterprise secret
 
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass, field
 from .secrets import get_secrets_manager, validate_secrets
 
@@ -46,6 +46,12 @@ class SafetyConfig:
     write_timeout: int = 60                 # Timeout for write operations
     max_batch_size: int = 100              # Maximum objects per batch operation
     
+    # Write coalescing: creates on these endpoints (e.g. "dcim.inventory-items")
+    # are buffered briefly and sent as one list POST
+    write_batch_endpoints: List[str] = field(default_factory=list)
+    write_batch_window_ms: int = 20         # Wait this long for more creates
+    write_batch_max_items: int = 50         # Send as soon as this many are waiting
+    
     # Audit and logging
     audit_all_operations: bool = True       # Log all operations (read/write)
     audit_write_details: bool = True        # Detailed logging for write operations
@@ -86,32 +92,134 @@ class CacheTTLConfig:
     default: int = 300                      # 5 minutes default
 
 
+@dataclass
+class CacheSWRConfig:
+    """
+    Stale-while-revalidate windows per object type.
+    
+    After its TTL an entry may still be served for this many seconds while a
+    single background request refreshes it. Static reference data tolerates
+    long windows; 0 disables stale serving for a type.
+    """
+    
+    manufacturers: int = 3600               # 1 hour
+    device_types: int = 3600                # 1 hour
+    sites: int = 600                        # 10 minutes
+    device_roles: int = 3600                # 1 hour
+    devices: int = 60                       # 1 minute
+    
+    # Default for unlisted operations (conservative)
+    default: int = 30                       # 30 seconds
+
+
+@dataclass
+class CacheNegativeTTLConfig:
+    """
+    How long "not found" answers are remembered per object type.
+    
+    Kept short: a lookup that missed must start matching soon after the
+    object is created outside this process. Creates made through the client
+    drop matching entries immediately; 0 disables negative caching for a type.
+    """
+    
+    manufacturers: int = 120                # 2 minutes
+    device_types: int = 120                 # 2 minutes
+    sites: int = 60                         # 1 minute
+    device_roles: int = 120                 # 2 minutes
+    devices: int = 15                       # 15 seconds
+    
+    # Default for unlisted operations (conservative)
+    default: int = 30                       # 30 seconds
+
+
+@dataclass
+class CacheEndpointConfig:
+    """
+    Cache policy overrides for a single endpoint (``cache.endpoints`` entry).
+    
+    Unset fields fall back to the per-type defaults above.
+    """
+    
+    ttl: Optional[int] = None                       # Freshness lifetime (seconds)
+    stale_while_revalidate: Optional[int] = None    # Stale serving window (seconds)
+    negative_ttl: Optional[int] = None              # "Not found" lifetime (seconds)
+    max_items: Optional[int] = None                 # Cached queries for this endpoint
+    size_limit_mb: Optional[float] = None           # Byte budget for this endpoint
+
+
 @dataclass
 class CacheConfig:
     """Configuration for response caching."""
     
     # Basic settings
     enabled: bool = True
-    backend: str = "memory"                 # 'memory' or 'disk'
+    backend: str = "memory"                 # 'memory', 'disk' or 'redis'
     
     # Size limits
     size_limit_mb: int = 200               # Cache size limit in megabytes
     max_items: int = 2000                  # Maximum number of cached items
+    max_entities: int = 20000              # Maximum number of normalized objects per type
     
     # File-based cache settings (disk backend only)
     path: Optional[str] = "/tmp/netbox_mcp_cache"
+    read_only: bool = False                # Attach to a cache another process maintains
+    
+    # Shared cache settings (redis backend only)
+    redis_url: Optional[str] = None         # Defaults to $REDIS_URL
+    redis_prefix: str = "netbox_mcp:cache:" # Namespace for keys and invalidation messages
     
     # TTL configuration
     ttl: CacheTTLConfig = field(default_factory=CacheTTLConfig)
+    negative_ttl: CacheNegativeTTLConfig = field(default_factory=CacheNegativeTTLConfig)
+    
+    # Per-endpoint overrides, keyed by endpoint (e.g. "dcim.device-types")
+    endpoints: Dict[str, CacheEndpointConfig] = field(default_factory=dict)
+    
+    # Stale-while-revalidate and refresh-ahead
+    stale_while_revalidate: CacheSWRConfig = field(default_factory=CacheSWRConfig)
+    refresh_ahead_hits_per_minute: float = 30.0  # Refresh hot keys before they expire (0 disables)
+    refresh_ahead_window: float = 0.2      # Fraction of the TTL before expiry that triggers refresh-ahead
+    refresh_workers: int = 4               # Background refresh threads
+    
+    # Changelog-driven invalidation (core/object-changes)
+    changelog_poll_interval_seconds: float = 0  # Tail the NetBox changelog this often (0 disables)
+    changelog_page_size: int = 200         # Changes fetched per request
+    changelog_max_backlog: int = 5000      # Clear the cache instead of replaying a longer backlog
+    
+    # Webhook-driven invalidation (POST /api/v1/webhooks/netbox)
+    webhook_secret: Optional[str] = None   # Secret configured on the NetBox webhook (required to accept them)
+    webhook_debounce_seconds: float = 0.5  # Apply a burst once no event arrived for this long
+    webhook_max_delay_seconds: float = 5.0 # ... or at the latest this long after its first event
     
     # Advanced features
     warm_on_startup: bool = False          # Whether to warm cache on startup
-    compression: bool = False              # Whether to compress cached data
+    warm_time_budget_seconds: int = 30     # Abandon warm-up after this long
+    warm_size_budget_mb: int = 20          # Abandon warm-up after fetching this much data
+    warm_max_workers: int = 4              # Reference sets fetched in parallel
+    compression: bool = False              # Whether to compress cached data (zstd if installed, else zlib)
+    compression_threshold_bytes: int = 1024 # Only compress values at least this large
     
     # Statistics
     enable_stats: bool = True              # Whether to track cache statistics
 
 
+@dataclass
+class FetchConfig:
+    """
+    Paged fetching of complete listings.
+    
+    The first page of a listing also returns the total count, so the
+    remaining pages are planned up front and fetched concurrently, then
+    reassembled in API order.
+    """
+    
+    page_size: int = 1000                  # Objects per page request (NetBox caps this at MAX_PAGE_SIZE)
+    max_workers: int = 4                   # Concurrent page requests per listing (1 fetches sequentially)
+    
+    # Per-endpoint concurrency, keyed by endpoint (e.g. {"ipam.ip-addresses": 8})
+    endpoint_workers: Dict[str, int] = field(default_factory=dict)
+
+
 @dataclass  
 class LoggingConfig:
     """Structured logging configuration for enterprise deployment."""
@@ -171,6 +279,7 @@ class NetBoxConfig:
     # Performance settings
     default_page_size: int = 50            # Smaller default for NetBox
     max_results: int = 1000
+    raw_json_reads: bool = False           # Serialize reads from the API JSON without pynetbox Records
     
     # Feature flags
     enable_health_server: bool = True
@@ -183,6 +292,9 @@ class NetBoxConfig:
     # Cache configuration
     cache: CacheConfig = field(default_factory=CacheConfig)
     
+    # Paged fetch configuration
+    fetch: FetchConfig = field(default_factory=FetchConfig)
+    
     # Logging configuration
     logging: LoggingConfig = field(default_factory=LoggingConfig)
     
@@ -220,6 +332,16 @@ class NetBoxConfig:
             raise ValueError("Write timeout must be positive")
         if self.safety.max_batch_size <= 0:
             raise ValueError("Max batch size must be positive")
+        if self.safety.write_batch_window_ms < 0:
+            raise ValueError("Write batch window must not be negative")
+        if self.safety.write_batch_max_items <= 0:
+            raise ValueError("Write batch max items must be positive")
+        
+        # Fetch validations
+        if self.fetch.page_size <= 0:
+            raise ValueError("Fetch page size must be positive")
+        if self.fetch.max_workers <= 0 or any(workers <= 0 for workers in self.fetch.endpoint_workers.values()):
+            raise ValueError("Fetch workers must be positive")
         
         # Log safety configuration warnings
         if self.safety.dry_run_mode:
@@ -351,6 +473,7 @@ class ConfigurationManager:
             'NETBOX_HEALTH_CHECK_PORT': ('health_check_port', int),
             'NETBOX_DEFAULT_PAGE_SIZE': ('default_page_size', int),
             'NETBOX_MAX_RESULTS': ('max_results', int),
+            'NETBOX_RAW_JSON_READS': ('raw_json_reads', cls._parse_bool),
             'NETBOX_ENABLE_HEALTH_SERVER': ('enable_health_server', cls._parse_bool),
             'NETBOX_ENABLE_DEGRADED_MODE': ('enable_degraded_mode', cls._parse_bool),
             'NETBOX_ENABLE_READ_OPERATIONS': ('enable_read_operations', cls._parse_bool),
@@ -363,6 +486,9 @@ class ConfigurationManager:
             'NETBOX_ENABLE_WRITE_OPERATIONS': ('safety.enable_write_operations', cls._parse_bool),
             'NETBOX_WRITE_TIMEOUT': ('safety.write_timeout', int),
             'NETBOX_MAX_BATCH_SIZE': ('safety.max_batch_size', int),
+            'NETBOX_WRITE_BATCH_ENDPOINTS': ('safety.write_batch_endpoints', cls._parse_list),
+            'NETBOX_WRITE_BATCH_WINDOW_MS': ('safety.write_batch_window_ms', int),
+            'NETBOX_WRITE_BATCH_MAX_ITEMS': ('safety.write_batch_max_items', int),
             'NETBOX_AUDIT_ALL_OPERATIONS': ('safety.audit_all_operations', cls._parse_bool),
             'NETBOX_AUDIT_WRITE_DETAILS': ('safety.audit_write_details', cls._parse_bool),
             'NETBOX_ENABLE_TRANSACTION_MODE': ('safety.enable_transaction_mode', cls._parse_bool),
@@ -375,8 +501,25 @@ class ConfigurationManager:
             'NETBOX_CACHE_BACKEND': ('cache.backend', str),
             'NETBOX_CACHE_SIZE_LIMIT_MB': ('cache.size_limit_mb', int),
             'NETBOX_CACHE_MAX_ITEMS': ('cache.max_items', int),
+            'NETBOX_CACHE_MAX_ENTITIES': ('cache.max_entities', int),
             'NETBOX_CACHE_PATH': ('cache.path', str),
+            'NETBOX_CACHE_READ_ONLY': ('cache.read_only', cls._parse_bool),
+            'NETBOX_CACHE_REDIS_URL': ('cache.redis_url', str),
+            'NETBOX_CACHE_REDIS_PREFIX': ('cache.redis_prefix', str),
             'NETBOX_CACHE_ENABLE_STATS': ('cache.enable_stats', cls._parse_bool),
+            'NETBOX_CACHE_WARM_ON_STARTUP': ('cache.warm_on_startup', cls._parse_bool),
+            'NETBOX_CACHE_WARM_TIME_BUDGET_SECONDS': ('cache.warm_time_budget_seconds', int),
+            'NETBOX_CACHE_WARM_SIZE_BUDGET_MB': ('cache.warm_size_budget_mb', int),
+            'NETBOX_CACHE_CHANGELOG_POLL_INTERVAL_SECONDS': ('cache.changelog_poll_interval_seconds', float),
+            'NETBOX_CACHE_WEBHOOK_SECRET': ('cache.webhook_secret', str),
+            'NETBOX_CACHE_COMPRESSION': ('cache.compression', cls._parse_bool),
+            'NETBOX_CACHE_COMPRESSION_THRESHOLD_BYTES': ('cache.compression_threshold_bytes', int),
+        }
+        
+        # Fetch configuration mappings
+        fetch_mappings = {
+            'NETBOX_FETCH_PAGE_SIZE': ('fetch.page_size', int),
+            'NETBOX_FETCH_MAX_WORKERS': ('fetch.max_workers', int),
         }
         
         # Logging configuration mappings
@@ -394,7 +537,7 @@ class ConfigurationManager:
         }
         
         # Combine all mappings
-        all_mappings = {**env_mappings, **safety_mappings, **cache_mappings, **logging_mappings}
+        all_mappings = {**env_mappings, **safety_mappings, **cache_mappings, **fetch_mappings, **logging_mappings}
         
         for env_var, config_key in all_mappings.items():
             # Use secrets manager to get values (handles all sources)
@@ -427,6 +570,13 @@ class ConfigurationManager:
             return value
         return value.lower() in ('true', '1', 'yes', 'on', 'enabled')
     
+    @staticmethod
+    def _parse_list(value: str) -> List[str]:
+        """Parse comma-separated list from string."""
+        if isinstance(value, list):
+            return value
+        return [item.strip() for item in value.split(',') if item.strip()]
+    
     @staticmethod
     def _set_nested_value(config: Dict[str, Any], key: str, value: Any):
         """Set nested configuration value using dot notation."""
@@ -457,8 +607,25 @@ class ConfigurationManager:
             if 'ttl' in cache_config and isinstance(cache_config['ttl'], dict):
                 cache_config['ttl'] = CacheTTLConfig(**cache_config['ttl'])
             
+            # Handle stale-while-revalidate configuration
+            if 'stale_while_revalidate' in cache_config and isinstance(cache_config['stale_while_revalidate'], dict):
+                cache_config['stale_while_revalidate'] = CacheSWRConfig(**cache_config['stale_while_revalidate'])
+            if 'negative_ttl' in cache_config and isinstance(cache_config['negative_ttl'], dict):
+                cache_config['negative_ttl'] = CacheNegativeTTLConfig(**cache_config['negative_ttl'])
+            
+            # Handle per-endpoint policy overrides
+            if 'endpoints' in cache_config and isinstance(cache_config['endpoints'], dict):
+                cache_config['endpoints'] = {
+                    endpoint: CacheEndpointConfig(**(policy or {})) if not isinstance(policy, CacheEndpointConfig) else policy
+                    for endpoint, policy in cache_config['endpoints'].items()
+                }
+            
             processed['cache'] = CacheConfig(**cache_config)
         
+        # Handle fetch configuration
+        if 'fetch' in processed and isinstance(processed['fetch'], dict):
+            processed['fetch'] = FetchConfig(**processed['fetch'])
+        
         # Handle logging configuration
         if 'logging' in processed and isinstance(processed['logging'], dict):
             processed['logging'] = LoggingConfig(**processed['logging'])
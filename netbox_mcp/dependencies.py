@@ -9,8 +9,10 @@ serving as the single source of truth for dependency injection.
 Following Gemini's architectural guidance for clean separation of concerns.
 """
 
+import asyncio
 from functools import lru_cache
 import logging
+import weakref
 from .config import NetBoxConfig, load_config
 from .client import NetBoxClient
 from .secrets import get_secrets_manager
@@ -19,7 +21,9 @@ logger = logging.getLogger(__name__)
 
 # Global client instance for singleton pattern
 _netbox_client_instance = None
+_async_clients = weakref.WeakKeyDictionary()  # event loop -> AsyncNetBoxClient
 _client_lock = None
+_closing_tasks = set()
 
 def _get_client_lock():
     """Get or create threading lock for client initialization."""
@@ -83,6 +87,34 @@ def get_netbox_client() -> NetBoxClient:
     return _netbox_client_instance
 
 
+async def get_async_netbox_client():
+    """
+    Dependency provider for AsyncNetBoxClient.
+    
+    Each event loop gets its own client, because the connection pool and
+    concurrency semaphore of an AsyncNetBoxClient belong to the loop they are
+    used on. All of them share the CacheManager of the NetBoxClient singleton,
+    so cached lookups are reused between synchronous tools and async callers.
+    
+    Returns:
+        AsyncNetBoxClient: The async client of the running event loop
+        
+    Raises:
+        NetBoxConnectionError: If httpx is not installed
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        from .async_client import AsyncNetBoxClient
+        
+        sync_client = get_netbox_client()
+        # Only this loop's thread reaches this point for this loop: no lock needed
+        client = _async_clients[loop] = AsyncNetBoxClient(sync_client.config, cache=sync_client.cache)
+        logger.info(f"AsyncNetBoxClient initialized for event loop {id(loop)} (ID: {id(client)})")
+    
+    return client
+
+
 def reset_client_instance():
     """
     Reset the client instance - primarily for testing purposes.
@@ -95,6 +127,33 @@ def reset_client_instance():
         if _netbox_client_instance is not None:
             logger.warning("NetBoxClient singleton reset - this should only happen in tests")
             _netbox_client_instance = None
+        async_clients = list(_async_clients.items())
+        _async_clients.clear()
+    
+    for loop, async_client in async_clients:
+        _close_async_client(async_client, loop)
+
+
+def _close_async_client(client, loop: asyncio.AbstractEventLoop) -> None:
+    """Close a discarded AsyncNetBoxClient on its event loop so its pooled connections are released."""
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    
+    try:
+        if loop is running:
+            # Called from a coroutine on that loop: close without blocking it
+            task = loop.create_task(client.aclose())
+            _closing_tasks.add(task)
+            task.add_done_callback(_closing_tasks.discard)
+        elif loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        elif not loop.is_closed():
+            loop.run_until_complete(client.aclose())
+        # A closed loop already dropped its connections
+    except Exception as e:
+        logger.warning(f"Failed to close AsyncNetBoxClient: {e}")
 
 
 def get_client_status() -> dict:
@@ -183,6 +242,7 @@ class NetBoxClientManager:
 __all__ = [
     'get_netbox_config',
     'get_netbox_client', 
+    'get_async_netbox_client',
     'reset_client_instance',
     'get_client_status',
     'NetBoxClientManager'  # For backward compatibility
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Paged fetching for NetBox MCP Server
+
+A complete listing used to be one pagination walk: request a page, follow
+its ``next`` link, request the next page. For full-table scans (every IP
+address, every object of a tenant) that is one round trip after another.
+NetBox reports the total count with every page, so the first page is
+enough to plan the rest:
+
+- the first page returns the count and shows the page size NetBox actually
+  applies (``MAX_PAGE_SIZE`` may cap the requested one)
+- the remaining ``(limit, offset)`` pages are planned up front
+- a bounded worker pool fetches them concurrently
+- pages are reassembled in API order, whichever finishes first
+
+Listings without a count (cursor pagination) are walked sequentially.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# fetch_page(limit, offset) -> (objects on that page, total count or None)
+PageFetcher = Callable[[int, int], Tuple[List[Any], Optional[int]]]
+
+
+def plan_pages(start: int, stop: int, page_size: int) -> List[Tuple[int, int]]:
+    """
+    Split the range ``[start, stop)`` into pages.
+
+    Args:
+        start: Offset of the first object to fetch
+        stop: Offset after the last object to fetch
+        page_size: Objects per page
+
+    Returns:
+        ``(limit, offset)`` for each page, in order
+    """
+    return [(min(page_size, stop - offset), offset) for offset in range(start, stop, page_size)]
+
+
+def fetch_listing(
+    fetch_page: PageFetcher,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    page_size: int = 1000,
+    max_workers: int = 4,
+) -> List[Any]:
+    """
+    Fetch a listing, or a window of one, with concurrent page requests.
+
+    Args:
+        fetch_page: Fetches one page, see ``PageFetcher``
+        offset: Number of objects to skip
+        limit: Maximum number of objects to return (None for all)
+        page_size: Objects per page request
+        max_workers: Maximum number of concurrent page requests
+
+    Returns:
+        The objects in API order
+    """
+    first_size = page_size if limit is None else min(page_size, limit)
+    first, total = fetch_page(first_size, offset)
+    results = list(first)
+    if not first:
+        return results
+
+    if total is None:
+        if len(first) < first_size:
+            return results
+        remaining = None if limit is None else limit - len(first)
+        return results + _walk(fetch_page, offset + len(first), remaining, first_size)
+
+    stop = total if limit is None else min(total, offset + limit)
+    if len(first) < first_size:
+        # NetBox capped the page size; plan with the size it applies
+        page_size = len(first)
+
+    pages = plan_pages(offset + len(first), stop, page_size)
+    if not pages:
+        return results
+
+    workers = min(max_workers, len(pages))
+    logger.debug("Fetching %s more pages of %s objects (%s total) with %s workers",
+                 len(pages), page_size, total, workers)
+    if workers <= 1:
+        for page_limit, page_offset in pages:
+            results.extend(fetch_page(page_limit, page_offset)[0])
+        return results
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="netbox-page") as pool:
+        # map() yields in submission order, which is API order
+        for page, _ in pool.map(lambda page: fetch_page(*page), pages):
+            results.extend(page)
+    return results
+
+
+def _walk(fetch_page: PageFetcher, offset: int, limit: Optional[int], page_size: int) -> List[Any]:
+    """Fetch pages one after another until a short page or ``limit`` objects."""
+    results: List[Any] = []
+    while limit is None or len(results) < limit:
+        request_size = page_size if limit is None else min(page_size, limit - len(results))
+        page, _ = fetch_page(request_size, offset + len(results))
+        results.extend(page)
+        if len(page) < request_size:
+            break
+    return results
+
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Raw-JSON reads for NetBox MCP Server
+
+pynetbox turns every API object into a Record, with nested Records for each
+related object, and EndpointWrapper immediately turns it back into a dict
+with ``Record.serialize()``. For large listings building those Records
+dominates CPU time. RawEndpoint fetches the same pages over pynetbox's HTTP
+session, decodes them with orjson when it is installed, and produces the
+``Record.serialize()`` shape directly from the decoded JSON:
+
+- nested objects become their ID, choice fields their value
+- custom field values that are objects become their ID
+- JSON fields (custom_fields, config_context, local_context_data, ...) are
+  kept as they are
+- ``tags`` and ``tagged_vlans`` drop duplicate IDs
+
+Objects with shapes the shortcut does not cover (generic-relation lists,
+nested objects without an ID) are serialized through pynetbox instead, so
+tools see exactly the dicts they get today.
+"""
+
+import json
+import logging
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import pynetbox
+from pynetbox.core.query import Request
+from pynetbox.core.response import LIST_AS_SET, Record, flatten_custom
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def loads(raw: bytes) -> Any:
+    """Decode a JSON response body, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class _Unsupported(Exception):
+    """An object the shortcut cannot serialize exactly like pynetbox."""
+
+
+@lru_cache(maxsize=None)
+def _json_fields(model: type) -> frozenset:
+    """Fields pynetbox keeps as raw JSON for a model."""
+    fields = {"custom_fields", "local_context_data"}
+    for name in dir(model):
+        if hasattr(getattr(model, name, None), "_json_field"):
+            fields.add(name)
+    return frozenset(fields)
+
+
+def _nested_value(value: Dict[str, Any]) -> Any:
+    """What Record.serialize() stores for a nested object."""
+    if "id" in value:
+        if len(value) == 3 and "value" in value and "label" in value:
+            return value["value"]
+        return value["id"]
+    if "value" in value and "url" not in value:
+        # Choice field ({"value": ..., "label": ...})
+        return value["value"]
+    raise _Unsupported
+
+
+def serialize(data: Dict[str, Any], model: type) -> Dict[str, Any]:
+    """
+    Serialize an API object like ``model(data, ...).serialize()`` would.
+
+    Raises:
+        _Unsupported: If the object needs pynetbox to serialize it exactly
+    """
+    json_fields = _json_fields(model)
+    result = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            if key == "custom_fields":
+                value = flatten_custom(value)
+            elif key not in json_fields:
+                value = _nested_value(value)
+        elif isinstance(value, list):
+            if key in json_fields or key == "constraints":
+                pass
+            elif value and isinstance(value[0], dict) and "object_type" in value[0]:
+                raise _Unsupported
+            else:
+                items = []
+                for item in value:
+                    if isinstance(item, dict):
+                        if "id" not in item:
+                            raise _Unsupported
+                        item = item["id"]
+                    items.append(item)
+                value = items
+                if key in LIST_AS_SET and (
+                    all(isinstance(item, str) for item in value) or all(isinstance(item, int) for item in value)
+                ):
+                    value = list(dict.fromkeys(value))
+        elif key == "custom_fields":
+            raise _Unsupported
+        result[key] = value
+    return result
+
+
+class RawEndpoint:
+    """
+    Fetches and serializes one NetBox endpoint without building Records.
+
+    Args:
+        endpoint: pynetbox Endpoint to read
+    """
+
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+        self.api = endpoint.api
+        self.model = endpoint.return_obj
+        self.url = endpoint.url
+        self.fallbacks = 0
+
+    def serialize(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Record.serialize() output for one API object."""
+        if isinstance(self.model, type) and issubclass(self.model, Record):
+            try:
+                return serialize(data, self.model)
+            except _Unsupported:
+                self.fallbacks += 1
+        return self.model(data, self.api, self.endpoint).serialize()
+
+    def _get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET a URL with pynetbox's session and authentication and decode the body."""
+        headers = {"accept": "application/json"}
+        Request(base=url, http_session=self.api.http_session, token=self.endpoint.token)._add_auth_header(headers)
+        response = self.api.http_session.get(url, headers=headers, params=params)
+        if not response.ok:
+            raise pynetbox.RequestError(response)
+        return loads(response.content)
+
+    @staticmethod
+    def params(args: tuple, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Translate pynetbox-style filter arguments into query parameters."""
+        params = {key: ("null" if value is None else value) for key, value in kwargs.items()}
+        if args:
+            params["q"] = args[0]
+        return params
+
+    def page(self, params: Dict[str, Any], limit: int, offset: int) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        Fetch one page of a listing.
+
+        Returns:
+            The page's API objects and the total count NetBox reported
+        """
+        body = self._get(f"{self.url}/", {**params, "limit": limit, "offset": offset})
+        return body["results"], body.get("count")
+
+    def get(self, obj_id: Any) -> Optional[Dict[str, Any]]:
+        """Fetch one object by ID, or None if NetBox answers 404."""
+        try:
+            return self._get(f"{self.url}/{obj_id}/")
+        except pynetbox.RequestError as e:
+            if e.req.status_code == 404:
+                return None
+            raise
+
+    def serialize_all(self, objects: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Record.serialize() output for each API object."""
+        return [self.serialize(data) for data in objects]
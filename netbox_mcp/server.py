@@ -9,9 +9,12 @@ Version: 0.9.7 - Hierarchical Architecture with Registry Bridge
 """
 
 from mcp.server.fastmcp import FastMCP
-from fastapi import FastAPI, Depends, HTTPException
+from fastapi import FastAPI, Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from .client import NetBoxClient
+from .cache_webhooks import SIGNATURE_HEADER
+from .exceptions import NetBoxAuthError, NetBoxValidationError
 from .config import load_config
 from .registry import (
     TOOL_REGISTRY, PROMPT_REGISTRY, 
@@ -242,8 +245,9 @@ async def execute_mcp_tool(
     try:
         logger.info(f"Executing tool: {request.tool_name} with parameters: {request.parameters}")
 
-        # Execute tool with dependency injection
-        result = execute_tool(request.tool_name, client, **request.parameters)
+        # Execute tool with dependency injection in the threadpool so concurrent
+        # requests are not serialized behind a blocking tool on the event loop
+        result = await run_in_threadpool(execute_tool, request.tool_name, client, **request.parameters)
 
         return {
             "success": True,
@@ -319,6 +323,49 @@ async def execute_mcp_prompt(request: PromptRequest) -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail=f"Prompt execution failed: {str(e)}")
 
 
+# === WEBHOOK ENDPOINTS ===
+
+def _webhook_receiver(client: NetBoxClient):
+    receiver = getattr(client, 'webhook_receiver', None)
+    if receiver is None:
+        raise HTTPException(status_code=404, detail="Webhook receiver is not configured (cache.webhook_secret)")
+    return receiver
+
+
+@api_app.post("/api/v1/webhooks/netbox")
+async def receive_netbox_webhook(
+    request: Request,
+    client: NetBoxClient = Depends(get_netbox_client)
+) -> Dict[str, Any]:
+    """
+    Push-based cache invalidation: accept a NetBox create/update/delete webhook.
+
+    The request must carry the HMAC-SHA512 signature of the configured
+    webhook secret in X-Hook-Signature. Events are applied to the cache
+    after a short debounce.
+
+    Returns:
+        Acknowledgement with the queued event
+    """
+    receiver = _webhook_receiver(client)
+    body = await request.body()
+    try:
+        return receiver.receive(body, request.headers.get(SIGNATURE_HEADER))
+    except NetBoxAuthError as e:
+        logger.warning(f"Rejected NetBox webhook from {request.client.host if request.client else 'unknown'}: {e}")
+        raise HTTPException(status_code=401, detail=str(e))
+    except NetBoxValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@api_app.get("/api/v1/webhooks/netbox")
+async def get_netbox_webhook_stats(client: NetBoxClient = Depends(get_netbox_client)) -> Dict[str, Any]:
+    """
+    Webhook receiver counters: received, applied, ignored, coalesced and rejected events.
+    """
+    return _webhook_receiver(client).status()
+
+
 # === MONITORING ENDPOINTS ===
 
 # Initialize monitoring components
@@ -673,7 +720,13 @@ async def get_system_status(
             },
             "tool_registry": registry_stats,
             "client": client_status,
-            "cache_stats": netbox_status.cache_stats if hasattr(netbox_status, 'cache_stats') else None
+            "cache_stats": netbox_status.cache_stats if hasattr(netbox_status, 'cache_stats') else None,
+            "cache_warmup": client.cache_warmer.status() if getattr(client, 'cache_warmer', None) else None,
+            "cache_changelog": client.changelog_poller.status() if getattr(client, 'changelog_poller', None) else None,
+            "cache_webhooks": client.webhook_receiver.status() if getattr(client, 'webhook_receiver', None) else None,
+            "write_batchers": {
+                endpoint: batcher.status() for endpoint, batcher in getattr(client, 'write_batchers', {}).items()
+            }
         }
 
     except Exception as e:
@@ -809,6 +862,27 @@ def initialize_server():
             logger.warning(f"⚠️ NetBox connection failed during startup, running in degraded mode: {e}")
             # Continue startup - health server should still start for liveness probes
 
+        # Tail the NetBox changelog so changes made anywhere invalidate exactly what they touch
+        if config.cache.enabled and config.cache.changelog_poll_interval_seconds > 0:
+            from .cache_changelog import ChangelogPoller
+            client.changelog_poller = ChangelogPoller(client)
+            client.changelog_poller.start()
+            logger.info("Changelog-driven cache invalidation started in background")
+
+        # Accept NetBox webhooks for push-based invalidation when a secret is configured
+        if config.cache.enabled and config.cache.webhook_secret:
+            from .cache_webhooks import WebhookReceiver
+            client.webhook_receiver = WebhookReceiver(client)
+            client.webhook_receiver.start()
+            logger.info("NetBox webhook receiver enabled at /api/v1/webhooks/netbox")
+
+        # Prefetch reference data in the background so liveness isn't delayed
+        if config.cache.enabled and config.cache.warm_on_startup:
+            from .cache_warmer import CacheWarmer
+            client.cache_warmer = CacheWarmer(client)
+            client.cache_warmer.start()
+            logger.info("Cache warm-up started in background")
+
         # Async task system removed - using synchronous operations only
         logger.info("NetBox MCP server using synchronous operations")
 
@@ -7,6 +7,7 @@ Based on Gemini's Phase 3 architectural guidance for enterprise-scale performanc
 """
 
 import json
+import os
 import time
 import uuid
 from datetime import datetime
@@ -21,7 +22,7 @@ except ImportError:
     RQ_AVAILABLE = False
 
 from .client import NetBoxClient, NetBoxBulkOrchestrator
-from .config import NetBoxConfig
+from .config import CacheConfig, NetBoxConfig
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +32,51 @@ class TaskError(Exception):
     pass
 
 
+def task_cache_settings(cache_config: Optional[CacheConfig]) -> Dict[str, Any]:
+    """
+    Cache settings to pass to a worker in the task config.
+    
+    Workers only join the cache when the submitting application uses the
+    shared Redis tier: its writes then invalidate what workers read. With a
+    process-local backend those invalidations would never reach the worker,
+    so the worker cache stays disabled.
+    
+    Args:
+        cache_config: Cache configuration of the submitting application
+        
+    Returns:
+        ``cache_*`` entries for the task config
+    """
+    if cache_config is None or not cache_config.enabled or cache_config.backend != "redis":
+        return {"cache_enabled": False}
+    return {
+        "cache_enabled": True,
+        "cache_backend": "redis",
+        "cache_redis_url": cache_config.redis_url or os.getenv("REDIS_URL", "redis://localhost:6379/0"),
+        "cache_redis_prefix": cache_config.redis_prefix,
+    }
+
+
+def configure_task_cache(netbox_config: NetBoxConfig, config: Dict[str, Any]) -> None:
+    """
+    Apply the ``cache_*`` task config entries to a worker's NetBoxConfig.
+    
+    Anything but the shared Redis tier of the submitting application
+    disables the worker cache.
+    
+    Args:
+        netbox_config: Worker NetBox configuration to adjust
+        config: Task config built by the enqueueing side
+    """
+    cache = netbox_config.cache
+    if not config.get("cache_enabled", False) or config.get("cache_backend") != "redis":
+        cache.enabled = False
+        return
+    cache.backend = "redis"
+    cache.redis_url = config.get("cache_redis_url")
+    cache.redis_prefix = config.get("cache_redis_prefix", cache.redis_prefix)
+
+
 class TaskTracker:
     """
     Task progress tracking and status management using Redis.
@@ -139,13 +185,19 @@ class AsyncTaskManager:
     Handles task queueing, worker management, and integration with NetBox operations.
     """
     
-    def __init__(self, redis_url: str = "redis://localhost:6379/0", queue_name: str = "netbox_bulk"):
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379/0",
+        queue_name: str = "netbox_bulk",
+        cache_config: Optional[CacheConfig] = None
+    ):
         """
         Initialize async task manager.
         
         Args:
             redis_url: Redis connection URL
             queue_name: RQ queue name for NetBox operations
+            cache_config: Cache configuration of the application queueing tasks
         """
         if not RQ_AVAILABLE:
             raise TaskError("Redis Queue (RQ) not available. Install with: pip install rq redis")
@@ -153,6 +205,7 @@ class AsyncTaskManager:
         self.redis_conn = Redis.from_url(redis_url)
         self.queue = Queue(queue_name, connection=self.redis_conn)
         self.tracker = TaskTracker(redis_url)
+        self.cache_config = cache_config
         
         logger.info(f"AsyncTaskManager initialized - Queue: {queue_name}")
     
@@ -193,6 +246,7 @@ class AsyncTaskManager:
             Task ID for progress tracking
         """
         task_id = self.generate_task_id("bulk_devices", f"{len(devices_data)}dev")
+        config = {**config, **task_cache_settings(self.cache_config)}
         
         # Initialize task status
         self.tracker.update_task_status(task_id, "queued", {
@@ -259,6 +313,7 @@ def execute_bulk_device_operation(
     """
     # Initialize task tracker
     tracker = TaskTracker(config.get("redis_url", "redis://localhost:6379/0"))
+    netbox_client = None
     
     try:
         logger.info(f"Starting bulk device operation: {task_id}")
@@ -271,19 +326,21 @@ def execute_bulk_device_operation(
         })
         
         # Initialize NetBox client and orchestrator
-        # NOTE: Async tasks run in separate worker processes and cannot share cache
-        # with the main application singleton. Cache is disabled for async tasks.
+        # NOTE: Async tasks run in separate worker processes and cannot share the
+        # in-process cache with the main application. They share its Redis cache
+        # tier when it uses one, so lookups and invalidations reach every replica;
+        # otherwise the worker cache is disabled.
         netbox_config = NetBoxConfig(
             url=config["netbox_url"],
             token=config["netbox_token"],
             timeout=config.get("timeout", 30),
             verify_ssl=config.get("verify_ssl", True)
         )
-        # Disable cache for async tasks to prevent conflicts with main application cache
-        netbox_config.cache.enabled = False
+        configure_task_cache(netbox_config, config)
         
         netbox_client = NetBoxClient(netbox_config)
-        logger.info(f"ASYNC TASK: NetBoxClient created with cache disabled (ID: {id(netbox_client)})")
+        cache_mode = "shared Redis cache" if netbox_config.cache.enabled else "cache disabled"
+        logger.info(f"ASYNC TASK: NetBoxClient created with {cache_mode} (ID: {id(netbox_client)})")
         orchestrator = NetBoxBulkOrchestrator(netbox_client)
         batch_id = orchestrator.generate_batch_id()
         
@@ -389,18 +446,27 @@ def execute_bulk_device_operation(
         tracker.update_task_status(task_id, "failed", error_info)
         logger.error(f"Bulk device operation failed: {task_id} - {e}")
         raise TaskError(f"Bulk device operation failed: {e}")
+    
+    finally:
+        # Stop the per-task invalidation listener
+        if netbox_client is not None:
+            netbox_client.cache.close()
 
 
 # Initialize global task manager (will be configured in server.py)
 task_manager: Optional[AsyncTaskManager] = None
 
 
-def initialize_task_manager(redis_url: str = "redis://localhost:6379/0") -> AsyncTaskManager:
+def initialize_task_manager(
+    redis_url: str = "redis://localhost:6379/0",
+    cache_config: Optional[CacheConfig] = None
+) -> AsyncTaskManager:
     """
     Initialize global task manager instance.
     
     Args:
         redis_url: Redis connection URL
+        cache_config: Cache configuration of the application queueing tasks
         
     Returns:
         Configured AsyncTaskManager instance
@@ -412,7 +478,7 @@ def initialize_task_manager(redis_url: str = "redis://localhost:6379/0") -> Asyn
         return None
     
     try:
-        task_manager = AsyncTaskManager(redis_url)
+        task_manager = AsyncTaskManager(redis_url, cache_config=cache_config)
         logger.info("Async task manager initialized successfully")
         return task_manager
     except Exception as e:
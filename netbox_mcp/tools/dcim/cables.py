@@ -909,85 +909,87 @@ def netbox_bulk_create_cable_connections(
                 "dry_run": True
             }
         
-        # Process connections in batches
-        for batch_start in range(0, len(cable_connections), batch_size):
-            batch_end = min(batch_start + batch_size, len(cable_connections))
-            batch_connections = cable_connections[batch_start:batch_end]
-            
-            logger.info(f"Processing batch {batch_start//batch_size + 1}: connections {batch_start+1}-{batch_end}")
-            
-            batch_success_count = 0
-            batch_failure_count = 0
-            
-            # Process each connection in the batch
-            for connection in batch_connections:
-                try:
-                    # Use the existing single cable creation tool for each connection
-                    cable_result = netbox_create_cable_connection(
-                        client=client,
-                        device_a_name=connection["device_a_name"],
-                        interface_a_name=connection["interface_a_name"],
-                        device_b_name=connection["device_b_name"],
-                        interface_b_name=connection["interface_b_name"],
-                        cable_type=cable_type,
-                        cable_status=cable_status,
-                        cable_color=cable_color,
-                        cable_length=cable_length,
-                        cable_length_unit=cable_length_unit,
-                        label=connection.get("label"),
-                        description=connection.get("description"),
-                        confirm=True
-                    )
-                    
-                    if cable_result.get("success"):
-                        operation_result.add_success(connection, cable_result)
-                        batch_success_count += 1
-                        logger.debug(f"Successfully created cable: {connection['device_a_name']}:{connection['interface_a_name']} -> {connection['device_b_name']}:{connection['interface_b_name']}")
-                    else:
-                        operation_result.add_failure(connection, cable_result.get("error", "Unknown error"))
-                        batch_failure_count += 1
-                        logger.warning(f"Failed to create cable: {connection['device_a_name']}:{connection['interface_a_name']} -> {connection['device_b_name']}:{connection['interface_b_name']}, Error: {cable_result.get('error')}")
-                        
-                except Exception as e:
-                    operation_result.add_failure(connection, str(e))
-                    batch_failure_count += 1
-                    logger.error(f"Exception creating cable: {connection['device_a_name']}:{connection['interface_a_name']} -> {connection['device_b_name']}:{connection['interface_b_name']}, Error: {e}")
-            
-            # Check if rollback is needed for this batch
-            if rollback_on_error and batch_failure_count > 0:
-                logger.warning(f"Batch {batch_start//batch_size + 1} had {batch_failure_count} failures, initiating rollback")
+        # Collect the per-cable invalidations and apply them once at the end
+        with client.cache.deferred_invalidation():
+            # Process connections in batches
+            for batch_start in range(0, len(cable_connections), batch_size):
+                batch_end = min(batch_start + batch_size, len(cable_connections))
+                batch_connections = cable_connections[batch_start:batch_end]
                 
-                # Rollback successful connections from this batch
-                for success_record in operation_result.successful_connections[-batch_success_count:]:
-                    try:
-                        cable_id = success_record["cable_id"]
-                        if cable_id:
-                            logger.info(f"Rolling back cable ID: {cable_id}")
-                            rollback_result = netbox_disconnect_cable(
-                                client=client,
-                                cable_id=cable_id,
-                                confirm=True
-                            )
-                            operation_result.add_rollback(cable_id, rollback_result)
-                    except Exception as rollback_error:
-                        logger.error(f"Failed to rollback cable {cable_id}: {rollback_error}")
+                logger.info(f"Processing batch {batch_start//batch_size + 1}: connections {batch_start+1}-{batch_end}")
                 
-                # Remove the rolled-back successes from the success list
-                operation_result.successful_connections = operation_result.successful_connections[:-batch_success_count]
+                batch_success_count = 0
+                batch_failure_count = 0
                 
-                # If rollback_on_error is enabled, stop processing remaining batches
-                logger.error(f"Stopping bulk operation due to batch failures and rollback_on_error=True")
-                break
-        
-        # Finalize operation
-        operation_result.finalize()
-        
-        # Cache invalidation for data consistency
-        try:
-            client.cache.invalidate_pattern("dcim.cables")
-            client.cache.invalidate_pattern("dcim.interfaces")
-        except Exception as cache_error:
-            logger.warning(f"Cache invalidation failed: {cache_error}")
+                # Process each connection in the batch
+                for connection in batch_connections:
+                    try:
+                        # Use the existing single cable creation tool for each connection
+                        cable_result = netbox_create_cable_connection(
+                            client=client,
+                            device_a_name=connection["device_a_name"],
+                            interface_a_name=connection["interface_a_name"],
+                            device_b_name=connection["device_b_name"],
+                            interface_b_name=connection["interface_b_name"],
+                            cable_type=cable_type,
+                            cable_status=cable_status,
+                            cable_color=cable_color,
+                            cable_length=cable_length,
+                            cable_length_unit=cable_length_unit,
+                            label=connection.get("label"),
+                            description=connection.get("description"),
+                            confirm=True
+                        )
+                        
+                        if cable_result.get("success"):
+                            operation_result.add_success(connection, cable_result)
+                            batch_success_count += 1
+                            logger.debug(f"Successfully created cable: {connection['device_a_name']}:{connection['interface_a_name']} -> {connection['device_b_name']}:{connection['interface_b_name']}")
+                        else:
+                            operation_result.add_failure(connection, cable_result.get("error", "Unknown error"))
+                            batch_failure_count += 1
+                            logger.warning(f"Failed to create cable: {connection['device_a_name']}:{connection['interface_a_name']} -> {connection['device_b_name']}:{connection['interface_b_name']}, Error: {cable_result.get('error')}")
+                            
+                    except Exception as e:
+                        operation_result.add_failure(connection, str(e))
+                        batch_failure_count += 1
+                        logger.error(f"Exception creating cable: {connection['device_a_name']}:{connection['interface_a_name']} -> {connection['device_b_name']}:{connection['interface_b_name']}, Error: {e}")
+                
+                # Check if rollback is needed for this batch
+                if rollback_on_error and batch_failure_count > 0:
+                    logger.warning(f"Batch {batch_start//batch_size + 1} had {batch_failure_count} failures, initiating rollback")
+                    
+                    # Rollback successful connections from this batch
+                    for success_record in operation_result.successful_connections[-batch_success_count:]:
+                        try:
+                            cable_id = success_record["cable_id"]
+                            if cable_id:
+                                logger.info(f"Rolling back cable ID: {cable_id}")
+                                rollback_result = netbox_disconnect_cable(
+                                    client=client,
+                                    cable_id=cable_id,
+                                    confirm=True
+                                )
+                                operation_result.add_rollback(cable_id, rollback_result)
+                        except Exception as rollback_error:
+                            logger.error(f"Failed to rollback cable {cable_id}: {rollback_error}")
+                    
+                    # Remove the rolled-back successes from the success list
+                    operation_result.successful_connections = operation_result.successful_connections[:-batch_success_count]
+                    
+                    # If rollback_on_error is enabled, stop processing remaining batches
+                    logger.error(f"Stopping bulk operation due to batch failures and rollback_on_error=True")
+                    break
+            
+            # Finalize operation
+            operation_result.finalize()
+            
+            # Cache invalidation for data consistency
+            try:
+                client.cache.invalidate_pattern("dcim.cables")
+                client.cache.invalidate_pattern("dcim.interfaces")
+            except Exception as cache_error:
+                logger.warning(f"Cache invalidation failed: {cache_error}")
         
         # Determine overall success
         success_rate = operation_result.calculate_success_rate()
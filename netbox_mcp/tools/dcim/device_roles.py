@@ -130,12 +130,8 @@ def netbox_list_all_device_roles(
         if vm_role is not None:
             filters['vm_role'] = vm_role
         
-        # Execute filtered query
-        device_roles = list(client.dcim.device_roles.filter(**filters))
-        
-        # Apply limit after fetching
-        if len(device_roles) > limit:
-            device_roles = device_roles[:limit]
+        # Execute filtered query with server-side limit
+        device_roles = list(client.dcim.device_roles.filter(**filters, limit=limit))
         
         # Generate summary statistics
         vm_role_counts = {"vm_capable": 0, "physical_only": 0}
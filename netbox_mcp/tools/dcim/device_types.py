@@ -154,12 +154,8 @@ def netbox_list_all_device_types(
         if u_height is not None:
             filters['u_height'] = u_height
         
-        # Execute filtered query with limit
-        device_types = list(client.dcim.device_types.filter(**filters))
-        
-        # Apply limit after fetching
-        if len(device_types) > limit:
-            device_types = device_types[:limit]
+        # Execute filtered query with server-side limit
+        device_types = list(client.dcim.device_types.filter(**filters, limit=limit))
         
         # Generate summary statistics
         manufacturer_counts = {}
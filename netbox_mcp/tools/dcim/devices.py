@@ -10,6 +10,7 @@ from typing import Dict, Optional, Any
 import logging
 from ...registry import mcp_tool
 from ...client import NetBoxClient
+from ...async_client import gather_reads
 
 logger = logging.getLogger(__name__)
 
@@ -236,12 +237,21 @@ def netbox_get_device_info(
             "device": device
         }
         
+        # Interface and cable lookups are independent: fire them concurrently
+        reads = {}
+        if include_interfaces:
+            # Use API-side counting and pagination for efficiency
+            reads["total_interfaces"] = lambda c: c.dcim.interfaces.count(device_id=device_id)
+            reads["interfaces"] = lambda c: c.dcim.interfaces.filter(device_id=device_id, limit=interface_limit)
+        if include_cables:
+            reads["total_cables"] = lambda c: c.dcim.cables.count(termination_a_id=device_id)
+            reads["cables"] = lambda c: c.dcim.cables.filter(termination_a_id=device_id, limit=cable_limit)
+        related = dict(zip(reads, gather_reads(client, *reads.values())))
+        
         # Get interfaces with API-side pagination if requested
         if include_interfaces:
-            # Use API-side counting for efficiency
-            total_interfaces = client.dcim.interfaces.count(device_id=device_id)
-            # Use API-side pagination with limit parameter
-            interfaces = list(client.dcim.interfaces.filter(device_id=device_id, limit=interface_limit))
+            total_interfaces = related["total_interfaces"]
+            interfaces = list(related["interfaces"])
             result_data["interfaces"] = interfaces
             result_data["interface_pagination"] = {
                 "total_count": total_interfaces,
@@ -260,10 +270,8 @@ def netbox_get_device_info(
         
         # Get cables with API-side pagination if requested
         if include_cables:
-            # Use API-side counting for efficiency
-            total_cables = client.dcim.cables.count(termination_a_id=device_id)
-            # Use API-side pagination with limit parameter
-            cables = list(client.dcim.cables.filter(termination_a_id=device_id, limit=cable_limit))
+            total_cables = related["total_cables"]
+            cables = list(related["cables"])
             result_data["cables"] = cables
             result_data["cable_pagination"] = {
                 "total_count": total_cables,
@@ -657,9 +665,16 @@ def netbox_provision_new_device(
         
         logger.info(f"Provisioning device: {device_name} in {site_name}/{rack_name} at position {position}")
         
+        # Site, device type and role lookups are independent: fire them concurrently
+        sites, device_types, roles = gather_reads(
+            client,
+            lambda c: c.dcim.sites.filter(name=site_name),
+            lambda c: c.dcim.device_types.filter(model=device_model),
+            lambda c: c.dcim.device_roles.filter(name=role_name),
+        )
+        
         # Step 1: Find the site
         logger.debug(f"Looking up site: {site_name}")
-        sites = client.dcim.sites.filter(name=site_name)
         if not sites:
             sites = client.dcim.sites.filter(slug=site_name)
         if not sites:
@@ -687,7 +702,6 @@ def netbox_provision_new_device(
         
         # Step 3: Find the device type
         logger.debug(f"Looking up device type: {device_model}")
-        device_types = client.dcim.device_types.filter(model=device_model)
         if not device_types:
             device_types = client.dcim.device_types.filter(slug=device_model)
         if not device_types:
@@ -702,7 +716,6 @@ def netbox_provision_new_device(
         
         # Step 4: Find the device role
         logger.debug(f"Looking up device role: {role_name}")
-        roles = client.dcim.device_roles.filter(name=role_name)
         if not roles:
             roles = client.dcim.device_roles.filter(slug=role_name)
         if not roles:
@@ -1261,12 +1274,12 @@ def netbox_list_all_devices(
             # For manufacturer filtering, we need to filter by device_type__manufacturer
             filters['device_type__manufacturer'] = manufacturer_name
         
-        # Execute filtered query with limit
-        devices = list(client.dcim.devices.filter(**filters))
-        
-        # Apply limit after fetching (since pynetbox limit behavior can be inconsistent)
-        if len(devices) > limit:
-            devices = devices[:limit]
+        # Execute filtered query with server-side limit, fetching only the summarized fields
+        devices = list(client.dcim.devices.filter(
+            **filters, limit=limit,
+            fields=["name", "status", "site", "role", "device_type", "primary_ip4", "primary_ip6",
+                    "rack", "position", "tenant"]
+        ))
         
         # Generate summary statistics
         status_counts = {}
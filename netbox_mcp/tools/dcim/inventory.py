@@ -1254,62 +1254,79 @@ def netbox_bulk_add_standard_inventory(
     failed_items = []
     skipped_items = []
     
-    for item_spec in preset_items:
-        try:
-            # Check if item already exists
-            existing_items = client.dcim.inventory_items.filter(
-                device_id=device_id,
-                name=item_spec["name"]
-            )
-            
-            if existing_items:
-                skipped_items.append({
+    # Apply the per-item cache invalidations once, after the whole preset
+    with client.cache.deferred_invalidation():
+        # Submit every create before collecting results, so endpoints with
+        # write coalescing enabled send them as list POSTs
+        submitted = []
+        for item_spec in preset_items:
+            try:
+                # Check if item already exists
+                existing_items = client.dcim.inventory_items.filter(
+                    device_id=device_id,
+                    name=item_spec["name"]
+                )
+                
+                if existing_items:
+                    skipped_items.append({
+                        "name": item_spec["name"],
+                        "reason": "Item already exists"
+                    })
+                    logger.info(f"Skipping existing item: {item_spec['name']}")
+                    continue
+                
+                # Create inventory item with validated component_type
+                validated_component_type = None
+                if item_spec.get("component_type"):
+                    validated_component_type = validate_component_type(item_spec.get("component_type"))
+                    
+                create_payload = {
+                    "device": device_id,
+                    "name": item_spec["name"],
+                    "description": item_spec.get("description", ""),
+                    "part_id": item_spec.get("part_id")
+                }
+                
+                # Add validated component_type if available
+                if validated_component_type is not None:
+                    create_payload["component_type"] = validated_component_type
+                
+                # Remove None values
+                create_payload = {k: v for k, v in create_payload.items() if v is not None}
+                
+                future = client.dcim.inventory_items.submit_create(confirm=confirm, **create_payload)
+                submitted.append((item_spec, create_payload, future))
+                
+            except Exception as e:
+                failed_items.append({
                     "name": item_spec["name"],
-                    "reason": "Item already exists"
+                    "error": str(e)
                 })
-                logger.info(f"Skipping existing item: {item_spec['name']}")
-                continue
-            
-            # Create inventory item with validated component_type
-            validated_component_type = None
-            if item_spec.get("component_type"):
-                validated_component_type = validate_component_type(item_spec.get("component_type"))
+                logger.error(f"Failed to create inventory item '{item_spec['name']}': {e}")
+        
+        for item_spec, create_payload, future in submitted:
+            try:
+                new_item = client.dcim.inventory_items.wait_for_create(future)
                 
-            create_payload = {
-                "device": device_id,
-                "name": item_spec["name"],
-                "description": item_spec.get("description", ""),
-                "part_id": item_spec.get("part_id")
-            }
-            
-            # Add validated component_type if available
-            if validated_component_type is not None:
-                create_payload["component_type"] = validated_component_type
-            
-            # Remove None values
-            create_payload = {k: v for k, v in create_payload.items() if v is not None}
-            
-            new_item = client.dcim.inventory_items.create(confirm=confirm, **create_payload)
-            
-            item_id = new_item.get('id') if isinstance(new_item, dict) else new_item.id
-            item_name = new_item.get('name') if isinstance(new_item, dict) else new_item.name
-            
-            created_items.append({
-                "id": item_id,
-                "name": item_name,
-                "component_type": create_payload.get("component_type"),
-                "description": create_payload.get("description")
-            })
-            
-            logger.info(f"Created inventory item: {item_name} (ID: {item_id})")
-            
-        except Exception as e:
-            failed_items.append({
-                "name": item_spec["name"],
-                "error": str(e)
-            })
-            logger.error(f"Failed to create inventory item '{item_spec['name']}': {e}")
-    
+                item_id = new_item.get('id') if isinstance(new_item, dict) else new_item.id
+                item_name = new_item.get('name') if isinstance(new_item, dict) else new_item.name
+                
+                created_items.append({
+                    "id": item_id,
+                    "name": item_name,
+                    "component_type": create_payload.get("component_type"),
+                    "description": create_payload.get("description")
+                })
+                
+                logger.info(f"Created inventory item: {item_name} (ID: {item_id})")
+                
+            except Exception as e:
+                failed_items.append({
+                    "name": item_spec["name"],
+                    "error": str(e)
+                })
+                logger.error(f"Failed to create inventory item '{item_spec['name']}': {e}")
+        
     # STEP 5: RETURN RESULTS
     total_attempted = len(preset_items)
     total_created = len(created_items)
@@ -105,12 +105,8 @@ def netbox_list_all_manufacturers(
     try:
         logger.info(f"Listing manufacturers with limit: {limit}")
         
-        # Execute query with limit
-        manufacturers = list(client.dcim.manufacturers.all())
-        
-        # Apply limit after fetching
-        if len(manufacturers) > limit:
-            manufacturers = manufacturers[:limit]
+        # Execute query with server-side limit
+        manufacturers = list(client.dcim.manufacturers.filter(limit=limit))
         
         # Generate summary statistics
         total_device_types = 0
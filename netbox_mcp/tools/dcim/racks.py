@@ -538,12 +538,12 @@ def netbox_list_all_racks(
         if role:
             filters['role'] = role
         
-        # Execute filtered query with limit
-        racks = list(client.dcim.racks.filter(**filters))
-        
-        # Apply limit after fetching
-        if len(racks) > limit:
-            racks = racks[:limit]
+        # Execute filtered query with server-side limit, fetching only the summarized fields
+        racks = list(client.dcim.racks.filter(
+            **filters, limit=limit,
+            fields=["name", "site", "tenant", "status", "role", "u_height", "width", "description",
+                    "location", "facility_id"]
+        ))
         
         # Generate summary statistics
         status_counts = {}
@@ -598,7 +598,7 @@ def netbox_list_all_racks(
             
             # Get devices in this rack to calculate utilization
             rack_id = rack.get("id")
-            rack_devices = list(client.dcim.devices.filter(rack_id=rack_id))
+            rack_devices = list(client.dcim.devices.filter(rack_id=rack_id, fields=["position", "device_type"]))
             total_devices += len(rack_devices)
             
             # Calculate occupied units with defensive dictionary access
@@ -628,7 +628,7 @@ def netbox_list_all_racks(
         for rack in racks:
             # Get utilization details for this specific rack
             rack_id = rack.get("id")
-            rack_devices = list(client.dcim.devices.filter(rack_id=rack_id))
+            rack_devices = list(client.dcim.devices.filter(rack_id=rack_id, fields=["position", "device_type"]))
             rack_height = rack.get("u_height", 42)
             
             # Calculate occupied units for this rack with defensive dictionary access
@@ -211,12 +211,12 @@ def netbox_list_all_sites(
         if tenant_name:
             filters['tenant'] = tenant_name
         
-        # Execute filtered query with limit
-        sites = list(client.dcim.sites.filter(**filters))
-        
-        # Apply limit after fetching
-        if len(sites) > limit:
-            sites = sites[:limit]
+        # Execute filtered query with server-side limit, fetching only the summarized fields
+        sites = list(client.dcim.sites.filter(
+            **filters, limit=limit,
+            fields=["name", "slug", "status", "region", "tenant", "description", "physical_address",
+                    "contact_name", "contact_email"]
+        ))
         
         # Generate summary statistics
         status_counts = {}
@@ -226,6 +226,7 @@ def netbox_list_all_sites(
         # Collect device and rack statistics for each site
         total_devices = 0
         total_racks = 0
+        site_counts = {}
         
         for site in sites:
             # Status breakdown with defensive checks for dictionary access
@@ -254,21 +255,23 @@ def netbox_list_all_sites(
                     tenant_name = str(tenant_obj)
                 tenant_counts[tenant_name] = tenant_counts.get(tenant_name, 0) + 1
             
-            # Get basic counts for this site (efficient queries)
+            # Get basic counts for this site (count requests, no device rows)
             site_id = site.get("id")
-            site_devices = list(client.dcim.devices.filter(site_id=site_id))
-            site_racks = list(client.dcim.racks.filter(site_id=site_id))
+            rack_heights = client.dcim.racks.filter(site_id=site_id, fields=["u_height"])
+            site_counts[site_id] = {
+                "device_count": client.dcim.devices.count(site_id=site_id),
+                "rack_count": client.dcim.racks.count(site_id=site_id),
+                "total_rack_units": sum(rack.get("u_height") or 0 for rack in rack_heights),
+            }
             
-            total_devices += len(site_devices)
-            total_racks += len(site_racks)
+            total_devices += site_counts[site_id]["device_count"]
+            total_racks += site_counts[site_id]["rack_count"]
         
         # Create human-readable site list
         site_list = []
         for site in sites:
-            # Get counts for this specific site
-            site_id = site.get("id")
-            site_devices = list(client.dcim.devices.filter(site_id=site_id))
-            site_racks = list(client.dcim.racks.filter(site_id=site_id))
+            # Counts for this specific site were collected above
+            counts = site_counts[site.get("id")]
             
             # DEFENSIVE CHECK: Handle dictionary access for all site attributes
             status_obj = site.get("status", {})
@@ -303,9 +306,9 @@ def netbox_list_all_sites(
                 # DEFENSIVE CHECK: Ensure description is never None
                 "description": site.get("description", ""),
                 "physical_address": site.get("physical_address"),
-                "device_count": len(site_devices),
-                "rack_count": len(site_racks),
-                "total_rack_units": sum(rack.get("u_height", 0) for rack in site_racks if rack.get("u_height")),
+                "device_count": counts["device_count"],
+                "rack_count": counts["rack_count"],
+                "total_rack_units": counts["total_rack_units"],
                 "contact_name": site.get("contact_name"),
                 "contact_email": site.get("contact_email")
             }
@@ -154,7 +154,7 @@ def netbox_list_all_journal_entries(
     
     try:
         # Get journal entries with applied filters
-        journal_entries = list(client.extras.journal_entries.filter(**filter_params)[:limit])
+        journal_entries = list(client.extras.journal_entries.filter(**filter_params, limit=limit))
         
         # Process entries with defensive dict/object handling
         entries_summary = []
@@ -1186,32 +1186,8 @@ def netbox_find_duplicate_ips(
         # Step 2: Retrieve all IP addresses with filters
         logger.debug(f"Retrieving IP addresses with filters: {ip_filters}")
         try:
-            # Get IPs with pagination support
-            all_ips = []
-            offset = 0
-            batch_size = min(500, limit)  # Process in batches
-            
-            while len(all_ips) < limit:
-                remaining = limit - len(all_ips)
-                current_limit = min(batch_size, remaining)
-                
-                # Apply filters with pagination
-                current_filters = ip_filters.copy()
-                current_filters["limit"] = current_limit
-                current_filters["offset"] = offset
-                
-                batch_ips = client.ipam.ip_addresses.filter(**current_filters)
-                
-                if not batch_ips:
-                    break  # No more IPs available
-                
-                all_ips.extend(batch_ips)
-                offset += len(batch_ips)
-                
-                if len(batch_ips) < current_limit:
-                    break  # Last batch
-                
-                logger.debug(f"Retrieved {len(all_ips)} IPs so far...")
+            # The client fetches the pages of this window concurrently
+            all_ips = client.ipam.ip_addresses.filter(**ip_filters, limit=limit)
             
             logger.info(f"Retrieved {len(all_ips)} IP addresses for analysis")
             
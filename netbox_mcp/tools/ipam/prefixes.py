@@ -146,12 +146,8 @@ def netbox_list_all_prefixes(
         if family:
             filters['family'] = family
         
-        # Execute filtered query with limit
-        prefixes = list(client.ipam.prefixes.filter(**filters))
-        
-        # Apply limit after fetching
-        if len(prefixes) > limit:
-            prefixes = prefixes[:limit]
+        # Execute filtered query with server-side limit
+        prefixes = list(client.ipam.prefixes.filter(**filters, limit=limit))
         
         # Generate summary statistics
         status_counts = {}
@@ -227,12 +227,8 @@ def netbox_list_all_vlans(
         if role:
             filters['role'] = role
         
-        # Execute filtered query with limit
-        vlans = list(client.ipam.vlans.filter(**filters))
-        
-        # Apply limit after fetching
-        if len(vlans) > limit:
-            vlans = vlans[:limit]
+        # Execute filtered query with server-side limit
+        vlans = list(client.ipam.vlans.filter(**filters, limit=limit))
         
         # Generate summary statistics
         status_counts = {}
@@ -126,12 +126,8 @@ def netbox_list_all_vrfs(
         if enforce_unique is not None:
             filters['enforce_unique'] = enforce_unique
         
-        # Execute filtered query
-        vrfs = list(client.ipam.vrfs.filter(**filters))
-        
-        # Apply limit after fetching
-        if len(vrfs) > limit:
-            vrfs = vrfs[:limit]
+        # Execute filtered query with server-side limit
+        vrfs = list(client.ipam.vrfs.filter(**filters, limit=limit))
         
         # Generate summary statistics
         tenant_counts = {}
@@ -118,12 +118,8 @@ def netbox_list_all_tenant_groups(
         if parent_name:
             filters['parent'] = parent_name
         
-        # Execute filtered query
-        tenant_groups = list(client.tenancy.tenant_groups.filter(**filters))
-        
-        # Apply limit after fetching
-        if len(tenant_groups) > limit:
-            tenant_groups = tenant_groups[:limit]
+        # Execute filtered query with server-side limit
+        tenant_groups = list(client.tenancy.tenant_groups.filter(**filters, limit=limit))
         
         # Generate summary statistics
         parent_counts = {}
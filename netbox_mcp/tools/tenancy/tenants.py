@@ -532,12 +532,8 @@ def netbox_list_all_tenants(
         if status:
             filters['status'] = status
         
-        # Execute filtered query with limit
-        tenants = list(client.tenancy.tenants.filter(**filters))
-        
-        # Apply limit after fetching
-        if len(tenants) > limit:
-            tenants = tenants[:limit]
+        # Execute filtered query with server-side limit
+        tenants = list(client.tenancy.tenants.filter(**filters, limit=limit))
         
         # Generate summary statistics
         status_counts = {}
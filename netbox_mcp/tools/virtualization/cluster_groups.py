@@ -211,7 +211,7 @@ def netbox_list_all_cluster_groups(
     
     try:
         # Get cluster groups with applied filters
-        cluster_groups = list(client.virtualization.cluster_groups.filter(**filter_params)[:limit])
+        cluster_groups = list(client.virtualization.cluster_groups.filter(**filter_params, limit=limit))
         
         # Process cluster groups with defensive dict/object handling
         groups_summary = []
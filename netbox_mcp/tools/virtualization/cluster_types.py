@@ -211,7 +211,7 @@ def netbox_list_all_cluster_types(
     
     try:
         # Get cluster types with applied filters
-        cluster_types = list(client.virtualization.cluster_types.filter(**filter_params)[:limit])
+        cluster_types = list(client.virtualization.cluster_types.filter(**filter_params, limit=limit))
         
         # Process cluster types with defensive dict/object handling
         types_summary = []
@@ -429,7 +429,7 @@ def netbox_list_all_clusters(
     
     try:
         # Get clusters with applied filters
-        clusters = list(client.virtualization.clusters.filter(**filter_params)[:limit])
+        clusters = list(client.virtualization.clusters.filter(**filter_params, limit=limit))
         
         # Process clusters with defensive dict/object handling
         clusters_summary = []
@@ -293,7 +293,7 @@ def netbox_list_all_virtual_disks(
     
     try:
         # Get virtual disks with applied filters
-        virtual_disks = list(client.virtualization.virtual_disks.filter(**filter_params)[:limit])
+        virtual_disks = list(client.virtualization.virtual_disks.filter(**filter_params, limit=limit))
         
         # Process disks with defensive dict/object handling
         disks_summary = []
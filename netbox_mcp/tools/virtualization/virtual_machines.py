@@ -466,7 +466,7 @@ def netbox_list_all_virtual_machines(
     
     try:
         # Get VMs with applied filters
-        virtual_machines = list(client.virtualization.virtual_machines.filter(**filter_params)[:limit])
+        virtual_machines = list(client.virtualization.virtual_machines.filter(**filter_params, limit=limit))
         
         # Process VMs with defensive dict/object handling
         vms_summary = []
@@ -381,7 +381,7 @@ def netbox_list_all_vm_interfaces(
     
     try:
         # Get VM interfaces with applied filters
-        vm_interfaces = list(client.virtualization.interfaces.filter(**filter_params)[:limit])
+        vm_interfaces = list(client.virtualization.interfaces.filter(**filter_params, limit=limit))
         
         # Process interfaces with defensive dict/object handling
         interfaces_summary = []
@@ -81,7 +81,7 @@ def run_worker():
         
         # Initialize task manager
         redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-        task_manager = initialize_task_manager(redis_url)
+        task_manager = initialize_task_manager(redis_url, config.cache)
         
         if task_manager is None:
             logger.error("Failed to initialize task manager")
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Write coalescing for NetBox MCP Server
+
+Agents and bulk tools create objects one ``create()`` call at a time, which
+costs one HTTP round trip (and one NetBox transaction) per object. For the
+endpoints listed in ``safety.write_batch_endpoints`` a WriteBatcher buffers
+creates for up to ``write_batch_window_ms`` or ``write_batch_max_items``
+items and sends them as one list POST:
+
+- every caller still gets its own created object, or its own error
+- NetBox applies a list POST atomically, so when a list is rejected its
+  items are retried one by one to find out which of them was invalid
+- created objects are written through to the cache once per list
+
+Callers that create many objects themselves use
+``EndpointWrapper.submit_create()`` and collect the futures afterwards, so
+their creates share list POSTs instead of waiting out one window each.
+"""
+
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from .exceptions import NetBoxError
+
+if TYPE_CHECKING:
+    from .client import EndpointWrapper
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBatcher:
+    """
+    Coalesces single creates on one endpoint into list POSTs.
+
+    Args:
+        endpoint: EndpointWrapper the creates are sent through
+        window: Seconds to wait for more creates after the first one
+        max_items: Number of waiting creates that triggers an immediate send
+    """
+
+    def __init__(self, endpoint: 'EndpointWrapper', window: float, max_items: int):
+        self.endpoint = endpoint
+        self.object_type = endpoint._obj_type
+        self.window = window
+        self.max_items = max(max_items, 1)
+
+        self.lock = threading.Lock()
+        self.counters = {
+            "submitted": 0,
+            "flushes": 0,
+            "created": 0,
+            "failed": 0,
+            "retried_individually": 0,
+        }
+        self._pending: List[Tuple[Dict[str, Any], Future]] = []
+        self._timer: Optional[threading.Timer] = None
+
+    def submit(self, payload: Dict[str, Any]) -> Future:
+        """
+        Queue one create.
+
+        Args:
+            payload: Object data for creation
+
+        Returns:
+            Future resolving to the serialized created object, or raising
+            the NetBoxError for this object
+        """
+        future: Future = Future()
+        with self.lock:
+            self._pending.append((payload, future))
+            self.counters["submitted"] += 1
+            full = len(self._pending) >= self.max_items
+            if not full and self._timer is None:
+                self._timer = threading.Timer(self.window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self.flush()
+        return future
+
+    def flush(self) -> int:
+        """
+        Send every waiting create now.
+
+        Returns:
+            Number of creates sent
+        """
+        with self.lock:
+            batch, self._pending = self._pending, []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not batch:
+            return 0
+
+        try:
+            report = self.endpoint.bulk_create([payload for payload, _ in batch], confirm=True)
+        except Exception as e:
+            # Nothing was resolved yet; every caller gets the error
+            for _, future in batch:
+                future.set_exception(e if isinstance(e, NetBoxError) else NetBoxError(str(e)))
+            with self.lock:
+                self.counters["flushes"] += 1
+                self.counters["failed"] += len(batch)
+            return len(batch)
+
+        rejected = {}
+        for chunk in report["failed_chunks"]:
+            for index in range(chunk["start"], chunk["start"] + chunk["count"]):
+                rejected[index] = chunk
+
+        created = iter(report["results"])
+        retry = []
+        failed = 0
+        for index, (payload, future) in enumerate(batch):
+            chunk = rejected.get(index)
+            if chunk is None:
+                future.set_result(next(created))
+            elif chunk["count"] == 1:
+                # Sent on its own already; the error is this item's
+                failed += 1
+                future.set_exception(NetBoxError(f"Failed to create {self.object_type}: {chunk['error']}"))
+            else:
+                retry.append((payload, future))
+
+        for payload, future in retry:
+            try:
+                future.set_result(self.endpoint._create_now(payload))
+            except Exception as e:
+                failed += 1
+                future.set_exception(e)
+
+        logger.debug("Sent %s coalesced creates for %s (%s retried individually, %s failed)",
+                     len(batch), self.object_type, len(retry), failed)
+        with self.lock:
+            self.counters["flushes"] += 1
+            self.counters["created"] += len(batch) - failed
+            self.counters["failed"] += failed
+            self.counters["retried_individually"] += len(retry)
+        return len(batch)
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Batcher counters for the system status endpoint.
+
+        Returns:
+            Window settings, waiting creates and counters
+        """
+        with self.lock:
+            return {
+                "window_ms": self.window * 1000,
+                "max_items": self.max_items,
+                "pending": len(self._pending),
+                **self.counters,
+            }
@@ -0,0 +1,274 @@
+"""
+Shared fakes and factories for the NetBox MCP test suite.
+
+FakeTable is one NetBox endpoint over an in-memory table: list, detail and
+write requests, served to the synchronous client through `responses` and
+to the async client through an httpx MockTransport. Tests build the rows
+they need and assert on the requests the table recorded.
+"""
+
+import asyncio
+import json
+import re
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlparse
+
+import httpx
+import pytest
+import responses
+
+from netbox_mcp.client import CacheManager, NetBoxClient
+from netbox_mcp.config import CacheConfig, NetBoxConfig
+
+
+NETBOX_URL = "https://netbox.example.com"
+JSON = {"Content-Type": "application/json"}
+
+# Query parameters that shape a listing rather than filter it
+CONTROL_PARAMS = {"limit", "offset", "brief", "fields", "exclude", "ordering"}
+
+
+def make_config(**options) -> NetBoxConfig:
+    return NetBoxConfig(url=NETBOX_URL, token="test-token", **options)
+
+
+def make_client(**options) -> NetBoxClient:
+    return NetBoxClient(make_config(**options))
+
+
+def make_cache(**cache_options) -> CacheManager:
+    return CacheManager(make_config(cache=CacheConfig(**cache_options)))
+
+
+def record(path: str, object_id: int, **fields) -> Dict[str, Any]:
+    """A NetBox object as the API returns it, e.g. record("dcim/sites", 1, name="dc1")."""
+    return {"id": object_id, "url": f"{NETBOX_URL}/api/{path}/{object_id}/", **fields}
+
+
+class FakeTable:
+    """
+    One NetBox endpoint, e.g. /api/dcim/sites/, over an in-memory table.
+
+    Listings filter on any field the rows have (nested objects match on their
+    value, slug or, for ``<field>_id``, their ID; ``q`` searches names) and
+    paginate with ``next`` links.
+    Listings also honour fields/brief/exclude.
+    Objects are created one at a time or as a list.
+    Lists are also accepted for PATCH and DELETE; objects whose name starts
+    with "bad" fail validation.
+
+    Every GET is recorded in ``calls`` as its query parameters and every
+    request method in ``requests``.
+    Every write is recorded in ``writes`` as (method, body), with the object
+    ID standing in for the body of a detail DELETE.
+
+    Args:
+        path: API path of the endpoint, e.g. "dcim/sites"
+        rows: Objects in the table; each needs an "id"
+        page_size: Page size NetBox applies when a request sends no limit
+        max_page_size: NetBox MAX_PAGE_SIZE
+        delay: Seconds each request takes, see latency()
+        gated: Hold every request until ``release`` is set
+        status: Answer every request with this error status instead
+        next_id: ID of the first created object (default: after the rows)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        rows: Iterable[Dict[str, Any]] = (),
+        page_size: int = 50,
+        max_page_size: int = 1000,
+        delay: float = 0.0,
+        gated: bool = False,
+        status: int = 200,
+        next_id: Optional[int] = None,
+    ):
+        self.path = path
+        self.url_pattern = re.compile(rf"{NETBOX_URL}/api/{re.escape(path)}/.*")
+        self.rows = {row["id"]: row for row in rows}
+        self.page_size = page_size
+        self.max_page_size = max_page_size
+        self.delay = delay
+        self.status = status
+        self.next_id = next_id if next_id is not None else max(self.rows, default=0) + 1
+        self.release = threading.Event()
+        if not gated:
+            self.release.set()
+        self.calls: List[Dict[str, str]] = []
+        self.writes: List[Tuple[str, Any]] = []
+        self.requests: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def latency(self, params: Dict[str, str]) -> float:
+        """Seconds a request with these query parameters takes."""
+        return self.delay
+
+    def __call__(self, request):
+        """`responses` callback."""
+        self._enter()
+        try:
+            time.sleep(self.latency(self._params(request.url)))
+            status, payload = self.respond(request.method, request.url, request.body)
+        finally:
+            self._leave()
+        return status, JSON, "" if payload is None else json.dumps(payload)
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        """httpx MockTransport handler."""
+        self._enter()
+        try:
+            await asyncio.sleep(self.latency(self._params(str(request.url))))
+            status, payload = self.respond(request.method, str(request.url), request.content)
+        finally:
+            self._leave()
+        return httpx.Response(status) if payload is None else httpx.Response(status, json=payload)
+
+    def respond(self, method: str, url: str, body: Any = None) -> Tuple[int, Any]:
+        """Answer one request with (status, JSON payload or None)."""
+        parsed = urlparse(url)
+        query = parse_qs(parsed.query)
+        detail = re.search(r"/(\d+)/?$", parsed.path)
+        object_id = int(detail.group(1)) if detail else None
+        payload = json.loads(body) if body else None
+        with self.lock:
+            self.requests.append(method)
+            if method == "GET":
+                self.calls.append({name: ",".join(values) for name, values in query.items()})
+            else:
+                self.writes.append((method, payload if payload is not None else object_id))
+
+        self.release.wait(timeout=10)
+        if self.status >= 400:
+            return self.status, {"detail": "boom"}
+        if object_id is not None:
+            return self.detail(method, object_id, payload)
+        if method == "GET":
+            return self.listing(query)
+        return self.bulk(method, payload)
+
+    def listing(self, query: Dict[str, List[str]]) -> Tuple[int, Any]:
+        params = {name: values[0] for name, values in query.items()}
+        filters = {name: values for name, values in query.items() if name not in CONTROL_PARAMS}
+        with self.lock:
+            rows = [
+                row for _, row in sorted(self.rows.items())
+                if all(self.matches(row, name, values) for name, values in filters.items())
+            ]
+        offset = int(params.get("offset", 0))
+        limit = min(int(params.get("limit", self.page_size)) or self.max_page_size, self.max_page_size)
+        page = [self.project(row, params) for row in rows[offset:offset + limit]]
+
+        next_url = None
+        if offset + len(page) < len(rows):
+            kept = {name: values for name, values in query.items() if name not in ("limit", "offset")}
+            next_query = urlencode({**kept, "limit": limit, "offset": offset + len(page)}, doseq=True)
+            next_url = f"{NETBOX_URL}/api/{self.path}/?{next_query}"
+        return 200, {"count": len(rows), "next": next_url, "previous": None, "results": page}
+
+    def detail(self, method: str, object_id: int, payload: Any) -> Tuple[int, Any]:
+        with self.lock:
+            row = self.rows.get(object_id)
+            if row is None:
+                return 404, {"detail": "Not found."}
+            if method == "GET":
+                return 200, row
+            if method == "DELETE":
+                del self.rows[object_id]
+                return 204, None
+            if self.rejects(payload):
+                return 400, {"name": ["invalid"]}
+            row.update(payload)
+            return 200, row
+
+    def bulk(self, method: str, payload: Any) -> Tuple[int, Any]:
+        items = payload if isinstance(payload, list) else [payload]
+        if any(self.rejects(item) for item in items):
+            errors = [{"name": ["invalid"]} for _ in items]
+            return 400, errors if isinstance(payload, list) else errors[0]
+
+        with self.lock:
+            if method == "DELETE":
+                for item in items:
+                    self.rows.pop(item["id"], None)
+                return 204, None
+            if method == "PATCH":
+                for item in items:
+                    self.rows[item["id"]].update(item)
+                results = [self.rows[item["id"]] for item in items]
+                return 200, results if isinstance(payload, list) else results[0]
+            results = []
+            for item in items:
+                self.rows[self.next_id] = record(self.path, self.next_id, **item)
+                results.append(self.rows[self.next_id])
+                self.next_id += 1
+        return 201, results if isinstance(payload, list) else results[0]
+
+    @staticmethod
+    def matches(row: Dict[str, Any], name: str, values: List[str]) -> bool:
+        if name == "q":
+            return any(value.lower() in str(row.get("name", "")).lower() for value in values)
+        if name.endswith("_id") and isinstance(row.get(name[:-3]), dict):
+            actual = row[name[:-3]]["id"]
+        elif name in row:
+            actual = row[name]
+            if isinstance(actual, dict):
+                actual = actual.get("value", actual.get("slug"))
+        else:
+            # Filters on fields the table does not model are ignored
+            return True
+        return str(actual) in values
+
+    @staticmethod
+    def project(row: Dict[str, Any], params: Dict[str, str]) -> Dict[str, Any]:
+        if "fields" in params:
+            return {k: v for k, v in row.items() if k in params["fields"].split(",")}
+        if "brief" in params:
+            return {k: row[k] for k in ("id", "url", "display", "name") if k in row}
+        excluded = params.get("exclude", "").split(",")
+        return {k: v for k, v in row.items() if k not in excluded}
+
+    @staticmethod
+    def rejects(item: Any) -> bool:
+        return isinstance(item, dict) and str(item.get("name", "")).startswith("bad")
+
+    @staticmethod
+    def _params(url: str) -> Dict[str, str]:
+        return {name: values[0] for name, values in parse_qs(urlparse(url).query).items()}
+
+    def _enter(self) -> None:
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def _leave(self) -> None:
+        with self.lock:
+            self.in_flight -= 1
+
+
+def serve(*tables: FakeTable) -> responses.RequestsMock:
+    """A RequestsMock that routes every method on each table's URL to that table."""
+    mock = responses.RequestsMock(assert_all_requests_are_fired=False)
+    for table in tables:
+        for method in (responses.GET, responses.POST, responses.PUT, responses.PATCH, responses.DELETE):
+            mock.add_callback(method, table.url_pattern, callback=table)
+    return mock
+
+
+def transport(*tables: FakeTable) -> httpx.MockTransport:
+    """An httpx MockTransport that routes each request to the table owning its URL."""
+    async def route(request: httpx.Request) -> httpx.Response:
+        for table in tables:
+            if table.url_pattern.match(str(request.url)):
+                return await table.handler(request)
+        return httpx.Response(404, json={"detail": "Not found."})
+    return httpx.MockTransport(route)
+
+
+@pytest.fixture
+def client():
+    return make_client()
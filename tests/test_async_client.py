@@ -0,0 +1,283 @@
+"""
+Tests for the asyncio-native NetBox client.
+
+Uses an in-process httpx MockTransport to verify concurrent pagination,
+cache sharing with the synchronous key schema, write safety semantics and
+concurrent reads from synchronous tools through gather_reads().
+"""
+
+import asyncio
+from functools import partial
+
+import httpx
+import pytest
+
+from conftest import FakeTable, make_config, record, serve, transport
+from netbox_mcp import async_client, dependencies
+from netbox_mcp.async_client import AsyncNetBoxClient, gather_reads
+from netbox_mcp.client import NetBoxClient
+from netbox_mcp.tools.dcim.devices import netbox_get_device_info
+from netbox_mcp.config import CacheConfig, CacheEndpointConfig, SafetyConfig
+from netbox_mcp.exceptions import NetBoxConfirmationError, NetBoxError
+
+
+def make_site(site_id: int) -> dict:
+    return record(
+        "dcim/sites", site_id,
+        name=f"site-{site_id}",
+        slug=f"site-{site_id}",
+        status={"value": "active", "label": "Active"},
+    )
+
+
+@pytest.fixture
+def fake_netbox():
+    return FakeTable("dcim/sites", [make_site(i) for i in range(1, 26)], page_size=10, delay=0.01)
+
+
+def make_client(fake: FakeTable, dry_run: bool = False, **options) -> AsyncNetBoxClient:
+    config = make_config(safety=SafetyConfig(dry_run_mode=dry_run), **options)
+    return AsyncNetBoxClient(config, transport=httpx.MockTransport(fake.handler))
+
+
+class TestAsyncReads:
+    """Read path: pagination, serialization and caching."""
+
+    @pytest.mark.asyncio
+    async def test_filter_fetches_remaining_pages_concurrently_in_order(self, fake_netbox):
+        async with make_client(fake_netbox) as client:
+            sites = await client.dcim.sites.filter(status="active", page_size=10)
+
+        assert [s["id"] for s in sites] == list(range(1, 26))
+        assert len(fake_netbox.requests) == 3
+        assert fake_netbox.max_in_flight == 2  # pages 2 and 3 fetched together
+
+    @pytest.mark.asyncio
+    async def test_results_match_sync_serialization(self, fake_netbox):
+        async with make_client(fake_netbox) as client:
+            sites = await client.dcim.sites.filter(name="site-3")
+
+        assert sites == [{**make_site(3), "status": "active"}]
+
+    @pytest.mark.asyncio
+    async def test_filter_uses_shared_cache_keys(self, fake_netbox):
+        async with make_client(fake_netbox) as client:
+            await client.dcim.sites.filter(name="site-3")
+            await client.dcim.sites.filter(name="site-3")
+
+            assert len(fake_netbox.requests) == 1
+            assert client.cache.get("dcim.sites:name=site-3", "dcim.sites") is not None
+
+    @pytest.mark.asyncio
+    async def test_windows_and_projections_match_sync_reads_on_a_shared_cache(self, fake_netbox):
+        reads = [{"limit": 5}, {"limit": 5, "offset": 10}, {"fields": ["name"]}, {"status": "active", "brief": True}]
+        sync_client = NetBoxClient(make_config())
+        transport = httpx.MockTransport(fake_netbox.handler)
+        async with AsyncNetBoxClient(sync_client.config, cache=sync_client.cache, transport=transport) as client:
+            async_results = [await client.dcim.sites.filter(**read) for read in reads]
+        requests = len(fake_netbox.requests)
+
+        with serve(fake_netbox):
+            shared = [sync_client.dcim.sites.filter(**read) for read in reads]
+            uncached = [NetBoxClient(make_config()).dcim.sites.filter(**read) for read in reads]
+
+        assert [[s["id"] for s in result] for result in async_results[:2]] == [[1, 2, 3, 4, 5], [11, 12, 13, 14, 15]]
+        assert async_results == shared == uncached
+        assert len(fake_netbox.requests) == requests + len(reads)  # only the uncached client went to NetBox
+
+    @pytest.mark.asyncio
+    async def test_count_is_cached_under_the_sync_key(self, fake_netbox):
+        async with make_client(fake_netbox) as client:
+            assert await client.dcim.sites.count(status="active") == 25
+            assert await client.dcim.sites.count(status="active") == 25
+
+            assert len(fake_netbox.requests) == 1
+            assert client.cache.get("dcim.sites:count:status=active", "dcim.sites") == 25
+
+    @pytest.mark.asyncio
+    async def test_search_term_is_part_of_the_cache_key(self, fake_netbox):
+        async with make_client(fake_netbox) as client:
+            first = await client.dcim.sites.filter("site-2")
+            second = await client.dcim.sites.filter("site-3")
+
+            assert [s["name"] for s in first] == ["site-2"] + [f"site-{i}" for i in range(20, 26)]
+            assert [s["name"] for s in second] == ["site-3"]
+            assert len(fake_netbox.requests) == 2
+            assert client.cache.get("dcim.sites:q=site-3", "dcim.sites") == second
+
+    @pytest.mark.asyncio
+    async def test_misses_use_the_negative_cache(self, fake_netbox):
+        async with make_client(fake_netbox) as client:
+            assert await client.dcim.sites.filter(name="nope") == []
+            assert await client.dcim.sites.filter(name="nope") == []
+            assert await client.dcim.sites.get(404) is None
+            assert await client.dcim.sites.get(404) is None
+
+            assert len(fake_netbox.requests) == 2
+            assert client.cache.is_negative("dcim.sites:name=nope", "dcim.sites")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_reads_share_one_request(self, fake_netbox):
+        async with make_client(fake_netbox) as client:
+            results = await asyncio.gather(*[client.dcim.sites.filter(name="site-3") for _ in range(5)])
+
+            assert all(result == results[0] for result in results)
+            assert len(fake_netbox.requests) == 1
+            assert client.cache.stats["coalesced_calls"] == 4
+
+    @pytest.mark.asyncio
+    async def test_stale_hits_are_revalidated_in_the_background(self, fake_netbox):
+        cache = CacheConfig(endpoints={"dcim.sites": CacheEndpointConfig(ttl=1, stale_while_revalidate=60)})
+        async with make_client(fake_netbox, cache=cache) as client:
+            await client.dcim.sites.filter(name="site-3")
+            await asyncio.sleep(1.1)
+            fake_netbox.rows[3]["slug"] = "renamed"
+
+            stale = await client.dcim.sites.filter(name="site-3")
+            await asyncio.sleep(0.2)
+            fresh = await client.dcim.sites.filter(name="site-3")
+
+            assert stale[0]["slug"] == "site-3"
+            assert fresh[0]["slug"] == "renamed"
+            assert len(fake_netbox.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_independent_reads_run_concurrently(self, fake_netbox):
+        async with make_client(fake_netbox) as client:
+            results = await asyncio.gather(*[client.dcim.sites.get(i) for i in range(1, 6)])
+
+        assert [r["id"] for r in results] == [1, 2, 3, 4, 5]
+        assert fake_netbox.max_in_flight == 5
+
+    @pytest.mark.asyncio
+    async def test_get_returns_none_on_404(self, fake_netbox):
+        async with make_client(fake_netbox) as client:
+            assert await client.dcim.sites.get(404) is None
+
+    @pytest.mark.asyncio
+    async def test_unknown_app_raises_attribute_error(self, fake_netbox):
+        async with make_client(fake_netbox) as client:
+            with pytest.raises(AttributeError):
+                client.not_an_app
+
+
+class TestAsyncWrites:
+    """Write path: confirmation, dry-run and write-through caching."""
+
+    @pytest.mark.asyncio
+    async def test_create_requires_confirm(self, fake_netbox):
+        async with make_client(fake_netbox) as client:
+            with pytest.raises(NetBoxConfirmationError):
+                await client.dcim.sites.create(name="new-site")
+
+    @pytest.mark.asyncio
+    async def test_dry_run_sends_no_request(self, fake_netbox):
+        async with make_client(fake_netbox, dry_run=True) as client:
+            result = await client.dcim.sites.create(name="new-site", confirm=True)
+
+        assert result["id"] == "dry-run-generated-id"
+        assert fake_netbox.requests == []
+
+    @pytest.mark.asyncio
+    async def test_create_writes_through_and_drops_matching_queries(self, fake_netbox):
+        async with make_client(fake_netbox) as client:
+            await client.dcim.sites.filter(name="site-3")
+            await client.dcim.sites.filter(status="active")
+            created = await client.dcim.sites.create(name="new-site", slug="new-site", confirm=True)
+            requests = len(fake_netbox.requests)
+
+            assert created["name"] == "new-site"
+            assert client.cache.get("dcim.sites:name=site-3", "dcim.sites") is not None
+            assert client.cache.get("dcim.sites:status=active", "dcim.sites") is None
+            assert (await client.dcim.sites.get(created["id"]))["name"] == "new-site"
+            assert len(fake_netbox.requests) == requests
+
+    @pytest.mark.asyncio
+    async def test_update_on_missing_object_raises(self, fake_netbox):
+        async with make_client(fake_netbox) as client:
+            with pytest.raises(NetBoxError):
+                await client.dcim.sites.update(404, status="planned", confirm=True)
+
+
+class TestGatherReads:
+    """gather_reads(): concurrent reads from synchronous tools."""
+
+    @pytest.fixture
+    def sync_client(self, fake_netbox, monkeypatch):
+        routed = partial(AsyncNetBoxClient, transport=transport(fake_netbox))
+        monkeypatch.setattr(async_client, "AsyncNetBoxClient", routed)
+        return NetBoxClient(make_config())
+
+    def test_reads_run_concurrently_and_fill_the_shared_cache(self, fake_netbox, sync_client):
+        site, other, total = gather_reads(
+            sync_client,
+            lambda c: c.dcim.sites.get(1),
+            lambda c: c.dcim.sites.get(2),
+            lambda c: c.dcim.sites.count(),
+        )
+
+        assert (site["id"], other["id"], total) == (1, 2, 25)
+        assert fake_netbox.max_in_flight == 3
+        with serve(fake_netbox):
+            assert sync_client.dcim.sites.get(2) == other
+        assert len(fake_netbox.requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_runs_on_its_own_loop_when_called_on_an_event_loop_thread(self, sync_client):
+        site, = gather_reads(sync_client, lambda c: c.dcim.sites.get(1))
+
+        assert site["name"] == "site-1"
+
+    def test_reads_run_on_the_sync_client_without_httpx(self, fake_netbox, sync_client, monkeypatch):
+        monkeypatch.setattr(async_client, "HTTPX_AVAILABLE", False)
+
+        with serve(fake_netbox):
+            site, total = gather_reads(sync_client, lambda c: c.dcim.sites.get(1), lambda c: c.dcim.sites.count())
+
+        assert (site["name"], total) == ("site-1", 25)
+        assert fake_netbox.max_in_flight == 1
+
+    def test_device_info_fetches_interfaces_and_cables_concurrently(self, monkeypatch):
+        devices = FakeTable("dcim/devices", [record("dcim/devices", 1, name="rtr-01")])
+        interfaces = FakeTable(
+            "dcim/interfaces",
+            [record("dcim/interfaces", i, name=f"eth{i}", device={"id": 1}) for i in range(1, 31)],
+            delay=0.02,
+        )
+        cables = FakeTable("dcim/cables", [record("dcim/cables", i, termination_a_id=1) for i in (1, 2)], delay=0.02)
+        routed = partial(AsyncNetBoxClient, transport=transport(interfaces, cables))
+        monkeypatch.setattr(async_client, "AsyncNetBoxClient", routed)
+
+        with serve(devices):
+            info = netbox_get_device_info(NetBoxClient(make_config()), "rtr-01", interface_limit=20)
+
+        assert info["interface_pagination"] == {
+            "total_count": 30, "returned_count": 20, "limit": 20, "truncated": True
+        }
+        assert [c["id"] for c in info["cables"]] == [1, 2]
+        assert interfaces.max_in_flight == 2
+        assert cables.max_in_flight == 2
+
+
+def test_each_event_loop_gets_its_own_async_client_and_reset_closes_them(monkeypatch):
+    sync_client = NetBoxClient(make_config())
+    monkeypatch.setattr(dependencies, "get_netbox_client", lambda: sync_client)
+
+    async def provide():
+        return await dependencies.get_async_netbox_client(), await dependencies.get_async_netbox_client()
+
+    loops = [asyncio.new_event_loop() for _ in range(2)]
+    try:
+        (first, again), (second, _) = [loop.run_until_complete(provide()) for loop in loops]
+
+        assert first is again
+        assert first is not second
+        assert first.cache is second.cache is sync_client.cache
+
+        dependencies.reset_client_instance()
+
+        assert first._http.is_closed and second._http.is_closed
+        assert len(dependencies._async_clients) == 0
+    finally:
+        for loop in loops:
+            loop.close()
@@ -0,0 +1,127 @@
+"""
+Micro-benchmarks for CacheManager hot paths.
+
+Each benchmark records its measurements with ``record_property`` (they appear
+in JUnit reports) and asserts on the scaling behaviour rather than on absolute
+timings, so results stay meaningful on slow CI hosts.
+Deselect with: pytest -m "not slow"
+"""
+
+import copy
+import threading
+import time
+
+import pytest
+
+from conftest import make_cache
+from netbox_mcp.client import CacheManager
+
+
+def fill_cache(cache: CacheManager, background_entries: int, types: int = 20) -> None:
+    """Populate the cache with entries that must NOT be touched by invalidation."""
+    for i in range(background_entries):
+        object_type = f"dcim.type-{i % types}"
+        cache.set(f"{object_type}:name=obj-{i}", [{"id": i}], object_type)
+
+
+def time_invalidation(cache: CacheManager, rounds: int = 200) -> float:
+    """Average seconds per invalidation of a 10-entry object type."""
+    elapsed = 0.0
+    for _ in range(rounds):
+        for i in range(10):
+            cache.set(f"ipam.vlans:vid={i}", [{"id": i}], "ipam.vlans")
+        start = time.perf_counter()
+        cache.invalidate_pattern("ipam.vlans")
+        cache.invalidate_for_object("ipam.vlans", 3)
+        elapsed += time.perf_counter() - start
+    return elapsed / rounds
+
+
+@pytest.mark.slow
+def test_invalidation_cost_is_flat_with_cache_size(record_property):
+    timings = {}
+    for size in (1_000, 20_000):
+        cache = make_cache(max_items=400_000)
+        fill_cache(cache, size)
+        timings[size] = time_invalidation(cache)
+
+    for size, seconds in timings.items():
+        record_property(f"invalidation_us_{size}_entries", round(seconds * 1e6, 1))
+
+    # A full key scan grows ~20x here; indexed invalidation stays flat
+    assert timings[20_000] < timings[1_000] * 4
+
+
+THREAD_COUNTS = (1, 2, 4, 8, 16, 32)
+
+
+def throughput(threads: int, operation, ops_per_thread: int = 5_000) -> float:
+    """Aggregate operations per second of ``operation(thread, i)`` run on ``threads`` threads."""
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(thread):
+        barrier.wait()
+        for i in range(ops_per_thread):
+            operation(thread, i)
+
+    pool = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+    for thread in pool:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    return threads * ops_per_thread / (time.perf_counter() - start)
+
+
+@pytest.mark.slow
+def test_hit_miss_set_throughput_across_threads(record_property):
+    cache = make_cache(max_items=400_000)
+    for i in range(1_000):
+        cache.set(f"dcim.sites:name=site-{i}", [{"id": i, "name": f"site-{i}"}], "dcim.sites")
+
+    operations = {
+        "hit": lambda thread, i: cache.get(f"dcim.sites:name=site-{i % 1_000}", "dcim.sites"),
+        "miss": lambda thread, i: cache.get(f"dcim.sites:name=absent-{i}", "dcim.sites"),
+        "set": lambda thread, i: cache.set(f"dcim.devices:t{thread}={i % 500}", [{"id": i}], "dcim.devices"),
+    }
+    results = {
+        name: {threads: throughput(threads, operation) for threads in THREAD_COUNTS}
+        for name, operation in operations.items()
+    }
+
+    for name, by_threads in results.items():
+        for threads, ops in by_threads.items():
+            record_property(f"{name}_ops_per_s_{threads}_threads", round(ops))
+
+    stats = cache.get_stats()
+    assert stats["hits"] == sum(THREAD_COUNTS) * 5_000
+    # Hits bypass the lock, so they stay cheaper than writes and do not collapse under contention
+    assert results["hit"][32] > results["set"][32]
+    assert results["hit"][32] > results["hit"][1] * 0.25
+
+
+@pytest.mark.slow
+def test_frozen_hits_cost_less_than_defensive_deep_copies(record_property):
+    cache = make_cache(max_items=400_000)
+    listing = [
+        {"id": i, "name": f"dev-{i}", "status": "active", "site": 1,
+         "tags": [{"id": 1, "name": "prod"}], "custom_fields": {"owner": "noc", "rack_u": i % 42}}
+        for i in range(1_000)
+    ]
+    cache.set("dcim.devices:site=dc1", listing, "dcim.devices")
+
+    def average(hit, rounds: int = 200) -> float:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            hit()
+        return (time.perf_counter() - start) / rounds
+
+    frozen = average(lambda: cache.get("dcim.devices:site=dc1", "dcim.devices"))
+    deep_copied = average(lambda: copy.deepcopy(cache.get("dcim.devices:site=dc1", "dcim.devices")))
+
+    record_property("frozen_hit_us", round(frozen * 1e6, 1))
+    record_property("deepcopy_hit_us", round(deep_copied * 1e6, 1))
+
+    # Zero-copy hits avoid re-allocating every record and nested value
+    assert frozen * 10 < deep_copied
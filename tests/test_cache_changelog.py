@@ -0,0 +1,229 @@
+"""
+Tests for changelog-driven cache invalidation.
+
+A `responses`-backed fake NetBox serves a device table together with a
+stand-in changelog endpoint. Changes are made "outside" the client, directly
+on the fake, so the only way the cache can learn about them is the poller.
+"""
+
+import json
+import re
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import responses
+
+from conftest import JSON, NETBOX_URL, FakeTable, record
+from netbox_mcp.cache_changelog import ChangelogPoller, model_matches_endpoint
+
+
+CHANGES_URL = re.compile(rf"{NETBOX_URL}/api/(core|extras)/object-changes/.*")
+
+
+def device(device_id, name, status="active", site_id=1):
+    return record(
+        "dcim/devices", device_id,
+        name=name,
+        status={"value": status, "label": status.title()},
+        site={"id": site_id, "url": f"{NETBOX_URL}/api/dcim/sites/{site_id}/", "name": f"dc{site_id}"},
+    )
+
+
+def model_data(record):
+    """The changelog's flat snapshot of a device."""
+    return {"name": record["name"], "status": record["status"]["value"], "site": record["site"]["id"]}
+
+
+class FakeNetBox:
+    """A device table plus a changelog that records changes made through the fake."""
+
+    def __init__(self, changelog_path="core"):
+        self.devices = FakeTable("dcim/devices", [device(1, "sw1"), device(2, "sw2")])
+        self.changes = [{"id": 40, "changed_object_type": "dcim.site", "changed_object_id": 9, "action": "create"}]
+        self.changelog_path = changelog_path
+        self.changelog_reads = 0
+
+    @property
+    def device_reads(self):
+        return len(self.devices.calls)
+
+    def record(self, action, record, prechange=None):
+        self.changes.append({
+            "id": self.changes[-1]["id"] + 1,
+            "changed_object_type": "dcim.device",
+            "changed_object_id": record["id"],
+            "action": {"value": action, "label": action.title()},
+            "prechange_data": prechange,
+            "postchange_data": model_data(record) if action != "delete" else None,
+        })
+
+    def external_update(self, device_id, **changes):
+        before = model_data(self.devices.rows[device_id])
+        updated = dict(self.devices.rows[device_id])
+        for name, value in changes.items():
+            updated[name] = {"value": value, "label": value.title()} if name == "status" else value
+        self.devices.rows[device_id] = updated
+        self.record("update", updated, before)
+
+    def external_create(self, device_id, name, **fields):
+        self.devices.rows[device_id] = device(device_id, name, **fields)
+        self.record("create", self.devices.rows[device_id])
+
+    def external_delete(self, device_id):
+        record = self.devices.rows.pop(device_id)
+        self.record("delete", record, model_data(record))
+
+    def serve_changes(self, request):
+        self.changelog_reads += 1
+        parsed = urlparse(request.url)
+        if f"/api/{self.changelog_path}/" not in parsed.path:
+            return 404, JSON, json.dumps({"detail": "Not found."})
+        params = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        rows = [change for change in self.changes if change["id"] > int(params.get("id__gt", 0))]
+        rows.sort(key=lambda change: change["id"], reverse=params.get("ordering") == "-id")
+        rows = rows[:int(params.get("limit", 50))]
+        return 200, JSON, json.dumps({"count": len(rows), "next": None, "previous": None, "results": rows})
+
+
+@pytest.fixture
+def netbox():
+    fake = FakeNetBox()
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mock:
+        mock.add_callback(responses.GET, fake.devices.url_pattern, callback=fake.devices)
+        mock.add_callback(responses.GET, CHANGES_URL, callback=fake.serve_changes)
+        yield fake
+
+
+@pytest.fixture
+def poller(client, netbox):
+    poller = ChangelogPoller(client, interval=60, page_size=2)
+    poller.poll_once()
+    return poller
+
+
+class TestChangelogPoller:
+    """Changes made anywhere invalidate exactly the cache entries they affect."""
+
+    def test_first_poll_starts_at_the_newest_change(self, poller, netbox):
+        assert poller.cursor == 40
+        assert poller.status()["changes_seen"] == 0
+
+    def test_external_update_refreshes_cached_object_in_place(self, client, netbox, poller):
+        assert client.dcim.devices.get(1)["name"] == "sw1"
+
+        netbox.external_update(1, name="core-sw1")
+        poller.poll_once()
+        reads = netbox.device_reads
+
+        assert client.dcim.devices.get(1)["name"] == "core-sw1"
+        assert netbox.device_reads == reads
+        assert poller.status()["objects_refreshed"] == 1
+
+    def test_update_drops_only_queries_on_changed_fields(self, client, netbox, poller):
+        client.dcim.devices.filter(status="active")
+        client.dcim.devices.filter(site_id=1)
+
+        netbox.external_update(1, status="offline")
+        poller.poll_once()
+        reads = netbox.device_reads
+
+        by_site = client.dcim.devices.filter(site_id=1)
+        assert netbox.device_reads == reads
+        assert [d["status"] for d in by_site] == ["offline", "active"]
+
+        assert [d["id"] for d in client.dcim.devices.filter(status="active")] == [2]
+        assert netbox.device_reads == reads + 1
+
+    def test_external_create_drops_listings_and_negative_answers(self, client, netbox, poller):
+        client.dcim.devices.filter(site_id=1)
+        assert client.dcim.devices.filter(name="sw3") == []
+
+        netbox.external_create(3, "sw3")
+        poller.poll_once()
+
+        assert [d["id"] for d in client.dcim.devices.filter(site_id=1)] == [1, 2, 3]
+        assert [d["id"] for d in client.dcim.devices.filter(name="sw3")] == [3]
+
+    def test_external_delete_keeps_unrelated_entries(self, client, netbox, poller):
+        client.dcim.devices.get(1)
+        client.dcim.devices.filter(site_id=1)
+
+        netbox.external_delete(2)
+        poller.poll_once()
+        reads = netbox.device_reads
+
+        assert client.dcim.devices.get(1)["id"] == 1
+        assert netbox.device_reads == reads
+        assert [d["id"] for d in client.dcim.devices.filter(site_id=1)] == [1]
+        assert netbox.device_reads == reads + 1
+
+    def test_changes_to_uncached_endpoints_cost_nothing(self, client, netbox, poller):
+        client.dcim.devices.get(1)
+        netbox.changes.append({"id": 99, "changed_object_type": "ipam.ipaddress", "changed_object_id": 5,
+                               "action": "update", "prechange_data": {}, "postchange_data": {"status": "dhcp"}})
+        reads = netbox.device_reads
+
+        assert poller.poll_once() == 1
+
+        assert netbox.device_reads == reads
+        assert poller.status()["changes_applied"] == 0
+        assert poller.cursor == 99
+
+    def test_pages_through_changes_after_the_cursor(self, client, netbox, poller):
+        client.dcim.devices.get(1)
+        for name in ("a", "b", "c", "d", "e"):
+            netbox.external_update(1, name=name)
+
+        assert poller.poll_once() == 5
+        assert client.dcim.devices.get(1)["name"] == "e"
+        assert poller.cursor == netbox.changes[-1]["id"]
+
+    def test_backlog_beyond_limit_clears_the_cache(self, client, netbox):
+        poller = ChangelogPoller(client, interval=60, page_size=2, max_backlog=3)
+        poller.poll_once()
+        client.dcim.devices.get(1)
+        for name in ("a", "b", "c", "d"):
+            netbox.external_update(2, name=name)
+
+        poller.poll_once()
+
+        assert poller.status()["resyncs"] == 1
+        assert poller.cursor == netbox.changes[-1]["id"]
+        assert client.cache.get_stats()["size"] == 0
+
+    def test_falls_back_to_the_pre_4_1_changelog_endpoint(self, client, netbox):
+        netbox.changelog_path = "extras"
+        poller = ChangelogPoller(client, interval=60)
+
+        poller.poll_once()
+
+        assert poller.status()["endpoint"] == "extras/object-changes/"
+        assert poller.cursor == 40
+
+    def test_failed_poll_keeps_the_cursor(self, client, netbox, poller):
+        netbox.external_update(1, name="x")
+        netbox.changelog_path = "gone"
+
+        poller.poll_once()
+
+        assert poller.cursor == 40
+        assert poller.status()["errors"] == 1
+
+
+@pytest.mark.parametrize("model, endpoint", [
+    ("device", "devices"),
+    ("devicetype", "device-types"),
+    ("ipaddress", "ip-addresses"),
+    ("prefix", "prefixes"),
+    ("interface", "interfaces"),
+    ("vlangroup", "vlan-groups"),
+    ("inventoryitem", "inventory-items"),
+    ("rackreservation", "rack-reservations"),
+])
+def test_changelog_models_map_to_endpoints(model, endpoint):
+    assert model_matches_endpoint(model, endpoint)
+
+
+def test_models_do_not_match_neighbouring_endpoints():
+    assert not model_matches_endpoint("device", "device-types")
+    assert not model_matches_endpoint("devicetype", "devices")
@@ -0,0 +1,663 @@
+"""
+Tests for CacheManager storage, indexing and invalidation behaviour.
+"""
+
+import copy
+import threading
+import time
+
+import pytest
+
+from conftest import make_cache
+from netbox_mcp.config import CacheNegativeTTLConfig, CacheSWRConfig, CacheTTLConfig
+
+
+def devices(*ids):
+    return [{"id": i, "name": f"dev-{i}"} for i in ids]
+
+
+class TestReverseIndexInvalidation:
+    """Invalidation resolves affected keys through the reverse indexes."""
+
+    def setup_method(self):
+        self.cache = make_cache()
+        self.cache.set("dcim.devices:site=dc1", devices(1, 2), "dcim.devices")
+        self.cache.set("dcim.devices:site=dc2", devices(3), "dcim.devices")
+        self.cache.set("dcim.devices:get:id=1", devices(1)[0], "dcim.devices")
+        self.cache.set("dcim.devices:get:id=3", devices(3)[0], "dcim.devices")
+        self.cache.set("dcim.device-types:slug=x", [{"id": 7}], "dcim.device-types")
+        self.cache.set("dcim.sites:name=dc1", [{"id": 1}], "dcim.sites")
+
+    def test_type_prefix_pattern_matches_related_types(self):
+        removed = self.cache.invalidate_pattern("dcim.device")
+
+        assert removed == 5
+        assert self.cache.get("dcim.sites:name=dc1", "dcim.sites") is not None
+
+    def test_underscore_pattern_matches_endpoint_spelling(self):
+        removed = self.cache.invalidate_pattern("dcim.device_types")
+
+        assert removed == 1
+        assert self.cache.get("dcim.device-types:slug=x", "dcim.device-types") is None
+
+    def test_pattern_with_key_suffix_only_matches_that_query(self):
+        removed = self.cache.invalidate_pattern("dcim.devices:site=dc2")
+
+        assert removed == 1
+        assert self.cache.get("dcim.devices:site=dc1", "dcim.devices") is not None
+
+    def test_object_invalidation_keeps_unrelated_queries(self):
+        removed = self.cache.invalidate_for_object("dcim.devices", 1)
+
+        assert removed == 2
+        assert self.cache.get("dcim.devices:get:id=1", "dcim.devices") is None
+        assert self.cache.get("dcim.devices:site=dc1", "dcim.devices") is None
+        assert self.cache.get("dcim.devices:get:id=3", "dcim.devices") is not None
+        assert self.cache.get("dcim.devices:site=dc2", "dcim.devices") is not None
+        assert self.cache.get("dcim.device-types:slug=x", "dcim.device-types") is not None
+
+    def test_invalidation_counts_in_stats(self):
+        self.cache.invalidate_pattern("dcim.sites")
+
+        assert self.cache.get_stats()["invalidations"] == 1
+
+    def test_clear_resets_indexes(self):
+        self.cache.clear()
+
+        assert self.cache.invalidate_pattern("dcim.devices") == 0
+
+
+def test_expired_keys_leave_the_index():
+    cache = make_cache(ttl=CacheTTLConfig(devices=0), stale_while_revalidate=CacheSWRConfig(devices=0))
+
+    cache.set("dcim.devices:site=dc1", devices(1), "dcim.devices")
+    cache.set("dcim.devices:site=dc2", devices(2), "dcim.devices")
+
+    assert "dcim.devices:site=dc1" not in cache._key_refs
+    assert ("dcim.devices", 1) not in cache._object_index
+
+
+def test_overwriting_a_key_replaces_its_index_entries():
+    cache = make_cache()
+
+    cache.set("dcim.devices:site=dc1", devices(1), "dcim.devices")
+    cache.set("dcim.devices:site=dc1", devices(2), "dcim.devices")
+
+    assert cache.invalidate_for_object("dcim.devices", 1) == 0
+    assert ("dcim.devices", 1) not in cache._object_index
+    assert cache.get("dcim.devices:site=dc1", "dcim.devices") == devices(2)
+
+
+class TestEntityStore:
+    """Query entries share one normalized copy of each object."""
+
+    def setup_method(self):
+        self.cache = make_cache()
+        self.cache.set("dcim.devices:site=dc1", devices(1, 2, 3), "dcim.devices")
+        self.cache.set("dcim.devices:role=leaf", devices(3, 2), "dcim.devices")
+        self.cache.set("dcim.devices:get:id=2", devices(2)[0], "dcim.devices")
+
+    def test_overlapping_queries_share_entities(self):
+        stats = self.cache.get_stats()
+
+        assert stats["entities"] == 3
+        assert stats["entity_references"] == 6
+        first = self.cache.get("dcim.devices:site=dc1", "dcim.devices")
+        second = self.cache.get("dcim.devices:role=leaf", "dcim.devices")
+        assert first[1] is second[1]
+
+    def test_query_order_is_preserved(self):
+        result = self.cache.get("dcim.devices:role=leaf", "dcim.devices")
+
+        assert [d["id"] for d in result] == [3, 2]
+
+    def test_update_entity_is_visible_to_every_query(self):
+        assert self.cache.update_entity("dcim.devices", {"id": 2, "name": "renamed"})
+
+        assert self.cache.get("dcim.devices:site=dc1", "dcim.devices")[1]["name"] == "renamed"
+        assert self.cache.get("dcim.devices:role=leaf", "dcim.devices")[1]["name"] == "renamed"
+        assert self.cache.get("dcim.devices:get:id=2", "dcim.devices")["name"] == "renamed"
+
+    def test_update_entity_ignores_uncached_objects(self):
+        assert not self.cache.update_entity("dcim.devices", {"id": 99, "name": "new"})
+        assert self.cache.get_stats()["entities"] == 3
+
+    def test_query_missing_an_entity_is_a_miss(self):
+        del self.cache._entities["dcim.devices"][3]
+
+        assert self.cache.get("dcim.devices:site=dc1", "dcim.devices") is None
+        assert "dcim.devices:site=dc1" not in self.cache._key_refs
+        assert self.cache.get("dcim.devices:get:id=2", "dcim.devices") is not None
+
+    def test_non_object_values_are_stored_as_is(self):
+        self.cache.set("dcim.devices:count", 42, "dcim.devices")
+        self.cache.set("dcim.devices:site=empty", [], "dcim.devices")
+
+        assert self.cache.get("dcim.devices:count", "dcim.devices") == 42
+        assert self.cache.get("dcim.devices:site=empty", "dcim.devices") == []
+
+    def test_pattern_invalidation_drops_entities(self):
+        self.cache.invalidate_pattern("dcim.devices")
+
+        assert self.cache.get_stats()["entities"] == 0
+
+
+class TestWriteThrough:
+    """Written objects are cached and only the queries they may appear in are dropped."""
+
+    def setup_method(self):
+        self.cache = make_cache()
+        self.cache.set("dcim.devices:name=dev-1", devices(1), "dcim.devices")
+        self.cache.set("dcim.devices:name=dev-2", devices(2), "dcim.devices")
+        self.cache.set("dcim.devices:site_id=3", devices(1, 2), "dcim.devices")
+        self.cache.set("dcim.devices:count:name=dev-9", 0, "dcim.devices")
+        self.cache.set("dcim.devices:get:id=2", devices(2)[0], "dcim.devices")
+
+    def test_created_object_is_readable_and_keeps_unrelated_queries(self):
+        self.cache.write_through("dcim.devices", {"id": 9, "name": "dev-9"})
+
+        assert self.cache.get("dcim.devices:get:id=9", "dcim.devices") == {"id": 9, "name": "dev-9"}
+        assert self.cache.get("dcim.devices:name=dev-1", "dcim.devices") is not None
+        assert self.cache.get("dcim.devices:count:name=dev-9", "dcim.devices") is None
+        # Unknown fields cannot rule a match out
+        assert self.cache.get("dcim.devices:site_id=3", "dcim.devices") is None
+
+    def test_update_drops_queries_of_old_and_new_version(self):
+        previous = self.cache.get_entity("dcim.devices", 2)
+        self.cache.write_through("dcim.devices", {"id": 2, "name": "dev-1"}, previous)
+
+        assert self.cache.get("dcim.devices:name=dev-1", "dcim.devices") is None
+        assert self.cache.get("dcim.devices:name=dev-2", "dcim.devices") is None
+        assert self.cache.get("dcim.devices:get:id=2", "dcim.devices")["name"] == "dev-1"
+
+    def test_list_values_in_keys_are_assumed_to_match(self):
+        self.cache.set("dcim.devices:name=['dev-3', 'dev-4']", devices(3, 4), "dcim.devices")
+
+        self.cache.invalidate_matching("dcim.devices", [{"id": 5, "name": "dev-5"}])
+
+        assert self.cache.get("dcim.devices:name=['dev-3', 'dev-4']", "dcim.devices") is None
+        assert self.cache.get("dcim.devices:name=dev-1", "dcim.devices") is not None
+
+    def test_get_entity_returns_none_for_uncached_objects(self):
+        assert self.cache.get_entity("dcim.devices", 1) == devices(1)[0]
+        assert self.cache.get_entity("dcim.devices", 99) is None
+
+
+class TestDiskBackend:
+    """Persistent SQLite tier behind the in-memory caches."""
+
+    def make_disk_cache(self, tmp_path, **cache_options):
+        return make_cache(backend="disk", path=str(tmp_path), **cache_options)
+
+    def test_entries_survive_restart(self, tmp_path):
+        first = self.make_disk_cache(tmp_path)
+        first.set("dcim.devices:site=dc1", devices(1, 2), "dcim.devices")
+
+        restarted = self.make_disk_cache(tmp_path)
+
+        assert restarted.get("dcim.devices:site=dc1", "dcim.devices") == devices(1, 2)
+        assert restarted.get_stats()["l2_hits"] == 1
+        # Promoted into memory: the second read does not touch disk
+        restarted.get("dcim.devices:site=dc1", "dcim.devices")
+        assert restarted.get_stats()["l2_hits"] == 1
+
+    def test_per_type_ttl_is_honoured_on_disk(self, tmp_path):
+        cache = self.make_disk_cache(tmp_path, ttl=CacheTTLConfig(devices=0))
+        cache.set("dcim.devices:site=dc1", devices(1), "dcim.devices")
+
+        assert self.make_disk_cache(tmp_path).get("dcim.devices:site=dc1", "dcim.devices") is None
+
+    def test_invalidation_reaches_disk(self, tmp_path):
+        cache = self.make_disk_cache(tmp_path)
+        cache.set("dcim.devices:site=dc1", devices(1, 2), "dcim.devices")
+        cache.set("dcim.devices:site=dc2", devices(3), "dcim.devices")
+        cache.set("dcim.sites:name=dc1", [{"id": 1}], "dcim.sites")
+
+        cache.invalidate_for_object("dcim.devices", 2)
+        cache.invalidate_pattern("dcim.sites")
+
+        restarted = self.make_disk_cache(tmp_path)
+        assert restarted.get("dcim.devices:site=dc1", "dcim.devices") is None
+        assert restarted.get("dcim.devices:site=dc2", "dcim.devices") == devices(3)
+        assert restarted.get("dcim.sites:name=dc1", "dcim.sites") is None
+
+    def test_read_only_process_shares_but_never_writes(self, tmp_path):
+        writer = self.make_disk_cache(tmp_path)
+        writer.set("dcim.devices:site=dc1", devices(1), "dcim.devices")
+
+        reader = self.make_disk_cache(tmp_path, read_only=True)
+        reader.set("dcim.devices:site=dc9", devices(9), "dcim.devices")
+        reader.invalidate_pattern("dcim.devices")
+
+        assert reader.get_stats()["l2_read_only"] is True
+        assert writer.l2.get("dcim.devices:site=dc1") == devices(1)
+        assert writer.l2.get("dcim.devices:site=dc9") is None
+
+    def test_unusable_path_falls_back_to_memory(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+
+        cache = make_cache(backend="disk", path=str(blocker / "cache"))
+        cache.set("dcim.devices:site=dc1", devices(1), "dcim.devices")
+
+        assert cache.get_stats()["backend"] == "memory"
+        assert cache.get("dcim.devices:site=dc1", "dcim.devices") == devices(1)
+
+
+class TestRedisBackend:
+    """Shared Redis tier with cross-process invalidation."""
+
+    @pytest.fixture(autouse=True)
+    def fake_redis(self, monkeypatch):
+        fakeredis = pytest.importorskip("fakeredis")
+        server = fakeredis.FakeServer()
+        monkeypatch.setattr(
+            "netbox_mcp.cache_backends.Redis.from_url",
+            lambda url: fakeredis.FakeRedis(server=server)
+        )
+        self.replicas = []
+        yield
+        for replica in self.replicas:
+            replica.close()
+
+    def make_replica(self, **cache_options):
+        replica = make_cache(backend="redis", **cache_options)
+        self.replicas.append(replica)
+        return replica
+
+    def wait_for(self, condition, timeout=2.0):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if condition():
+                return True
+            time.sleep(0.01)
+        return False
+
+    def test_replicas_share_lookups(self):
+        api, worker = self.make_replica(), self.make_replica()
+
+        api.set("dcim.manufacturers:slug=cisco", [{"id": 1, "name": "Cisco"}], "dcim.manufacturers")
+
+        assert worker.get("dcim.manufacturers:slug=cisco", "dcim.manufacturers") == [{"id": 1, "name": "Cisco"}]
+        assert worker.get_stats()["l2_hits"] == 1
+
+    def test_object_invalidation_reaches_other_replicas(self):
+        api, worker = self.make_replica(), self.make_replica()
+        api.set("dcim.devices:site=dc1", devices(1, 2), "dcim.devices")
+        assert worker.get("dcim.devices:site=dc1", "dcim.devices") is not None
+
+        api.invalidate_for_object("dcim.devices", 2)
+
+        assert self.wait_for(lambda: worker.get_stats()["remote_invalidations"] == 1)
+        assert worker.get("dcim.devices:site=dc1", "dcim.devices") is None
+
+    def test_pattern_invalidation_reaches_other_replicas(self):
+        api, worker = self.make_replica(), self.make_replica()
+        api.set("dcim.sites:name=dc1", [{"id": 1}], "dcim.sites")
+        worker.get("dcim.sites:name=dc1", "dcim.sites")
+
+        worker.invalidate_pattern("dcim.sites")
+
+        assert self.wait_for(lambda: api.get_stats()["remote_invalidations"] == 1)
+        assert api.get("dcim.sites:name=dc1", "dcim.sites") is None
+        assert worker.get_stats()["remote_invalidations"] == 0
+
+    def test_entity_update_is_pushed_to_other_replicas(self):
+        api, worker = self.make_replica(), self.make_replica()
+        api.set("dcim.devices:site=dc1", devices(1, 2), "dcim.devices")
+        worker.get("dcim.devices:site=dc1", "dcim.devices")
+
+        api.update_entity("dcim.devices", {"id": 2, "name": "renamed"})
+
+        assert self.wait_for(lambda: worker.get_stats()["remote_invalidations"] == 1)
+        assert worker.get("dcim.devices:site=dc1", "dcim.devices")[1]["name"] == "renamed"
+
+    def test_entry_count_does_not_scan_the_keyspace(self, monkeypatch):
+        cache = self.make_replica()
+        cache.set("dcim.devices:site=dc1", devices(1, 2), "dcim.devices")
+        cache.set("dcim.sites:name=dc1", [{"id": 1}], "dcim.sites")
+        cache.invalidate_for_object("dcim.devices", 2)
+
+        def scan(*args, **kwargs):
+            raise AssertionError("keyspace scanned")
+        monkeypatch.setattr(cache.l2.redis_conn, "scan_iter", scan)
+
+        assert cache.get_stats()["l2_entries"] == 1
+
+    def test_unreachable_redis_falls_back_to_memory(self, monkeypatch):
+        def refuse(url):
+            raise ConnectionError("connection refused")
+        monkeypatch.setattr("netbox_mcp.cache_backends.Redis.from_url", refuse)
+
+        cache = self.make_replica()
+        cache.set("dcim.devices:site=dc1", devices(1), "dcim.devices")
+
+        assert cache.get_stats()["backend"] == "memory"
+        assert cache.get("dcim.devices:site=dc1", "dcim.devices") == devices(1)
+
+
+def interfaces(device_id, count=96):
+    return [
+        {"id": device_id * 1000 + port, "name": f"Ethernet1/{port}", "description": "x" * 100}
+        for port in range(count)
+    ]
+
+
+class TestByteBudget:
+    """Entries are accounted and evicted by serialized size."""
+
+    def test_stats_report_serialized_bytes(self):
+        cache = make_cache()
+        cache.set("dcim.manufacturers:slug=cisco", [{"id": 1, "name": "Cisco"}], "dcim.manufacturers")
+
+        assert cache.get_stats()["bytes"] >= len('{"id":1,"name":"Cisco"}')
+
+    def test_budget_evicts_largest_consumer_first(self):
+        cache = make_cache(size_limit_mb=1)
+        cache.set("dcim.manufacturers:slug=cisco", [{"id": 1, "name": "Cisco"}], "dcim.manufacturers")
+
+        for device_id in range(1, 100):
+            cache.set(f"dcim.interfaces:device_id={device_id}", interfaces(device_id), "dcim.interfaces")
+
+        stats = cache.get_stats()
+        assert stats["bytes"] <= stats["size_limit_bytes"]
+        assert stats["evictions"] > 0
+        assert cache.get("dcim.manufacturers:slug=cisco", "dcim.manufacturers") is not None
+        assert cache.get("dcim.interfaces:device_id=99", "dcim.interfaces") is not None
+
+    def test_item_limit_evictions_are_counted(self):
+        cache = make_cache(max_items=8)
+
+        for i in range(10):
+            cache.set(f"ipam.vlans:vid={i}", 42, "ipam.vlans")
+
+        assert cache.get_stats()["evictions"] == 8
+
+    def test_value_larger_than_budget_is_not_cached(self):
+        cache = make_cache(size_limit_mb=0)
+
+        cache.set("dcim.devices:site=dc1", devices(1), "dcim.devices")
+
+        assert cache.get("dcim.devices:site=dc1", "dcim.devices") is None
+        assert "dcim.devices:site=dc1" not in cache._key_refs
+
+
+class TestCompression:
+    """Large values are stored compressed when enabled."""
+
+    def test_large_values_are_compressed_and_round_trip(self):
+        cache = make_cache(compression=True, compression_threshold_bytes=64)
+        plain = make_cache()
+
+        for target in (cache, plain):
+            target.set("dcim.interfaces:device_id=1", interfaces(1), "dcim.interfaces")
+
+        assert cache.get("dcim.interfaces:device_id=1", "dcim.interfaces") == interfaces(1)
+        stats = cache.get_stats()
+        assert stats["compression_ratio"] > 1
+        assert stats["bytes"] < plain.get_stats()["bytes"]
+
+    def test_small_values_stay_uncompressed(self):
+        cache = make_cache(compression=True)
+
+        cache.set("dcim.devices:site=dc1", devices(1), "dcim.devices")
+
+        assert cache.get_stats()["compressed_values"] == 0
+        assert cache.get("dcim.devices:site=dc1", "dcim.devices") == devices(1)
+
+
+def finish_refreshes(cache):
+    if cache._refresh_pool is not None:
+        cache._refresh_pool.shutdown(wait=True)
+        cache._refresh_pool = None
+
+
+class TestStaleWhileRevalidate:
+    """Expired entries are served while one background refresh runs."""
+
+    def setup_method(self):
+        # Entries go stale immediately but stay servable for 30s
+        self.cache = make_cache(ttl=CacheTTLConfig(sites=0), stale_while_revalidate=CacheSWRConfig(sites=30))
+        self.cache.set("dcim.sites:name=dc1", [{"id": 1, "name": "dc1"}], "dcim.sites")
+        self.loads = 0
+
+    def loader(self):
+        self.loads += 1
+        return [{"id": 1, "name": "dc1-renamed"}]
+
+    def test_stale_hit_is_served_and_refreshed_once(self):
+        first = self.cache.get("dcim.sites:name=dc1", "dcim.sites", refresh=self.loader)
+        second = self.cache.get("dcim.sites:name=dc1", "dcim.sites", refresh=self.loader)
+        finish_refreshes(self.cache)
+
+        assert first == second == [{"id": 1, "name": "dc1"}]
+        assert self.loads == 1
+        assert self.cache.get_stats()["stale_hits"] == 2
+        assert self.cache.get_stats()["background_refreshes"] == 1
+
+    def test_refreshed_value_replaces_the_stale_one(self):
+        cache = make_cache(stale_while_revalidate=CacheSWRConfig(sites=30))
+        cache.set("dcim.sites:name=dc1", [{"id": 1, "name": "dc1"}], "dcim.sites")
+        # Went stale a second ago
+        cache._freshness["dcim.sites:name=dc1"] = (time.time() - 300, time.time() - 1)
+
+        cache.get("dcim.sites:name=dc1", "dcim.sites", refresh=self.loader)
+        finish_refreshes(cache)
+
+        assert cache.get("dcim.sites:name=dc1", "dcim.sites") == [{"id": 1, "name": "dc1-renamed"}]
+
+    def test_stale_entry_without_loader_is_a_miss(self):
+        assert self.cache.get("dcim.sites:name=dc1", "dcim.sites") is None
+        assert self.cache.get_stats()["misses"] == 1
+
+    def test_invalidation_during_refresh_discards_the_result(self):
+        def racing_loader():
+            self.cache.invalidate_pattern("dcim.sites")
+            return self.loader()
+
+        self.cache.get("dcim.sites:name=dc1", "dcim.sites", refresh=racing_loader)
+        finish_refreshes(self.cache)
+
+        assert self.cache.get("dcim.sites:name=dc1", "dcim.sites", refresh=self.loader) is None
+
+    def test_failed_refresh_keeps_serving_stale(self):
+        def failing_loader():
+            raise RuntimeError("NetBox down")
+
+        self.cache.get("dcim.sites:name=dc1", "dcim.sites", refresh=failing_loader)
+        finish_refreshes(self.cache)
+
+        assert self.cache.get_stats()["refresh_failures"] == 1
+        assert self.cache.get("dcim.sites:name=dc1", "dcim.sites", refresh=self.loader) == [{"id": 1, "name": "dc1"}]
+
+    def test_hot_keys_are_refreshed_ahead_of_expiry(self):
+        cache = make_cache(refresh_ahead_hits_per_minute=1, refresh_ahead_window=1.0)
+        cache.set("dcim.sites:name=dc1", [{"id": 1, "name": "dc1"}], "dcim.sites")
+
+        assert cache.get("dcim.sites:name=dc1", "dcim.sites", refresh=self.loader) == [{"id": 1, "name": "dc1"}]
+        finish_refreshes(cache)
+
+        assert self.loads == 1
+        assert cache.get_stats()["refresh_ahead"] == 1
+        assert cache.get_stats()["stale_hits"] == 0
+
+    def test_cold_keys_are_not_refreshed_ahead(self):
+        cache = make_cache(refresh_ahead_hits_per_minute=1000, refresh_ahead_window=1.0)
+        cache.set("dcim.sites:name=dc1", [{"id": 1, "name": "dc1"}], "dcim.sites")
+
+        cache.get("dcim.sites:name=dc1", "dcim.sites", refresh=self.loader)
+        finish_refreshes(cache)
+
+        assert self.loads == 0
+
+
+class TestNegativeCache:
+    """"Not found" answers are remembered briefly and dropped by matching writes."""
+
+    def setup_method(self):
+        self.cache = make_cache()
+
+    def test_negative_entry_is_reported(self):
+        self.cache.set_negative("dcim.sites:name=dc9", "dcim.sites", {"name": "dc9"})
+
+        assert self.cache.is_negative("dcim.sites:name=dc9", "dcim.sites")
+        assert not self.cache.is_negative("dcim.sites:name=dc1", "dcim.sites")
+        assert self.cache.get_stats()["negative_hits"] == 1
+        assert self.cache.get_stats()["negative_entries"] == 1
+
+    def test_matching_object_drops_only_matching_entries(self):
+        self.cache.set_negative("dcim.sites:name=dc9", "dcim.sites", {"name": "dc9"})
+        self.cache.set_negative("dcim.sites:slug=dc9", "dcim.sites", {"slug": "dc9"})
+        self.cache.set_negative("dcim.sites:name=dc8", "dcim.sites", {"name": "dc8"})
+
+        dropped = self.cache.invalidate_negative("dcim.sites", {"id": 9, "name": "DC9", "slug": "dc9"})
+
+        assert dropped == 2
+        assert self.cache.is_negative("dcim.sites:name=dc8", "dcim.sites")
+
+    def test_unknown_fields_are_assumed_to_match(self):
+        self.cache.set_negative("dcim.devices:site_id=3", "dcim.devices", {"site_id": 3})
+
+        self.cache.invalidate_negative("dcim.devices", {"id": 1, "name": "sw1", "site": {"id": 3}})
+
+        assert not self.cache.is_negative("dcim.devices:site_id=3", "dcim.devices")
+
+    def test_zero_ttl_disables_negative_caching(self):
+        cache = make_cache(negative_ttl=CacheNegativeTTLConfig(sites=0))
+
+        cache.set_negative("dcim.sites:name=dc9", "dcim.sites", {"name": "dc9"})
+
+        assert not cache.is_negative("dcim.sites:name=dc9", "dcim.sites")
+
+    def test_storing_a_result_replaces_the_negative_entry(self):
+        self.cache.set_negative("dcim.sites:name=dc9", "dcim.sites", {"name": "dc9"})
+        self.cache.set("dcim.sites:name=dc9", [{"id": 9, "name": "dc9"}], "dcim.sites")
+
+        assert not self.cache.is_negative("dcim.sites:name=dc9", "dcim.sites")
+
+    def test_type_invalidation_and_clear_drop_negative_entries(self):
+        self.cache.set_negative("dcim.device-types:model=x", "dcim.device-types", {"model": "x"})
+        self.cache.set_negative("dcim.sites:name=dc9", "dcim.sites", {"name": "dc9"})
+
+        self.cache.invalidate_pattern("dcim.device_types")
+        assert not self.cache.is_negative("dcim.device-types:model=x", "dcim.device-types")
+        assert self.cache.is_negative("dcim.sites:name=dc9", "dcim.sites")
+
+        self.cache.clear()
+        assert not self.cache.is_negative("dcim.sites:name=dc9", "dcim.sites")
+
+
+class TestDeferredInvalidation:
+    """Invalidations inside a deferred block are applied once, on exit."""
+
+    def setup_method(self):
+        self.cache = make_cache()
+        self.cache.set("dcim.interfaces:device_id=1", [{"id": 1}, {"id": 2}], "dcim.interfaces")
+        self.cache.set("dcim.cables:status=connected", [{"id": 5}], "dcim.cables")
+        self.cache.set("dcim.sites:name=dc1", [{"id": 1}], "dcim.sites")
+
+    def test_invalidations_wait_for_the_end_of_the_block(self):
+        with self.cache.deferred_invalidation():
+            assert self.cache.invalidate_for_object("dcim.interfaces", 1) == 0
+            assert self.cache.get("dcim.interfaces:device_id=1", "dcim.interfaces") is not None
+
+        assert self.cache.get("dcim.interfaces:device_id=1", "dcim.interfaces") is None
+        assert self.cache.get("dcim.sites:name=dc1", "dcim.sites") is not None
+
+    def test_repeated_invalidations_are_applied_once(self, monkeypatch):
+        calls = []
+        original = self.cache._invalidate_pattern_local
+        monkeypatch.setattr(self.cache, "_invalidate_pattern_local",
+                            lambda pattern: calls.append(pattern) or original(pattern))
+
+        with self.cache.deferred_invalidation():
+            for cable_id in range(200):
+                self.cache.invalidate_for_object("dcim.interfaces", cable_id)
+                self.cache.invalidate_pattern("dcim.cables")
+                self.cache.invalidate_pattern("dcim.interfaces")
+
+        assert calls == ["dcim.cables", "dcim.interfaces"]
+        assert self.cache.get_stats()["deferred_invalidations"] == 600
+
+    def test_nested_blocks_apply_with_the_outermost(self):
+        with self.cache.deferred_invalidation():
+            with self.cache.deferred_invalidation():
+                self.cache.invalidate_pattern("dcim.cables")
+            assert self.cache.get("dcim.cables:status=connected", "dcim.cables") is not None
+
+        assert self.cache.get("dcim.cables:status=connected", "dcim.cables") is None
+
+    def test_other_threads_are_not_deferred(self):
+        with self.cache.deferred_invalidation():
+            worker = threading.Thread(target=self.cache.invalidate_pattern, args=("dcim.sites",))
+            worker.start()
+            worker.join()
+            assert self.cache.get("dcim.sites:name=dc1", "dcim.sites") is None
+
+    def test_negative_entries_are_dropped_immediately(self):
+        self.cache.set_negative("dcim.sites:name=dc2", "dcim.sites", {"name": "dc2"})
+
+        with self.cache.deferred_invalidation():
+            self.cache.write_through("dcim.sites", {"id": 2, "name": "dc2"})
+            assert not self.cache.is_negative("dcim.sites:name=dc2", "dcim.sites")
+
+    def test_block_applies_even_when_it_raises(self):
+        with pytest.raises(RuntimeError):
+            with self.cache.deferred_invalidation():
+                self.cache.invalidate_pattern("dcim.cables")
+                raise RuntimeError("bulk job failed")
+
+        assert self.cache.get("dcim.cables:status=connected", "dcim.cables") is None
+
+
+class TestImmutableValues:
+    """Cached objects are shared read-only instead of copied on every hit."""
+
+    def setup_method(self):
+        self.cache = make_cache()
+        self.cache.set("dcim.devices:site=dc1", [{"id": 1, "name": "dev-1", "tags": [{"id": 9}]}], "dcim.devices")
+
+    def test_hits_share_one_read_only_copy(self):
+        first = self.cache.get("dcim.devices:site=dc1", "dcim.devices")
+        second = self.cache.get("dcim.devices:site=dc1", "dcim.devices")
+
+        assert first[0] is second[0]
+        with pytest.raises(TypeError):
+            first[0]["name"] = "changed"
+        with pytest.raises(TypeError):
+            first[0]["tags"].append({"id": 10})
+        with pytest.raises(TypeError):
+            first[0].pop("name")
+        assert second[0]["name"] == "dev-1"
+
+    def test_result_lists_belong_to_the_caller(self):
+        result = self.cache.get("dcim.devices:site=dc1", "dcim.devices")
+        result.append({"id": 2})
+
+        assert len(self.cache.get("dcim.devices:site=dc1", "dcim.devices")) == 1
+
+    def test_copies_are_mutable(self):
+        record = self.cache.get("dcim.devices:site=dc1", "dcim.devices")[0]
+        shallow = record.copy()
+        shallow["name"] = "changed"
+        deep = copy.deepcopy(record)
+        deep["tags"].append({"id": 10})
+
+        assert type(shallow) is dict and type(deep["tags"]) is list
+        assert self.cache.get("dcim.devices:site=dc1", "dcim.devices")[0] == {
+            "id": 1, "name": "dev-1", "tags": [{"id": 9}]
+        }
+
+    def test_stored_value_is_not_aliased_to_the_caller(self):
+        value = [{"id": 3, "name": "dev-3"}]
+        self.cache.set("dcim.devices:site=dc3", value, "dcim.devices")
+        value[0]["name"] = "changed"
+
+        assert self.cache.get("dcim.devices:site=dc3", "dcim.devices")[0]["name"] == "dev-3"
+
+    def test_compressed_values_are_read_only_too(self):
+        cache = make_cache(compression=True, compression_threshold_bytes=16)
+        cache.set("dcim.devices:count:site=dc1", {"count": 5, "padding": "x" * 100}, "dcim.devices")
+
+        with pytest.raises(TypeError):
+            cache.get("dcim.devices:count:site=dc1", "dcim.devices")["count"] = 6
@@ -0,0 +1,92 @@
+"""
+Tests for per-endpoint cache policies.
+"""
+
+import pytest
+
+from conftest import make_cache
+from netbox_mcp.cache_policy import CachePolicyRegistry
+from netbox_mcp.config import CacheConfig, CacheEndpointConfig, ConfigurationManager
+
+
+class TestPolicyResolution:
+    """Policies come from overrides, then built-in per-type defaults, then globals."""
+
+    def test_builtin_ttls_apply_to_real_endpoint_names(self):
+        registry = CachePolicyRegistry(CacheConfig())
+
+        assert registry.policy_for("dcim.manufacturers").ttl == 86400
+        assert registry.policy_for("dcim.device-types").ttl == 86400
+        assert registry.policy_for("dcim.devices").ttl == 300
+        assert registry.policy_for("dcim.manufacturers").source == "builtin"
+
+    def test_spellings_resolve_to_one_policy(self):
+        registry = CachePolicyRegistry(CacheConfig())
+
+        assert registry.policy_for("dcim.device_types") is registry.policy_for("dcim.device-types")
+        assert list(registry.policies()) == ["dcim.device-types"]
+
+    def test_unknown_endpoint_uses_defaults(self):
+        policy = CachePolicyRegistry(CacheConfig()).policy_for("circuits.providers")
+
+        assert policy.ttl == CacheConfig().ttl.default
+        assert policy.source == "default"
+
+    def test_endpoint_override_wins(self):
+        config = CacheConfig(endpoints={"dcim.device_types": CacheEndpointConfig(ttl=60, size_limit_mb=1)})
+
+        policy = CachePolicyRegistry(config).policy_for("dcim.device-types")
+
+        assert policy.ttl == 60
+        assert policy.stale_while_revalidate == config.stale_while_revalidate.device_types
+        assert policy.size_limit_bytes == 1024 * 1024
+        assert policy.source == "config"
+
+    def test_yaml_endpoint_section_is_parsed(self):
+        processed = ConfigurationManager._process_nested_config({
+            "cache": {"endpoints": {"ipam.prefixes": {"ttl": 120, "stale_while_revalidate": 15}}}
+        })
+
+        override = processed["cache"].endpoints["ipam.prefixes"]
+        assert override == CacheEndpointConfig(ttl=120, stale_while_revalidate=15)
+
+
+class TestPerEndpointCaches:
+    """Each endpoint gets its own cache, budget and hit statistics."""
+
+    def test_each_endpoint_gets_its_configured_ttl(self):
+        cache = make_cache()
+        cache.set("dcim.manufacturers:name=cisco", [{"id": 1}], "dcim.manufacturers")
+        cache.set("dcim.devices:name=sw1", [{"id": 1}], "dcim.devices")
+
+        assert cache.caches["dcim.manufacturers"].fresh_ttl == 86400
+        assert cache.caches["dcim.devices"].fresh_ttl == 300
+
+    def test_hit_rates_are_reported_per_endpoint(self):
+        cache = make_cache()
+        cache.set("dcim.sites:name=dc1", [{"id": 1}], "dcim.sites")
+        cache.get("dcim.sites:name=dc1", "dcim.sites")
+        cache.get("dcim.sites:name=dc1", "dcim.sites")
+        cache.get("dcim.sites:name=dc2", "dcim.sites")
+        cache.get("ipam.vlans:vid=10", "ipam.vlans")
+
+        endpoints = cache.get_stats()["endpoints"]
+
+        assert endpoints["dcim.sites"]["hits"] == 2
+        assert endpoints["dcim.sites"]["misses"] == 1
+        assert endpoints["dcim.sites"]["hit_ratio_percent"] == pytest.approx(66.67)
+        assert endpoints["ipam.vlans"]["misses"] == 1
+        assert endpoints["dcim.sites"]["ttl"] == 3600
+
+    def test_endpoint_size_budget_evicts_only_that_endpoint(self):
+        cache = make_cache(endpoints={"dcim.devices": CacheEndpointConfig(size_limit_mb=0.001)})
+        cache.set("dcim.sites:name=dc1", [{"id": 1, "name": "dc1"}], "dcim.sites")
+        for i in range(50):
+            cache.set(f"dcim.devices:name=sw{i}", [{"id": i, "name": f"sw{i}", "pad": "x" * 40}], "dcim.devices")
+
+        device_bytes = cache.get_stats()["endpoints"]["dcim.devices"]["bytes"]
+
+        assert device_bytes <= 1024 * 0.001 * 1024
+        assert cache.get("dcim.devices:name=sw49", "dcim.devices") is not None
+        assert cache.get("dcim.devices:name=sw0", "dcim.devices") is None
+        assert cache.get("dcim.sites:name=dc1", "dcim.sites") is not None
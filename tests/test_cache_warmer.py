@@ -0,0 +1,85 @@
+"""
+Tests for background cache warm-up of reference data.
+
+A `responses`-backed fake NetBox serves every reference endpoint so the tests
+can assert that primed lookups are answered without further API calls.
+"""
+
+from conftest import FakeTable, record, serve
+from netbox_mcp.cache_warmer import REFERENCE_SETS, CacheWarmer
+
+
+def reference_tables(failing=()):
+    """A small table for every reference endpoint; paths in ``failing`` answer with errors."""
+    tables = []
+    for app, endpoint, _ in REFERENCE_SETS:
+        path = f"{app}/{endpoint.replace('_', '-')}"
+        rows = [
+            record(path, i, name=f"{endpoint}-{i}", model=f"model-{i}",
+                   slug=f"{endpoint.replace('_', '-')}-{i}", rd=None)
+            for i in range(1, 6)
+        ]
+        tables.append(FakeTable(path, rows, status=500 if path in failing else 200))
+    return tables
+
+
+def api_calls(tables):
+    return sum(len(table.calls) for table in tables)
+
+
+class TestCacheWarmer:
+    """Budgeted parallel prefetch."""
+
+    def test_primed_lookups_need_no_api_calls(self, client):
+        tables = reference_tables()
+        with serve(*tables):
+            status = CacheWarmer(client).warm()
+            calls_after_warmup = api_calls(tables)
+
+            sites = client.dcim.sites.filter(name="sites-3")
+            device_types = client.dcim.device_types.filter(model="model-2")
+            manufacturer = client.dcim.manufacturers.get(4)
+            tags = client.extras.tags.filter()
+
+        assert status["state"] == "completed"
+        assert status["completed_sets"] == len(REFERENCE_SETS)
+        assert [s["id"] for s in sites] == [3]
+        assert [d["id"] for d in device_types] == [2]
+        assert manufacturer["id"] == 4
+        assert len(tags) == 5
+        assert api_calls(tables) == calls_after_warmup == len(REFERENCE_SETS)
+
+    def test_failing_set_does_not_stop_the_others(self, client):
+        with serve(*reference_tables(failing={"extras/tags"})):
+            status = CacheWarmer(client).warm()
+
+        assert status["sets"]["extras.tags"]["state"] == "failed"
+        assert status["sets"]["dcim.sites"]["state"] == "done"
+        assert status["completed_sets"] == len(REFERENCE_SETS) - 1
+
+    def test_time_budget_skips_remaining_sets(self, client):
+        tables = reference_tables()
+        with serve(*tables):
+            status = CacheWarmer(client, time_budget=-1).warm()
+
+        assert status["completed_sets"] == 0
+        assert {s["reason"] for s in status["sets"].values()} == {"time budget exhausted"}
+        assert api_calls(tables) == 0
+
+    def test_size_budget_never_caches_partial_sets(self, client):
+        with serve(*reference_tables()):
+            status = CacheWarmer(client, reference_sets=REFERENCE_SETS[:1], size_budget_mb=0).warm()
+
+        assert status["sets"]["dcim.manufacturers"]["state"] == "skipped"
+        assert client.cache.get("dcim.manufacturers", "dcim.manufacturers") is None
+
+    def test_background_start_reports_progress(self, client):
+        with serve(*reference_tables()):
+            warmer = CacheWarmer(client)
+            warmer.start()
+            assert warmer.wait(timeout=10)
+
+        status = warmer.status()
+        assert status["state"] == "completed"
+        assert status["objects"] == 5 * len(REFERENCE_SETS)
+        assert status["bytes"] > 0
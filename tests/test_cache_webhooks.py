@@ -0,0 +1,183 @@
+"""
+Tests for webhook-driven cache invalidation.
+
+A `responses`-backed fake NetBox serves a device table; webhooks are built
+the way NetBox sends them (API representation in "data", model snapshots in
+"snapshots") and signed with the shared secret.
+"""
+
+import hashlib
+import hmac
+import json
+import time
+
+import pytest
+
+from conftest import NETBOX_URL, FakeTable, record, serve
+from netbox_mcp.cache_webhooks import WebhookReceiver
+from netbox_mcp.exceptions import NetBoxAuthError, NetBoxValidationError
+
+
+SECRET = "webhook-secret"
+
+
+def device(device_id, name, status="active"):
+    return record(
+        "dcim/devices", device_id,
+        name=name,
+        status={"value": status, "label": status.title()},
+        site={"id": 1, "url": f"{NETBOX_URL}/api/dcim/sites/1/", "name": "dc1"},
+    )
+
+
+def webhook(event, data, prechange=None, postchange=None, model="device"):
+    body = json.dumps({
+        "event": event,
+        "model": model,
+        "username": "admin",
+        "data": data,
+        "snapshots": {"prechange": prechange, "postchange": postchange},
+    }).encode()
+    return body, hmac.new(SECRET.encode(), body, hashlib.sha512).hexdigest()
+
+
+@pytest.fixture
+def devices():
+    table = FakeTable("dcim/devices", [device(1, "sw1"), device(2, "sw2")])
+    with serve(table):
+        yield table
+
+
+@pytest.fixture
+def receiver(client):
+    return WebhookReceiver(client, secret=SECRET, debounce=60, max_delay=60)
+
+
+class TestAuthentication:
+    """Only requests signed with the shared secret are accepted."""
+
+    def test_bad_signature_is_rejected(self, receiver):
+        body, _ = webhook("updated", device(1, "sw1"))
+
+        with pytest.raises(NetBoxAuthError):
+            receiver.receive(body, "0" * 128)
+        with pytest.raises(NetBoxAuthError):
+            receiver.receive(body, None)
+
+        assert receiver.status()["rejected"] == 2
+        assert receiver.status()["received"] == 0
+
+    def test_malformed_body_is_a_validation_error(self, receiver):
+        body = b"not json"
+        signature = hmac.new(SECRET.encode(), body, hashlib.sha512).hexdigest()
+
+        with pytest.raises(NetBoxValidationError):
+            receiver.receive(body, signature)
+
+    def test_secret_is_required(self, client):
+        with pytest.raises(NetBoxValidationError):
+            WebhookReceiver(client)
+
+
+class TestApplyingEvents:
+    """Events invalidate or refresh exactly what they touch."""
+
+    def test_update_refreshes_cached_object_without_a_request(self, client, devices, receiver):
+        client.dcim.devices.get(1)
+        updated = device(1, "core-sw1")
+
+        receiver.receive(*webhook("updated", updated, {"name": "sw1"}, {"name": "core-sw1"}))
+        receiver.flush()
+        reads = len(devices.calls)
+
+        assert client.dcim.devices.get(1)["name"] == "core-sw1"
+        assert len(devices.calls) == reads
+        assert receiver.status()["applied"] == 1
+
+    def test_update_drops_only_queries_on_changed_fields(self, client, devices, receiver):
+        client.dcim.devices.filter(status="active")
+        client.dcim.devices.filter(name="sw1")
+        devices.rows[1] = device(1, "sw1", status="offline")
+
+        receiver.receive(*webhook("updated", devices.rows[1], {"status": "active"}, {"status": "offline"}))
+        receiver.flush()
+        reads = len(devices.calls)
+
+        assert client.dcim.devices.filter(name="sw1")[0]["status"] == "offline"
+        assert len(devices.calls) == reads
+        assert [d["id"] for d in client.dcim.devices.filter(status="active")] == [2]
+        assert len(devices.calls) == reads + 1
+
+    def test_delete_drops_the_object_and_counts(self, client, devices, receiver):
+        client.dcim.devices.filter(status="active")
+        client.dcim.devices.count()
+        client.dcim.devices.get(1)
+        deleted = devices.rows.pop(2)
+
+        receiver.receive(*webhook("deleted", deleted))
+        receiver.flush()
+        reads = len(devices.calls)
+
+        client.dcim.devices.get(1)
+        assert len(devices.calls) == reads
+        assert [d["id"] for d in client.dcim.devices.filter(status="active")] == [1]
+        assert len(devices.calls) == reads + 1
+
+    def test_events_for_uncached_models_are_ignored(self, client, devices, receiver):
+        client.dcim.devices.get(1)
+        prefix = {"id": 7, "url": f"{NETBOX_URL}/api/ipam/prefixes/7/", "prefix": "10.0.0.0/24"}
+
+        receiver.receive(*webhook("created", prefix, model="prefix"))
+        receiver.receive(*webhook("created", {"name": "no id"}))
+        receiver.flush()
+
+        status = receiver.status()
+        assert status["received"] == 2
+        assert status["ignored"] == 2
+        assert status["applied"] == 0
+
+
+class TestDebounce:
+    """Bursts are applied once, with one event per object."""
+
+    def test_bulk_import_burst_invalidates_each_endpoint_once(self, client, devices, receiver, monkeypatch):
+        client.dcim.devices.filter(status="active")
+        calls = []
+        original = client.cache.invalidate_queries
+        monkeypatch.setattr(client.cache, "invalidate_queries",
+                            lambda *args, **kwargs: calls.append(args) or original(*args, **kwargs))
+
+        for device_id in range(10, 60):
+            receiver.receive(*webhook("created", device(device_id, f"sw{device_id}")))
+        receiver.flush()
+
+        assert calls == [("dcim.devices", None)]
+        assert receiver.status()["applied"] == 50
+        assert receiver.status()["flushes"] == 1
+
+    def test_repeated_updates_of_one_object_are_coalesced(self, client, devices, receiver):
+        client.dcim.devices.get(1)
+        for name in ("a", "b", "c"):
+            receiver.receive(*webhook("updated", device(1, name), {"name": "x"}, {"name": name}))
+
+        assert receiver.status()["pending"] == 1
+        receiver.flush()
+
+        assert client.dcim.devices.get(1)["name"] == "c"
+        assert receiver.status()["coalesced"] == 2
+        assert receiver.status()["applied"] == 1
+
+    def test_background_thread_applies_burst_after_quiet_period(self, client, devices):
+        receiver = WebhookReceiver(client, secret=SECRET, debounce=0.05, max_delay=5)
+        client.dcim.devices.get(1)
+        receiver.start()
+        try:
+            receiver.receive(*webhook("updated", device(1, "sw1-new"), {"name": "sw1"}, {"name": "sw1-new"}))
+            deadline = time.time() + 5
+            while receiver.status()["applied"] == 0 and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            receiver.stop(timeout=5)
+
+        assert receiver.status()["applied"] == 1
+        assert client.dcim.devices.get(1)["name"] == "sw1-new"
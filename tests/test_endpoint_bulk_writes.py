@@ -0,0 +1,148 @@
+"""
+Tests for writes through EndpointWrapper: bulk create/update/delete through
+NetBox list endpoints and single-request updates and deletes.
+
+A `responses`-backed fake NetBox accepts list POST/PATCH/DELETE on
+/api/dcim/sites/ and PATCH/DELETE on /api/dcim/sites/<id>/ so the tests can
+assert how requests are chunked and how many round trips a write costs.
+"""
+
+import pytest
+
+from conftest import FakeTable, make_config, record, serve
+from netbox_mcp.client import NetBoxClient
+from netbox_mcp.config import SafetyConfig
+from netbox_mcp.exceptions import NetBoxConfirmationError, NetBoxNotFoundError, NetBoxValidationError
+
+
+def make_client(max_batch_size=100, dry_run=False):
+    return NetBoxClient(make_config(safety=SafetyConfig(max_batch_size=max_batch_size, dry_run_mode=dry_run)))
+
+
+@pytest.fixture
+def sites():
+    table = FakeTable("dcim/sites", [record("dcim/sites", i, name=f"dc{i}", slug=f"dc{i}") for i in (1, 2)])
+    with serve(table):
+        yield table
+
+
+class TestBulkCreate:
+
+    def test_items_are_sent_in_chunks_of_max_batch_size(self, sites):
+        client = make_client(max_batch_size=2)
+
+        report = client.dcim.sites.bulk_create([{"name": f"new-{i}"} for i in range(5)], confirm=True)
+
+        assert [len(body) for _, body in sites.writes] == [2, 2, 1]
+        assert report["succeeded"] == 5
+        assert [s["name"] for s in report["results"]] == [f"new-{i}" for i in range(5)]
+
+    def test_failed_chunk_is_reported_and_others_proceed(self, sites):
+        client = make_client(max_batch_size=2)
+
+        report = client.dcim.sites.bulk_create(
+            [{"name": "a"}, {"name": "b"}, {"name": "bad"}, {"name": "c"}, {"name": "d"}], confirm=True
+        )
+
+        assert report["succeeded"] == 3
+        assert report["failed"] == 2
+        assert report["failed_chunks"][0]["start"] == 2
+        assert report["failed_chunks"][0]["count"] == 2
+
+    def test_created_objects_are_cached_and_matching_queries_dropped(self, sites):
+        client = make_client()
+        client.dcim.sites.filter(name="dc1")
+        client.dcim.sites.filter(name="new-1")
+
+        report = client.dcim.sites.bulk_create([{"name": "new-1"}], confirm=True)
+        writes = len(sites.writes)
+
+        assert client.cache.get("dcim.sites:name=dc1", "dcim.sites") is not None
+        assert client.cache.get("dcim.sites:name=new-1", "dcim.sites") is None
+        assert client.dcim.sites.get(report["results"][0]["id"])["name"] == "new-1"
+        assert len(sites.writes) == writes
+
+    def test_requires_confirm_and_honours_dry_run(self, sites):
+        with pytest.raises(NetBoxConfirmationError):
+            make_client().dcim.sites.bulk_create([{"name": "x"}])
+
+        report = make_client(dry_run=True).dcim.sites.bulk_create([{"name": "x"}], confirm=True)
+
+        assert report["dry_run"] is True
+        assert report["results"] == [{"id": "dry-run-generated-id", "name": "x"}]
+        assert sites.writes == []
+
+
+class TestBulkUpdateAndDelete:
+
+    def test_update_sends_one_patch_and_refreshes_cache(self, sites):
+        client = make_client()
+        client.dcim.sites.get(1)
+
+        report = client.dcim.sites.bulk_update(
+            [{"id": 1, "name": "dc1-new"}, {"id": 2, "name": "dc2-new"}], confirm=True
+        )
+
+        assert [method for method, _ in sites.writes] == ["PATCH"]
+        assert report["succeeded"] == 2
+        assert client.dcim.sites.get(1)["name"] == "dc1-new"
+
+    def test_update_items_need_an_id(self, sites):
+        with pytest.raises(NetBoxValidationError):
+            make_client().dcim.sites.bulk_update([{"name": "x"}], confirm=True)
+
+    def test_delete_sends_one_request_per_chunk_and_drops_objects(self, sites):
+        client = make_client(max_batch_size=1)
+        client.dcim.sites.filter(name="dc1")
+
+        report = client.dcim.sites.bulk_delete([1, 2], confirm=True)
+
+        assert [(method, body) for method, body in sites.writes] == [("DELETE", [{"id": 1}]), ("DELETE", [{"id": 2}])]
+        assert report["results"] == [1, 2]
+        assert client.cache.get("dcim.sites:name=dc1", "dcim.sites") is None
+
+    def test_delete_invalidates_all_chunks_at_once(self, sites, monkeypatch):
+        client = make_client(max_batch_size=1)
+        client.dcim.sites.get(1)
+        client.dcim.sites.get(2)
+        passes = []
+        invalidate_local = client.cache._invalidate_object_local
+        monkeypatch.setattr(client.cache, "_invalidate_object_local",
+                            lambda object_type, object_ids: passes.append(list(object_ids))
+                            or invalidate_local(object_type, object_ids))
+
+        client.dcim.sites.bulk_delete([1, 2], confirm=True)
+
+        assert passes == [[1, 2]]
+        assert client.cache.get_entity("dcim.sites", 1) is None
+        assert client.cache.get_entity("dcim.sites", 2) is None
+
+
+class TestSingleWrites:
+
+    def test_update_is_one_patch_of_the_given_fields(self, sites):
+        client = make_client()
+        client.dcim.sites.filter(name="dc1")
+
+        updated = client.dcim.sites.update(1, confirm=True, name="dc1-new")
+
+        assert sites.requests == ["GET", "PATCH"]
+        assert sites.writes == [("PATCH", {"name": "dc1-new"})]
+        assert updated["name"] == "dc1-new"
+        assert client.cache.get("dcim.sites:name=dc1", "dcim.sites") is None
+        assert client.dcim.sites.get(1)["name"] == "dc1-new"
+
+    def test_delete_is_one_request(self, sites):
+        client = make_client()
+
+        assert client.dcim.sites.delete(2, confirm=True) is True
+        assert sites.requests == ["DELETE"]
+        assert 2 not in sites.rows
+
+    def test_missing_object_raises_not_found(self, sites):
+        client = make_client()
+
+        with pytest.raises(NetBoxNotFoundError):
+            client.dcim.sites.update(999, confirm=True, name="x")
+        with pytest.raises(NetBoxNotFoundError):
+            client.dcim.sites.delete(999, confirm=True)
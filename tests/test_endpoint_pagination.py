@@ -0,0 +1,82 @@
+"""
+Tests for streaming pagination and limit push-down in EndpointWrapper.
+
+A `responses`-backed fake NetBox serves a paginated device table so the tests
+can assert exactly which pages were requested.
+"""
+
+import pytest
+
+from conftest import FakeTable, make_client, record, serve
+
+
+@pytest.fixture
+def client():
+    return make_client(default_page_size=10)
+
+
+@pytest.fixture
+def device_table():
+    table = FakeTable("dcim/devices", [record("dcim/devices", i, name=f"dev-{i}") for i in range(1, 96)])
+    with serve(table):
+        yield table
+
+
+class TestIterFilter:
+    """Lazy page-by-page iteration."""
+
+    def test_stops_fetching_when_consumer_stops(self, client, device_table):
+        iterator = client.dcim.devices.iter_filter(status="active")
+
+        first = [next(iterator) for _ in range(12)]
+
+        assert [d["id"] for d in first] == list(range(1, 13))
+        assert len(device_table.calls) == 2
+        assert device_table.calls[1]["offset"] == "10"
+
+    def test_limit_caps_last_request(self, client, device_table):
+        devices = list(client.dcim.devices.iter_filter(limit=15))
+
+        assert len(devices) == 15
+        assert [c["limit"] for c in device_table.calls] == ["10", "5"]
+
+    def test_exhausts_without_trailing_empty_request(self, client, device_table):
+        devices = list(client.dcim.devices.iter_filter(page_size=19))
+
+        assert len(devices) == 95
+        assert len(device_table.calls) == 5
+
+
+class TestFilterPushDown:
+    """filter(limit=, offset=) sends the window to NetBox."""
+
+    def test_limit_fetches_only_requested_records(self, client, device_table):
+        devices = client.dcim.devices.filter(site="dc-1", limit=10)
+
+        assert len(devices) == 10
+        assert device_table.calls == [{"site": "dc-1", "limit": "10", "offset": "0"}]
+
+    def test_offset_window(self, client, device_table):
+        devices = client.dcim.devices.filter(limit=5, offset=40)
+
+        assert [d["id"] for d in devices] == [41, 42, 43, 44, 45]
+
+    def test_window_is_cached_separately(self, client, device_table):
+        client.dcim.devices.filter(limit=5)
+        client.dcim.devices.filter(limit=5)
+        client.dcim.devices.filter(limit=6)
+
+        assert len(device_table.calls) == 2
+
+    def test_window_answered_from_cached_full_result(self, client, device_table):
+        full = client.dcim.devices.filter()
+        calls_after_full = len(device_table.calls)
+
+        window = client.dcim.devices.filter(limit=3, offset=10)
+
+        assert window == full[10:13]
+        assert len(device_table.calls) == calls_after_full
+
+    def test_count_uses_single_request(self, client, device_table):
+        assert client.dcim.devices.count(site="dc-1") == 95
+        assert device_table.calls == [{"site": "dc-1", "limit": "1", "brief": "1"}]
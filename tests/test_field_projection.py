@@ -0,0 +1,83 @@
+"""
+Tests for field projection (fields= / brief / exclude=) through EndpointWrapper.filter().
+
+A `responses`-backed fake NetBox honours ``fields`` and ``brief`` on
+/api/dcim/devices/ so the tests can assert what was requested and cached.
+"""
+
+import pytest
+
+from conftest import FakeTable, record, serve
+from netbox_mcp.tools.dcim.sites import netbox_list_all_sites
+
+
+def device(device_id, name):
+    return record(
+        "dcim/devices", device_id,
+        name=name,
+        status={"value": "active", "label": "Active"},
+        serial=f"SN{device_id}",
+        config_context={"ntp": ["10.0.0.1"]},
+    )
+
+
+@pytest.fixture
+def devices():
+    table = FakeTable("dcim/devices", [device(1, "sw1"), device(2, "sw2")])
+    with serve(table):
+        yield table
+
+
+class TestFieldProjection:
+
+    def test_only_requested_fields_are_fetched_and_id_is_kept(self, client, devices):
+        result = client.dcim.devices.filter(fields=["name", "status"])
+
+        assert devices.calls[-1]["fields"] == "id,name,status"
+        assert [sorted(d) for d in result] == [["id", "name", "status"]] * 2
+
+    def test_each_projection_is_cached_under_its_own_key(self, client, devices):
+        client.dcim.devices.filter(fields="name")
+        client.dcim.devices.filter(fields=["name", "id"])
+        client.dcim.devices.filter(brief=True)
+        full = client.dcim.devices.filter()
+
+        # fields="name" and fields=["name", "id"] are the same projection
+        assert len(devices.calls) == 3
+        assert "serial" in full[0]
+
+    def test_projected_objects_never_replace_full_ones(self, client, devices):
+        assert "serial" in client.dcim.devices.get(1)
+
+        client.dcim.devices.filter(fields=["name"])
+
+        assert "serial" in client.dcim.devices.get(1)
+        assert "serial" in client.dcim.devices.filter()[0]
+
+    def test_refreshing_an_object_drops_projections_containing_it(self, client, devices):
+        client.dcim.devices.filter(fields=["name"])
+        client.dcim.devices.filter(name="sw2", fields=["name"])
+
+        client.cache.update_entity("dcim.devices", device(1, "sw1-new"))
+
+        assert client.cache.get("dcim.devices:fields=id,name", "dcim.devices") is None
+        assert client.cache.get("dcim.devices:fields=id,name:name=sw2", "dcim.devices") is not None
+
+    def test_exclude_is_sent_to_netbox(self, client, devices):
+        result = client.dcim.devices.filter(exclude="config_context")
+
+        assert devices.calls[-1]["exclude"] == "config_context"
+        assert "config_context" not in result[0]
+
+
+def test_site_summary_counts_devices_without_listing_them(client):
+    sites = FakeTable("dcim/sites", [record("dcim/sites", 1, name="dc1", slug="dc1")])
+    devices = FakeTable("dcim/devices", [record("dcim/devices", i, name=f"sw{i}", site={"id": 1}) for i in (1, 2, 3)])
+    racks = FakeTable("dcim/racks", [record("dcim/racks", i, name=f"r{i}", site={"id": 1}, u_height=42) for i in (1, 2)])
+    with serve(sites, devices, racks):
+        summary = netbox_list_all_sites(client=client)
+
+    assert summary["sites"][0]["device_count"] == 3
+    assert summary["sites"][0]["rack_count"] == 2
+    assert summary["sites"][0]["total_rack_units"] == 84
+    assert devices.calls == [{"site_id": "1", "limit": "1", "brief": "1"}]
@@ -0,0 +1,56 @@
+"""
+Tests for negative caching of not-found lookups in EndpointWrapper.
+
+A `responses`-backed fake NetBox serves a small site table and accepts
+creates, so the tests can count how often misses reach the API.
+"""
+
+import pytest
+
+from conftest import FakeTable, record, serve
+
+
+@pytest.fixture
+def sites():
+    table = FakeTable("dcim/sites", [record("dcim/sites", 1, name="dc1", slug="dc1")])
+    with serve(table):
+        yield table
+
+
+def resolve_site(client, value):
+    """The name-then-slug lookup tools use."""
+    return client.dcim.sites.filter(name=value) or client.dcim.sites.filter(slug=value)
+
+
+class TestNegativeCache:
+    """Repeated misses are answered locally until a matching object appears."""
+
+    def test_repeated_name_then_slug_miss_costs_one_round_of_requests(self, client, sites):
+        assert resolve_site(client, "dc-typo") == []
+        assert resolve_site(client, "dc-typo") == []
+        assert resolve_site(client, "dc-typo") == []
+
+        assert len(sites.calls) == 2
+        assert client.cache.get_stats()["negative_hits"] == 4
+
+    def test_get_of_missing_id_is_cached(self, client, sites):
+        assert client.dcim.sites.get(42) is None
+        assert client.dcim.sites.get(42) is None
+
+        assert len(sites.calls) == 1
+
+    def test_create_makes_the_lookup_hit_again(self, client, sites):
+        assert resolve_site(client, "dc2") == []
+
+        client.dcim.sites.create(confirm=True, name="dc2", slug="dc2")
+
+        assert [s["id"] for s in resolve_site(client, "dc2")] == [2]
+
+    def test_create_keeps_unrelated_negative_entries(self, client, sites):
+        resolve_site(client, "dc-typo")
+        reads_after_miss = len(sites.calls)
+
+        client.cache.invalidate_negative("dcim.sites", {"id": 2, "name": "dc2", "slug": "dc2"})
+
+        assert resolve_site(client, "dc-typo") == []
+        assert len(sites.calls) == reads_after_miss
@@ -0,0 +1,103 @@
+"""
+Tests for count-first paged fetching of large listings.
+
+A `responses`-backed fake NetBox serves a paginated device table with a
+per-request delay and a MAX_PAGE_SIZE, and records how many page requests
+were in flight at once.
+"""
+
+import pytest
+
+from conftest import FakeTable, make_config, record, serve
+from netbox_mcp.client import NetBoxClient
+from netbox_mcp.config import FetchConfig
+from netbox_mcp.paged_fetch import plan_pages
+
+
+class FakeDeviceTable(FakeTable):
+    """Paginated /api/dcim/devices/ that answers later pages faster than earlier ones."""
+
+    def __init__(self, total, max_page_size=1000, delay=0.0):
+        devices = [record("dcim/devices", i, name=f"dev-{i}") for i in range(1, total + 1)]
+        super().__init__("dcim/devices", devices, max_page_size=max_page_size, delay=delay)
+
+    def latency(self, params):
+        offset = int(params.get("offset", 0))
+        return self.delay * (1 - offset / len(self.rows)) if offset else 0.0
+
+    @property
+    def pages(self):
+        """(limit, offset) of each page request, in the order they arrived."""
+        return [(int(call["limit"]), int(call["offset"])) for call in self.calls]
+
+
+def make_client(**fetch):
+    return NetBoxClient(make_config(fetch=FetchConfig(**fetch)))
+
+
+def by_offset(pages):
+    return sorted(pages, key=lambda page: page[1])
+
+
+def test_plan_pages_covers_range_with_short_last_page():
+    assert plan_pages(10, 35, 10) == [(10, 10), (10, 20), (5, 30)]
+    assert plan_pages(10, 10, 10) == []
+
+
+class TestPagedFetch:
+
+    def test_full_listing_fetches_remaining_pages_concurrently_in_order(self):
+        table = FakeDeviceTable(95, delay=0.05)
+        with serve(table):
+            devices = make_client(page_size=10, max_workers=4).dcim.devices.filter()
+
+        assert [d["id"] for d in devices] == list(range(1, 96))
+        assert table.pages[0] == (10, 0)
+        assert by_offset(table.pages[1:]) == [(10, offset) for offset in range(10, 90, 10)] + [(5, 90)]
+        assert table.max_in_flight > 1
+
+    def test_server_capped_page_size_is_used_for_planning(self):
+        table = FakeDeviceTable(95, max_page_size=20)
+        with serve(table):
+            devices = make_client(page_size=50).dcim.devices.all()
+
+        assert [d["id"] for d in devices] == list(range(1, 96))
+        assert by_offset(table.pages) == [(50, 0), (20, 20), (20, 40), (20, 60), (15, 80)]
+
+    def test_window_is_planned_from_offset_and_limit(self):
+        table = FakeDeviceTable(95)
+        with serve(table):
+            devices = make_client(page_size=10).dcim.devices.filter(limit=25, offset=5)
+
+        assert [d["id"] for d in devices] == list(range(6, 31))
+        assert by_offset(table.pages) == [(10, 5), (10, 15), (5, 25)]
+
+    def test_window_past_the_end_stops_at_count(self):
+        table = FakeDeviceTable(95)
+        with serve(table):
+            devices = make_client(page_size=10).dcim.devices.filter(limit=50, offset=80)
+
+        assert [d["id"] for d in devices] == list(range(81, 96))
+        assert table.pages == [(10, 80), (5, 90)]
+
+    def test_per_endpoint_workers_override_default(self):
+        table = FakeDeviceTable(95, delay=0.02)
+        client = make_client(page_size=10, max_workers=8, endpoint_workers={"dcim.devices": 1})
+        with serve(table):
+            client.dcim.devices.filter()
+
+        assert client.fetch_workers("dcim.devices") == 1
+        assert client.fetch_workers("ipam.ip_addresses") == 8
+        assert table.max_in_flight == 1
+        assert table.pages == [(10, offset) for offset in range(0, 90, 10)] + [(5, 90)]
+
+
+@pytest.mark.slow
+def test_full_table_scan_overlaps_pages_and_keeps_api_order():
+    table = FakeDeviceTable(2_000, delay=0.05)
+    with serve(table):
+        devices = make_client(page_size=100, max_workers=4).dcim.devices.filter()
+
+    assert table.max_in_flight > 1
+    assert [d["id"] for d in devices] == list(range(1, 2_001))
+    assert by_offset(table.pages) == [(100, offset) for offset in range(0, 2_000, 100)]
@@ -0,0 +1,117 @@
+"""
+Tests for answering narrower filters from cached broader results.
+
+A `responses`-backed fake NetBox serves a device table with nested site,
+role and status objects, so the tests can count the requests that reach it.
+"""
+
+import pytest
+
+from conftest import FakeTable, record, serve
+from netbox_mcp.cache_subsumption import Unevaluable, compile_filter, superset_candidates
+
+
+def device(device_id, site, status="active", role="leaf"):
+    site_id = int(site[-1])
+    return record(
+        "dcim/devices", device_id,
+        name=f"sw{device_id}",
+        site={"id": site_id, "name": site.upper(), "slug": site},
+        role={"id": 1, "name": role.title(), "slug": role},
+        status={"value": status, "label": status.title()},
+        tags=[],
+    )
+
+
+@pytest.fixture
+def devices():
+    table = FakeTable("dcim/devices", [
+        device(1, "dc1"), device(2, "dc1", status="planned"), device(3, "dc1", role="spine"),
+        device(4, "dc2"), device(5, "dc2", status="offline"),
+    ])
+    with serve(table):
+        yield table
+
+
+class TestLocalPredicates:
+    """Only predicates with exactly reproducible NetBox semantics compile."""
+
+    def test_nested_objects_match_by_slug_value_or_id(self):
+        record = device(1, "dc1")
+
+        assert compile_filter({"site": "dc1", "status": "active", "site_id": 1})(record)
+        assert not compile_filter({"status": "planned"})(record)
+
+    def test_serialized_related_objects_match_only_by_id(self):
+        record = {"id": 1, "name": "sw1", "site": 1, "status": "active", "vid": 10}
+
+        assert compile_filter({"site_id": 1, "status": "active", "id": 1})(record)
+        with pytest.raises(Unevaluable):
+            compile_filter({"site": "dc1"})(record)
+        with pytest.raises(Unevaluable):
+            compile_filter({"vid": 10})(record)
+
+    def test_lists_and_in_lookups_match_any_value(self):
+        record = device(1, "dc1")
+
+        assert compile_filter({"status": ["planned", "active"]})(record)
+        assert compile_filter({"name__in": "sw9,sw1"})(record)
+
+    def test_unsupported_parameters_do_not_compile(self):
+        assert compile_filter({"q": "sw"}) is None
+        assert compile_filter({"name__ic": "sw"}) is None
+        assert compile_filter({"cf_owner": "ops"}) is None
+
+    def test_fields_without_usable_data_are_unevaluable(self):
+        with pytest.raises(Unevaluable):
+            compile_filter({"tag": "core"})(device(1, "dc1"))
+        with pytest.raises(Unevaluable):
+            compile_filter({"tags": "core"})(device(1, "dc1"))
+
+    def test_narrowest_supersets_are_tried_first(self):
+        candidates = list(superset_candidates({"site": "dc1", "status": "active"}))
+
+        assert candidates == [{"site": "dc1"}, {"status": "active"}, {}]
+
+
+class TestFilterSubsumption:
+    """EndpointWrapper.filter() answers narrower filters from cache."""
+
+    def test_narrower_filter_is_answered_locally(self, client, devices):
+        client.dcim.devices.filter(site="dc1")
+
+        active = client.dcim.devices.filter(site="dc1", status="active")
+        spines = client.dcim.devices.filter(site_id=1, role="spine")
+
+        assert [d["id"] for d in active] == [1, 3]
+        assert [d["id"] for d in spines] == [3]
+        # site=dc1 only; role is serialized as an ID, so role=spine goes to NetBox
+        assert len(devices.calls) == 2
+        assert client.cache.get_stats()["subsumption_hits"] == 1
+
+    def test_full_listing_answers_any_evaluable_filter(self, client, devices):
+        client.dcim.devices.filter()
+
+        assert [d["id"] for d in client.dcim.devices.filter(site_id=2, status="offline")] == [5]
+        assert [d["id"] for d in client.dcim.devices.filter(name="sw2", limit=1)] == [2]
+        assert len(devices.calls) == 1
+
+    def test_unevaluable_filter_falls_back_to_api(self, client, devices):
+        client.dcim.devices.filter()
+
+        client.dcim.devices.filter(q="sw1")
+
+        assert len(devices.calls) == 2
+
+    def test_empty_superset_answers_with_empty_result(self, client, devices):
+        assert client.dcim.devices.filter(site="dc9") == []
+
+        assert client.dcim.devices.filter(site="dc9", status="active") == []
+        assert len(devices.calls) == 1
+
+    def test_windowed_results_are_never_used_as_supersets(self, client, devices):
+        client.dcim.devices.filter(site="dc1", limit=1)
+
+        client.dcim.devices.filter(site="dc1", status="active")
+
+        assert len(devices.calls) == 2
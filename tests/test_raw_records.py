@@ -0,0 +1,162 @@
+"""
+Tests for raw-JSON reads that bypass pynetbox Record construction.
+
+The serializer must produce exactly what ``Record.serialize()`` produces, so
+every test compares against pynetbox itself.
+"""
+
+import json
+import time
+
+import pynetbox
+import pytest
+
+from conftest import NETBOX_URL, FakeTable, make_config, serve
+from netbox_mcp.client import NetBoxClient
+from netbox_mcp.raw_records import RawEndpoint, loads
+
+
+def nested(endpoint, obj_id, **fields):
+    return {"id": obj_id, "url": f"{NETBOX_URL}/api/{endpoint}/{obj_id}/", "display": f"obj-{obj_id}", **fields}
+
+
+def device(device_id):
+    return {
+        "id": device_id,
+        "url": f"{NETBOX_URL}/api/dcim/devices/{device_id}/",
+        "display": f"sw-{device_id}",
+        "name": f"sw-{device_id}",
+        "device_type": nested("dcim/device-types", 3, model="EX4300", manufacturer=nested("dcim/manufacturers", 1)),
+        "role": nested("dcim/device-roles", 2, name="Access"),
+        "tenant": None,
+        "platform": nested("dcim/platforms", 4),
+        "serial": "",
+        "site": nested("dcim/sites", 5, slug="dc1"),
+        "rack": nested("dcim/racks", 6),
+        "position": 12.0,
+        "face": {"value": "front", "label": "Front"},
+        "status": {"value": "active", "label": "Active"},
+        "airflow": None,
+        "primary_ip4": nested("ipam/ip-addresses", 7, family=4, address="10.0.0.7/24"),
+        "primary_ip": nested("ipam/ip-addresses", 7, family=4, address="10.0.0.7/24"),
+        "config_context": {"ntp": ["10.0.0.1"], "snmp": {"community": "x"}},
+        "local_context_data": None,
+        "tags": [nested("extras/tags", 1, slug="a"), nested("extras/tags", 2, slug="b"), nested("extras/tags", 1, slug="a")],
+        "custom_fields": {"owner": nested("tenancy/contacts", 9), "ticket": "CHG-1", "links": [nested("dcim/sites", 5)]},
+        "created": "2024-01-01T00:00:00Z",
+        "interface_count": 48,
+    }
+
+
+INTERFACE = {
+    "id": 11,
+    "url": f"{NETBOX_URL}/api/dcim/interfaces/11/",
+    "device": nested("dcim/devices", 1),
+    "name": "ge-0/0/1",
+    "type": {"value": "1000base-t", "label": "1000BASE-T (1GE)"},
+    "mode": {"value": "tagged", "label": "Tagged"},
+    "tagged_vlans": [nested("ipam/vlans", 20, vid=20), nested("ipam/vlans", 20, vid=20), nested("ipam/vlans", 30, vid=30)],
+    "link_peers": [nested("dcim/interfaces", 12)],
+    "link_peers_type": "dcim.interface",
+    "_occupied": True,
+    "tags": [],
+    "custom_fields": {},
+}
+
+CABLE = {
+    "id": 21,
+    "url": f"{NETBOX_URL}/api/dcim/cables/21/",
+    "a_terminations": [{"object_type": "dcim.interface", "object_id": 11, "object": nested("dcim/interfaces", 11)}],
+    "b_terminations": [{"object_type": "dcim.interface", "object_id": 12, "object": nested("dcim/interfaces", 12)}],
+    "status": {"value": "connected", "label": "Connected"},
+    "tags": [],
+    "custom_fields": {},
+}
+
+
+@pytest.fixture
+def api():
+    return pynetbox.api(NETBOX_URL, token="test-token")
+
+
+@pytest.mark.parametrize("endpoint_path, data", [
+    ("dcim.devices", device(1)),
+    ("dcim.interfaces", INTERFACE),
+    ("dcim.cables", CABLE),
+])
+def test_serialization_matches_pynetbox(api, endpoint_path, data):
+    app, name = endpoint_path.split(".")
+    endpoint = getattr(getattr(api, app), name)
+
+    expected = endpoint.return_obj(json.loads(json.dumps(data)), api, endpoint).serialize()
+
+    assert RawEndpoint(endpoint).serialize(json.loads(json.dumps(data))) == expected
+
+
+def test_generic_relation_lists_fall_back_to_pynetbox(api):
+    raw = RawEndpoint(api.dcim.cables)
+
+    raw.serialize(CABLE)
+    raw.serialize(INTERFACE)
+
+    assert raw.fallbacks == 1
+
+
+@pytest.fixture
+def devices():
+    table = FakeTable("dcim/devices", [device(i) for i in range(1, 6)], page_size=2, max_page_size=2)
+    with serve(table):
+        yield table
+
+
+def make_client(raw):
+    return NetBoxClient(make_config(raw_json_reads=raw))
+
+
+class TestRawReads:
+
+    def test_reads_return_the_same_objects_as_pynetbox(self, devices):
+        raw, records = make_client(True), make_client(False)
+
+        assert raw.dcim.devices._raw is not None
+        assert raw.dcim.devices.filter(limit=2, offset=1) == records.dcim.devices.filter(limit=2, offset=1)
+        assert raw.dcim.devices.filter(name="sw-3") == records.dcim.devices.filter(name="sw-3")
+        assert raw.dcim.devices.filter() == records.dcim.devices.filter()
+        assert raw.dcim.devices.all() == records.dcim.devices.all()
+        assert raw.dcim.devices.get(4) == records.dcim.devices.get(4)
+
+    def test_results_are_read_only_and_missing_objects_are_none(self, devices):
+        client = make_client(True)
+
+        result = client.dcim.devices.filter(name="sw-1")
+        with pytest.raises(TypeError):
+            result[0]["name"] = "x"
+        assert client.dcim.devices.get(999) is None
+
+
+@pytest.mark.slow
+def test_raw_reads_cut_cpu_per_10k_devices(api, record_property):
+    endpoint = api.dcim.devices
+    raw = RawEndpoint(endpoint)
+    # 10k devices as NetBox returns them: 10 pages of 1000
+    pages = [
+        json.dumps({"count": 10_000, "results": [device(page * 1_000 + i) for i in range(1_000)]}).encode()
+        for page in range(10)
+    ]
+
+    def cpu(read) -> float:
+        start = time.process_time()
+        for body in pages:
+            read(body)
+        return time.process_time() - start
+
+    records = cpu(lambda body: [
+        endpoint.return_obj(data, api, endpoint).serialize() for data in json.loads(body)["results"]
+    ])
+    direct = cpu(lambda body: raw.serialize_all(loads(body)["results"]))
+
+    record_property("records_cpu_ms_per_10k", round(records * 1e3))
+    record_property("raw_cpu_ms_per_10k", round(direct * 1e3))
+
+    assert raw.fallbacks == 0
+    assert direct * 3 < records
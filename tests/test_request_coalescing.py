@@ -0,0 +1,71 @@
+"""
+Tests for single-flight coalescing of concurrent identical reads.
+
+A `responses`-backed fake NetBox holds every request until the test releases
+it, so the tests can line up concurrent callers behind one in-flight read.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from conftest import NETBOX_URL, FakeTable, record, serve
+
+
+def gated_sites(status=200):
+    """/api/dcim/sites/ that holds every request until released."""
+    return FakeTable("dcim/sites", [record("dcim/sites", 1, name="dc1")], gated=True, status=status)
+
+
+def run_concurrently(client, sites, call, callers=8):
+    """Start ``callers`` identical reads and release NetBox once all of them are waiting."""
+    with serve(sites):
+        with ThreadPoolExecutor(max_workers=callers) as pool:
+            futures = [pool.submit(call) for _ in range(callers)]
+            deadline = time.time() + 10
+            while client.cache.stats["coalesced_calls"] < callers - 1 and time.time() < deadline:
+                time.sleep(0.01)
+            sites.release.set()
+            return [future.exception() or future.result() for future in futures]
+
+
+class TestSingleFlight:
+    """Concurrent identical misses share one upstream request."""
+
+    def test_concurrent_filters_share_one_request(self, client):
+        sites = gated_sites()
+
+        results = run_concurrently(client, sites, lambda: client.dcim.sites.filter(name="dc1"))
+
+        assert len(sites.calls) == 1
+        assert all(result == [{"id": 1, "url": f"{NETBOX_URL}/api/dcim/sites/1/", "name": "dc1"}]
+                   for result in results)
+        assert client.cache.get_stats()["coalesced_calls"] == 7
+        assert client.cache.get_stats()["in_flight"] == 0
+
+    def test_concurrent_gets_share_one_request(self, client):
+        sites = gated_sites()
+
+        results = run_concurrently(client, sites, lambda: client.dcim.sites.get(1))
+
+        assert len(sites.calls) == 1
+        assert {result["id"] for result in results} == {1}
+
+    def test_error_is_shared_and_not_cached(self, client):
+        sites = gated_sites(status=500)
+
+        results = run_concurrently(client, sites, lambda: client.dcim.sites.filter(name="dc1"))
+
+        assert len(sites.calls) == 1
+        assert all(isinstance(result, Exception) for result in results)
+        assert client.cache.get_stats()["in_flight"] == 0
+
+    def test_cache_bypass_is_never_coalesced(self, client):
+        sites = gated_sites()
+        sites.release.set()
+
+        with serve(sites):
+            client.dcim.sites.filter(name="dc1", no_cache=True)
+            client.dcim.sites.filter(name="dc1", no_cache=True)
+
+        assert len(sites.calls) == 2
+        assert client.cache.get_stats()["coalesced_calls"] == 0
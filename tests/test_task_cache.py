@@ -0,0 +1,33 @@
+"""
+Tests for the cache settings handed from the enqueueing application to RQ workers.
+"""
+
+from conftest import NETBOX_URL, make_config
+from netbox_mcp.config import CacheConfig
+from netbox_mcp.tasks import configure_task_cache, task_cache_settings
+
+
+def worker_config(task_config):
+    netbox_config = make_config()
+    configure_task_cache(netbox_config, task_config)
+    return netbox_config.cache
+
+
+class TestTaskCache:
+
+    def test_redis_tier_of_the_submitting_app_is_shared(self):
+        app_cache = CacheConfig(backend="redis", redis_url="redis://cache:6379/1", redis_prefix="nb:")
+
+        cache = worker_config(task_cache_settings(app_cache))
+
+        assert cache.enabled
+        assert cache.backend == "redis"
+        assert cache.redis_url == "redis://cache:6379/1"
+        assert cache.redis_prefix == "nb:"
+
+    def test_process_local_backends_disable_the_worker_cache(self):
+        for app_cache in (CacheConfig(), CacheConfig(backend="disk"), CacheConfig(backend="redis", enabled=False)):
+            assert not worker_config(task_cache_settings(app_cache)).enabled
+
+    def test_tasks_without_cache_settings_run_uncached(self):
+        assert not worker_config({"netbox_url": NETBOX_URL, "netbox_token": "test-token"}).enabled
@@ -0,0 +1,112 @@
+"""
+Tests for coalescing single creates into list POSTs.
+
+A `responses`-backed fake NetBox accepts single and list POSTs on
+/api/dcim/sites/ so the tests can assert how creates were sent.
+"""
+
+import threading
+
+import pytest
+
+from conftest import FakeTable, make_config, serve
+from netbox_mcp.client import NetBoxClient
+from netbox_mcp.config import SafetyConfig
+from netbox_mcp.exceptions import NetBoxConnectionError, NetBoxError
+
+
+def make_client(endpoints=("dcim.sites",), window_ms=50, max_items=50, dry_run=False, write_timeout=30):
+    safety = SafetyConfig(
+        write_batch_endpoints=list(endpoints),
+        write_batch_window_ms=window_ms,
+        write_batch_max_items=max_items,
+        dry_run_mode=dry_run,
+        write_timeout=write_timeout,
+    )
+    return NetBoxClient(make_config(safety=safety))
+
+
+def posted_names(table):
+    """Names sent by each POST, in order."""
+    return [[item["name"] for item in (body if isinstance(body, list) else [body])] for _, body in table.writes]
+
+
+@pytest.fixture
+def sites():
+    table = FakeTable("dcim/sites", next_id=101)
+    with serve(table):
+        yield table
+
+
+def create_concurrently(client, names):
+    results = {}
+
+    def create(name):
+        try:
+            results[name] = client.dcim.sites.create(confirm=True, name=name)
+        except NetBoxError as e:
+            results[name] = e
+
+    threads = [threading.Thread(target=create, args=(name,)) for name in names]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestWriteBatcher:
+
+    def test_concurrent_creates_share_one_list_post(self, sites):
+        client = make_client()
+
+        results = create_concurrently(client, ["a", "b", "c", "d"])
+
+        assert len(posted_names(sites)) == 1
+        assert sorted(posted_names(sites)[0]) == ["a", "b", "c", "d"]
+        assert {name: result["name"] for name, result in results.items()} == {n: n for n in "abcd"}
+        assert client.write_batchers["dcim.sites"].status()["created"] == 4
+
+    def test_submitted_creates_are_sent_when_max_items_are_waiting(self, sites):
+        client = make_client(window_ms=60000, max_items=3)
+
+        futures = [client.dcim.sites.submit_create(confirm=True, name=f"s{i}") for i in range(3)]
+
+        assert [future.result(timeout=1)["name"] for future in futures] == ["s0", "s1", "s2"]
+        assert posted_names(sites) == [["s0", "s1", "s2"]]
+
+    def test_rejected_list_is_retried_one_by_one(self, sites):
+        client = make_client(window_ms=60000, max_items=3)
+
+        futures = [client.dcim.sites.submit_create(confirm=True, name=name) for name in ("a", "bad", "b")]
+
+        assert futures[0].result(timeout=1)["name"] == "a"
+        assert futures[2].result(timeout=1)["name"] == "b"
+        with pytest.raises(NetBoxError):
+            futures[1].result(timeout=1)
+        assert posted_names(sites) == [["a", "bad", "b"], ["a"], ["bad"], ["b"]]
+
+    def test_created_objects_are_written_through(self, sites):
+        client = make_client(window_ms=1)
+
+        created = client.dcim.sites.create(confirm=True, name="a")
+
+        assert client.dcim.sites.get(created["id"])["name"] == "a"
+        assert len(posted_names(sites)) == 1
+
+    def test_other_endpoints_and_dry_run_are_not_batched(self, sites):
+        assert make_client(endpoints=()).dcim.sites.create(confirm=True, name="a")["name"] == "a"
+        assert posted_names(sites) == [["a"]]
+
+        client = make_client(dry_run=True)
+        assert client.dcim.sites.create(confirm=True, name="x")["id"] == "dry-run-generated-id"
+        assert client.write_batchers == {}
+        assert posted_names(sites) == [["a"]]
+
+    def test_slow_batch_raises_a_netbox_error_naming_the_type(self, sites):
+        client = make_client(window_ms=5000, write_timeout=0.1)
+
+        with pytest.raises(NetBoxConnectionError, match="dcim.sites"):
+            client.dcim.sites.create(confirm=True, name="a")
+        client.write_batchers["dcim.sites"].flush()
+        assert posted_names(sites) == [["a"]]